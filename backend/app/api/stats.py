@@ -1,13 +1,13 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database import get_db
-from .. import crud, schemas
+from ..database import get_async_db_leitura
+from .. import crud_async, schemas
 
 router = APIRouter(prefix="/stats", tags=["estatisticas"])
 
 
 @router.get("/", response_model=schemas.StatsResponse)
-def obter_estatisticas(db: Session = Depends(get_db)):
+async def obter_estatisticas(db: AsyncSession = Depends(get_async_db_leitura)):
     """Retorna estatísticas gerais das vagas."""
-    return crud.get_stats(db)
+    return await crud_async.get_stats(db)
@@ -1,15 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
-from ..database import get_db
-from .. import crud, schemas
+from ..database import get_async_db, get_async_db_leitura
+from .. import crud_async, schemas
 
 router = APIRouter(prefix="/vagas", tags=["vagas"])
 
 
 @router.get("/", response_model=schemas.VagaListResponse)
-def listar_vagas(
+async def listar_vagas(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
     fonte: Optional[str] = None,
@@ -17,77 +18,91 @@ def listar_vagas(
     modalidade: Optional[str] = None,
     tipo_vaga: Optional[str] = None,
     requisito_ingles: Optional[str] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="next_cursor da página anterior (ignora skip)"),
+    include_total: bool = Query(True, description="Se false, não calcula o total (evita o COUNT)"),
+    q: Optional[str] = Query(None, max_length=200, description="Busca em título, empresa e observações"),
+    db: AsyncSession = Depends(get_async_db_leitura),
 ):
-    """Lista todas as vagas com filtros opcionais."""
-    vagas, total = crud.get_vagas(
-        db,
-        skip=skip,
-        limit=limit,
-        fonte=fonte,
-        status=status,
-        modalidade=modalidade,
-        tipo_vaga=tipo_vaga,
-        requisito_ingles=requisito_ingles,
-    )
-    return {"total": total, "vagas": vagas}
+    """Lista todas as vagas com filtros opcionais e busca textual (ordenada por relevância)."""
+    try:
+        vagas, total, next_cursor = await crud_async.get_vagas(
+            db,
+            skip=skip,
+            limit=limit,
+            fonte=fonte,
+            status=status,
+            modalidade=modalidade,
+            tipo_vaga=tipo_vaga,
+            requisito_ingles=requisito_ingles,
+            cursor=cursor,
+            include_total=include_total,
+            q=q,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"total": total, "vagas": vagas, "next_cursor": next_cursor}
 
 
 @router.get("/{vaga_id}", response_model=schemas.VagaResponse)
-def obter_vaga(vaga_id: int, db: Session = Depends(get_db)):
+async def obter_vaga(vaga_id: int, db: AsyncSession = Depends(get_async_db_leitura)):
     """Obtém uma vaga específica por ID."""
-    vaga = crud.get_vaga(db, vaga_id)
+    vaga = await crud_async.get_vaga(db, vaga_id)
     if not vaga:
         raise HTTPException(status_code=404, detail="Vaga não encontrada")
     return vaga
 
 
 @router.post("/", response_model=schemas.VagaResponse, status_code=201)
-def criar_vaga(vaga: schemas.VagaCreate, db: Session = Depends(get_db)):
+async def criar_vaga(vaga: schemas.VagaCreate, db: AsyncSession = Depends(get_async_db)):
     """Cria uma nova vaga."""
-    if crud.check_duplicate(db, vaga.titulo, vaga.empresa, vaga.link_vaga):
+    if await crud_async.check_duplicate(db, vaga.titulo, vaga.empresa, vaga.link_vaga):
+        raise HTTPException(status_code=400, detail="Vaga duplicada já existe")
+    try:
+        return await crud_async.create_vaga(db, vaga)
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(status_code=400, detail="Vaga duplicada já existe")
-    return crud.create_vaga(db, vaga)
 
 
 @router.post("/batch", response_model=list[schemas.VagaResponse], status_code=201)
-def criar_vagas_batch(vagas: list[schemas.VagaCreate], db: Session = Depends(get_db)):
+async def criar_vagas_batch(vagas: list[schemas.VagaCreate], db: AsyncSession = Depends(get_async_db)):
     """Cria múltiplas vagas de uma vez (para importação)."""
-    vagas_novas = []
-    for vaga in vagas:
-        if not crud.check_duplicate(db, vaga.titulo, vaga.empresa, vaga.link_vaga):
-            vagas_novas.append(vaga)
+    vagas_novas = await crud_async.filtrar_duplicatas(db, vagas)
 
     if not vagas_novas:
         raise HTTPException(status_code=400, detail="Todas as vagas já existem")
 
-    return crud.create_vagas_batch(db, vagas_novas)
+    return await crud_async.create_vagas_batch(db, vagas_novas)
 
 
 @router.patch("/{vaga_id}", response_model=schemas.VagaResponse)
-def atualizar_vaga(vaga_id: int, vaga_update: schemas.VagaUpdate, db: Session = Depends(get_db)):
+async def atualizar_vaga(vaga_id: int, vaga_update: schemas.VagaUpdate, db: AsyncSession = Depends(get_async_db)):
     """Atualiza uma vaga existente."""
-    vaga = crud.update_vaga(db, vaga_id, vaga_update)
+    try:
+        vaga = await crud_async.update_vaga(db, vaga_id, vaga_update)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Vaga duplicada já existe")
     if not vaga:
         raise HTTPException(status_code=404, detail="Vaga não encontrada")
     return vaga
 
 
 @router.delete("/{vaga_id}", status_code=204)
-def deletar_vaga(vaga_id: int, db: Session = Depends(get_db)):
+async def deletar_vaga(vaga_id: int, db: AsyncSession = Depends(get_async_db)):
     """Deleta uma vaga."""
-    if not crud.delete_vaga(db, vaga_id):
+    if not await crud_async.delete_vaga(db, vaga_id):
         raise HTTPException(status_code=404, detail="Vaga não encontrada")
 
 
 @router.patch("/{vaga_id}/status", response_model=schemas.VagaResponse)
-def atualizar_status(
+async def atualizar_status(
     vaga_id: int,
     status: schemas.StatusEnum,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Atualiza apenas o status de uma vaga."""
-    vaga = crud.update_vaga(db, vaga_id, schemas.VagaUpdate(status=status))
+    vaga = await crud_async.update_vaga(db, vaga_id, schemas.VagaUpdate(status=status))
     if not vaga:
         raise HTTPException(status_code=404, detail="Vaga não encontrada")
     return vaga
@@ -0,0 +1,111 @@
+"""
+Busca textual em título, empresa e observações das vagas.
+
+- SQLite: tabela virtual FTS5 (vagas_fts) com conteúdo externo, mantida por triggers.
+- Postgres: índice GIN sobre um tsvector em português sem acentos (índice de expressão,
+  atualizado pelo próprio banco a cada escrita).
+
+Nos dois casos a busca ignora acentos e ordena por relevância (título pesa mais).
+"""
+import re
+
+from sqlalchemy import column, or_, table, text
+from sqlalchemy.engine import Engine
+
+from . import models
+
+# Expressão indexada no Postgres; a consulta precisa usar exatamente a mesma para usar o índice
+VETOR_BUSCA_PG = (
+    "setweight(to_tsvector('portuguese', vagas_unaccent(coalesce(vagas.titulo, ''))), 'A') || "
+    "setweight(to_tsvector('portuguese', vagas_unaccent(coalesce(vagas.empresa, ''))), 'B') || "
+    "setweight(to_tsvector('portuguese', vagas_unaccent(coalesce(vagas.observacoes, ''))), 'C')"
+)
+CONSULTA_BUSCA_PG = "websearch_to_tsquery('portuguese', vagas_unaccent(:busca))"
+
+DDL_POSTGRES = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    # unaccent não é IMMUTABLE; o wrapper com dicionário fixo pode ser usado no índice
+    "CREATE OR REPLACE FUNCTION vagas_unaccent(text) RETURNS text AS "
+    "$$ SELECT public.unaccent('public.unaccent', $1) $$ "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT",
+    f"CREATE INDEX IF NOT EXISTS idx_vagas_busca ON vagas USING GIN (({VETOR_BUSCA_PG.replace('vagas.', '')}))",
+]
+
+DDL_SQLITE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS vagas_fts USING fts5("
+    "titulo, empresa, observacoes, content='vagas', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS vagas_fts_ai AFTER INSERT ON vagas BEGIN "
+    "INSERT INTO vagas_fts(rowid, titulo, empresa, observacoes) "
+    "VALUES (new.id, new.titulo, new.empresa, new.observacoes); END",
+    "CREATE TRIGGER IF NOT EXISTS vagas_fts_ad AFTER DELETE ON vagas BEGIN "
+    "INSERT INTO vagas_fts(vagas_fts, rowid, titulo, empresa, observacoes) "
+    "VALUES ('delete', old.id, old.titulo, old.empresa, old.observacoes); END",
+    "CREATE TRIGGER IF NOT EXISTS vagas_fts_au AFTER UPDATE OF titulo, empresa, observacoes ON vagas BEGIN "
+    "INSERT INTO vagas_fts(vagas_fts, rowid, titulo, empresa, observacoes) "
+    "VALUES ('delete', old.id, old.titulo, old.empresa, old.observacoes); "
+    "INSERT INTO vagas_fts(rowid, titulo, empresa, observacoes) "
+    "VALUES (new.id, new.titulo, new.empresa, new.observacoes); END",
+]
+
+_fts = table("vagas_fts", column("rowid"))
+
+
+def criar_indice_busca(engine: Engine):
+    """Cria o índice de busca do dialeto (idempotente) e indexa as vagas existentes."""
+    dialeto = engine.dialect.name
+    with engine.begin() as conn:
+        if dialeto == "postgresql":
+            for ddl in DDL_POSTGRES:
+                conn.execute(text(ddl))
+        elif dialeto == "sqlite":
+            existia = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'vagas_fts'")
+            ).first()
+            for ddl in DDL_SQLITE:
+                conn.execute(text(ddl))
+            if not existia:
+                conn.execute(text("INSERT INTO vagas_fts(vagas_fts) VALUES ('rebuild')"))
+
+
+# Palavras que aparecem em quase toda vaga e só encarecem a interseção no índice
+STOPWORDS = {"a", "o", "e", "de", "da", "do", "das", "dos", "em", "na", "no", "para", "com", "of", "the"}
+
+
+def _consulta_fts5(q: str) -> str:
+    """
+    Converte o texto do usuário numa consulta FTS5 segura: todos os termos obrigatórios,
+    prefixo só no último (digitação em andamento).
+    """
+    termos = [t for t in re.findall(r"\w+", q.lower()) if t not in STOPWORDS] or re.findall(r"\w+", q.lower())
+    return " ".join(f'"{termo}"' for termo in termos[:-1]) + f' "{termos[-1]}"*'
+
+
+def filtrar_por_busca(query, dialeto: str, q: str):
+    """
+    Restringe a query às vagas que casam com q.
+
+    Retorna (query, ordem_relevancia) — a ordem deve vir antes da ordenação padrão.
+    """
+    if not re.search(r"\w", q):
+        return query, []
+
+    if dialeto == "sqlite":
+        query = query.join(_fts, _fts.c.rowid == models.Vaga.id).filter(
+            text("vagas_fts MATCH :busca").bindparams(busca=_consulta_fts5(q))
+        )
+        # bm25 é menor para os mais relevantes; pesos por coluna: título, empresa, observações
+        return query, [text("bm25(vagas_fts, 10.0, 5.0, 1.0)")]
+
+    if dialeto == "postgresql":
+        query = query.filter(text(f"({VETOR_BUSCA_PG}) @@ {CONSULTA_BUSCA_PG}").bindparams(busca=q))
+        return query, [text(f"ts_rank(({VETOR_BUSCA_PG}), {CONSULTA_BUSCA_PG}) DESC").bindparams(busca=q)]
+
+    # Outros bancos: busca simples sem índice
+    padrao = f"%{q}%"
+    query = query.filter(or_(
+        models.Vaga.titulo.ilike(padrao),
+        models.Vaga.empresa.ilike(padrao),
+        models.Vaga.observacoes.ilike(padrao),
+    ))
+    return query, []
@@ -1,15 +1,59 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from datetime import date, timedelta
+from sqlalchemy import case, func, or_, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql, sqlite
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
 from typing import Optional
+import base64
+import json
+import os
 
 from . import models, schemas
+from .busca import filtrar_por_busca
+from .fingerprint import gerar_fingerprint
+from .simhash import NUM_BANDAS, bandas, calcular_simhash, de_bigint, distancia, para_bigint
+
+# Se "1", GET /api/stats lê a tabela de contadores vagas_stats em vez de varrer vagas.
+# Os contadores são mantidos em toda escrita independentemente desta opção.
+STATS_CONTADORES = os.getenv("STATS_CONTADORES", "1") == "1"
+
+# Quase-duplicatas de posts: distância máxima em bits entre SimHashes (similaridade ~ 1 - d/64),
+# o que fazer com elas ('descartar' ou 'vincular' à vaga original) e quantos dias para trás comparar
+QUASE_DUPLICATAS_DISTANCIA = int(os.getenv("QUASE_DUPLICATAS_DISTANCIA", "8"))
+QUASE_DUPLICATAS_MODO = os.getenv("QUASE_DUPLICATAS_MODO", "descartar")
+QUASE_DUPLICATAS_JANELA_DIAS = int(os.getenv("QUASE_DUPLICATAS_JANELA_DIAS", "7"))
+
+# Job "executando" sem heartbeat há mais que isso é considerado abandonado (worker caiu)
+JOB_TIMEOUT_MINUTOS = int(os.getenv("JOB_TIMEOUT_MINUTOS", "60"))
+# Intervalo do heartbeat do worker durante o job (bem menor que JOB_TIMEOUT_MINUTOS)
+JOB_HEARTBEAT_SEGUNDOS = float(os.getenv("JOB_HEARTBEAT_SEGUNDOS", "60"))
+
+# Facetas contadas em vagas_stats (além do total)
+FACETAS_STATS = ("fonte", "status", "modalidade", "tipo_vaga", "data_coleta")
 
 
 def get_vaga(db: Session, vaga_id: int) -> Optional[models.Vaga]:
     return db.query(models.Vaga).filter(models.Vaga.id == vaga_id).first()
 
 
+def codificar_cursor(vaga: models.Vaga) -> str:
+    """Cursor opaco com a posição (data_coleta, id) da vaga na ordenação da listagem."""
+    dados = json.dumps([vaga.data_coleta.isoformat(), vaga.id])
+    return base64.urlsafe_b64encode(dados.encode()).decode().rstrip("=")
+
+
+def decodificar_cursor(cursor: str) -> tuple[date, int]:
+    """Inverso de codificar_cursor. Levanta ValueError se o cursor for inválido."""
+    try:
+        dados = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data_coleta, vaga_id = json.loads(dados)
+        return date.fromisoformat(data_coleta), int(vaga_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Cursor inválido") from e
+
+
 def get_vagas(
     db: Session,
     skip: int = 0,
@@ -19,8 +63,25 @@ def get_vagas(
     modalidade: Optional[str] = None,
     tipo_vaga: Optional[str] = None,
     requisito_ingles: Optional[str] = None,
-) -> tuple[list[models.Vaga], int]:
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    q: Optional[str] = None,
+) -> tuple[list[models.Vaga], Optional[int], Optional[str]]:
+    """
+    Lista vagas ordenadas por (data_coleta, id) decrescente.
+
+    Com cursor usa paginação por chave (keyset) no índice idx_data_coleta_id, então
+    qualquer página custa o mesmo que a primeira; skip é ignorado nesse modo.
+    Com q faz busca textual ordenada por relevância (paginação só por skip).
+    Retorna (vagas, total, next_cursor); total é None se include_total=False.
+    """
     query = db.query(models.Vaga)
+    relevancia = []
+
+    if q:
+        if cursor:
+            raise ValueError("Cursor não é suportado junto com busca (q)")
+        query, relevancia = filtrar_por_busca(query, db.get_bind().dialect.name, q)
 
     if fonte:
         query = query.filter(models.Vaga.fonte == fonte)
@@ -33,27 +94,219 @@ def get_vagas(
     if requisito_ingles:
         query = query.filter(models.Vaga.requisito_ingles == requisito_ingles)
 
-    total = query.count()
-    vagas = query.order_by(models.Vaga.data_coleta.desc()).offset(skip).limit(limit).all()
+    total = query.count() if include_total else None
+
+    query = query.order_by(*relevancia, models.Vaga.data_coleta.desc(), models.Vaga.id.desc())
+    if cursor:
+        query = query.filter(tuple_(models.Vaga.data_coleta, models.Vaga.id) < decodificar_cursor(cursor))
+    else:
+        query = query.offset(skip)
 
-    return vagas, total
+    # Busca uma vaga a mais para saber se existe próxima página
+    vagas = query.limit(limit + 1).all()
+    tem_proxima = len(vagas) > limit and not relevancia
+    next_cursor = codificar_cursor(vagas[limit - 1]) if tem_proxima else None
+
+    return vagas[:limit], total, next_cursor
+
+
+def _dados_vaga(vaga: schemas.VagaCreate) -> dict:
+    """Colunas da vaga para inserção, incluindo fingerprint e SimHash do texto do post."""
+    dados = vaga.model_dump()
+    dados["fingerprint"] = gerar_fingerprint(vaga.titulo, vaga.empresa, vaga.link_vaga)
+
+    simhash = calcular_simhash(vaga.texto_post)
+    dados["simhash"] = para_bigint(simhash) if simhash is not None else None
+    for i, valor in enumerate(bandas(simhash) if simhash is not None else [None] * NUM_BANDAS):
+        dados[f"simhash_banda_{i}"] = valor
+    dados["vaga_canonica_id"] = None
+    return dados
+
+
+def _mais_proxima(simhash: int, chaves: list, candidatas: dict, limiar: int):
+    """Entre as candidatas que compartilham alguma banda, a mais próxima dentro do limiar."""
+    melhor, melhor_distancia = None, limiar + 1
+    for chave in chaves:
+        for candidata in candidatas.get(chave, {}).values():
+            d = distancia(simhash, candidata[0])
+            if d < melhor_distancia:
+                melhor, melhor_distancia = candidata, d
+    return melhor
+
+
+def _resolver_quase_duplicatas(
+    db: Session,
+    linhas: list[dict],
+    limiar: int = QUASE_DUPLICATAS_DISTANCIA,
+    modo: str = QUASE_DUPLICATAS_MODO,
+    janela_dias: int = QUASE_DUPLICATAS_JANELA_DIAS,
+) -> tuple[list[dict], int]:
+    """
+    Trata linhas cujo texto é quase igual ao de uma vaga recente do banco ou de uma anterior no lote.
+
+    As candidatas vêm das colunas de banda indexadas (poucas consultas por lote, sem varrer
+    a tabela). modo='descartar' remove a quase-duplicata; 'vincular' a mantém com
+    vaga_canonica_id apontando para a original. Repetições dentro do próprio lote são
+    sempre descartadas. Retorna (linhas mantidas, quantidade de quase-duplicatas).
+    """
+    colunas_banda = [getattr(models.Vaga, f"simhash_banda_{i}") for i in range(NUM_BANDAS)]
+    assinadas = [linha for linha in linhas if linha["simhash"] is not None]
+    if not assinadas:
+        return linhas, 0
+
+    # (banda, valor) -> {id: (assinatura, id da canônica)}; canônica None = linha do próprio lote
+    candidatas = {}
+    janela = date.today() - timedelta(days=janela_dias)
+    for lote in _em_lotes(assinadas, TAMANHO_LOTE_CONSULTA // NUM_BANDAS):
+        filtro = or_(*(
+            coluna.in_({linha[f"simhash_banda_{i}"] for linha in lote})
+            for i, coluna in enumerate(colunas_banda)
+        ))
+        existentes = db.query(
+            models.Vaga.id, models.Vaga.simhash, models.Vaga.vaga_canonica_id, *colunas_banda
+        ).filter(filtro, models.Vaga.data_coleta >= janela)
+        for vaga_id, simhash, canonica, *valores in existentes:
+            for i, valor in enumerate(valores):
+                candidatas.setdefault((i, valor), {})[vaga_id] = (de_bigint(simhash), canonica or vaga_id)
+
+    mantidas, quase_duplicatas = [], 0
+    for posicao, linha in enumerate(linhas):
+        if linha["simhash"] is None:
+            mantidas.append(linha)
+            continue
+
+        simhash = de_bigint(linha["simhash"])
+        chaves = [(i, linha[f"simhash_banda_{i}"]) for i in range(NUM_BANDAS)]
+        original = _mais_proxima(simhash, chaves, candidatas, limiar)
+
+        if original is not None:
+            quase_duplicatas += 1
+            canonica = original[1]
+            if modo != "vincular" or canonica is None:
+                continue
+            linha["vaga_canonica_id"] = canonica
+
+        for chave in chaves:
+            candidatas.setdefault(chave, {})[("lote", posicao)] = (simhash, None)
+        mantidas.append(linha)
+
+    return mantidas, quase_duplicatas
+
+
+def _insert_dialeto(db: Session, tabela):
+    """INSERT do dialeto do banco, que suporta ON CONFLICT."""
+    dialeto = db.get_bind().dialect.name
+    if dialeto == "postgresql":
+        return postgresql.insert(tabela)
+    if dialeto == "sqlite":
+        return sqlite.insert(tabela)
+    raise NotImplementedError(f"Banco não suportado para inserção em lote: {dialeto}")
+
+
+def _insert_ignorando_duplicatas(db: Session):
+    """INSERT ... ON CONFLICT (fingerprint) DO NOTHING no dialeto do banco."""
+    return _insert_dialeto(db, models.Vaga).on_conflict_do_nothing(index_elements=[models.Vaga.fingerprint])
+
+
+def _colunas_stats():
+    return [getattr(models.Vaga, faceta) for faceta in FACETAS_STATS]
+
+
+def _valor_faceta(valor) -> Optional[str]:
+    if isinstance(valor, Enum):
+        return valor.value
+    if isinstance(valor, date):
+        return valor.isoformat()
+    return valor
+
+
+def _deltas_stats(vagas, peso: int) -> Counter:
+    """Variação dos contadores de vagas_stats ao inserir (peso +1) ou remover (-1) as vagas."""
+    deltas = Counter()
+    for vaga in vagas:
+        deltas[("total", "")] += peso
+        for faceta in FACETAS_STATS:
+            valor = _valor_faceta(getattr(vaga, faceta))
+            if valor is not None:
+                deltas[(faceta, valor)] += peso
+    return deltas
+
+
+def _aplicar_deltas_stats(db: Session, deltas: Counter, substituir: bool = False):
+    """
+    Soma as variações em vagas_stats na transação corrente (UPSERT atômico).
+
+    Com substituir=True grava os valores como totais absolutos (reconstrução).
+    """
+    linhas = [
+        {"faceta": faceta, "valor": valor, "total": total}
+        for (faceta, valor), total in deltas.items()
+        if total
+    ]
+    if not linhas:
+        return
+
+    tabela = models.VagaStat.__table__
+    stmt = _insert_dialeto(db, tabela)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[tabela.c.faceta, tabela.c.valor],
+        set_={"total": stmt.excluded.total if substituir else tabela.c.total + stmt.excluded.total},
+    )
+    db.execute(stmt, linhas)
 
 
 def create_vaga(db: Session, vaga: schemas.VagaCreate) -> models.Vaga:
-    db_vaga = models.Vaga(**vaga.model_dump())
+    db_vaga = models.Vaga(**_dados_vaga(vaga))
     db.add(db_vaga)
+    db.flush()
+    _aplicar_deltas_stats(db, _deltas_stats([db_vaga], +1))
     db.commit()
     db.refresh(db_vaga)
     return db_vaga
 
 
-def create_vagas_batch(db: Session, vagas: list[schemas.VagaCreate]) -> list[models.Vaga]:
-    db_vagas = [models.Vaga(**vaga.model_dump()) for vaga in vagas]
-    db.add_all(db_vagas)
+def create_vagas_batch(db: Session, vagas: list[schemas.VagaCreate]) -> list[schemas.VagaResponse]:
+    """
+    Insere o lote com INSERT ... RETURNING e monta as respostas a partir das linhas retornadas.
+
+    Evita um SELECT (refresh) por vaga para preencher id/created_at/updated_at.
+    Vagas cujo fingerprint já existe são ignoradas e não aparecem no retorno.
+    """
+    if not vagas:
+        return []
+
+    stmt = _insert_ignorando_duplicatas(db).returning(*models.Vaga.__table__.c)
+    linhas = db.execute(stmt, [_dados_vaga(vaga) for vaga in vagas]).all()
+    _aplicar_deltas_stats(db, _deltas_stats(linhas, +1))
     db.commit()
-    for vaga in db_vagas:
-        db.refresh(vaga)
-    return db_vagas
+
+    return [schemas.VagaResponse.model_validate(linha) for linha in linhas]
+
+
+def inserir_vagas_ignorando_duplicatas(db: Session, vagas: list[schemas.VagaCreate]) -> dict:
+    """
+    Insere o lote num único INSERT ... ON CONFLICT DO NOTHING pelo fingerprint.
+
+    Não depende de checagem prévia, então não há corrida entre processos que coletam
+    ao mesmo tempo. Posts quase iguais a outros recentes são tratados antes
+    (ver _resolver_quase_duplicatas). Retorna quantas vagas foram inseridas,
+    quantas foram ignoradas e quantas eram quase-duplicatas.
+    """
+    if not vagas:
+        return {"inseridas": 0, "ignoradas": 0, "quase_duplicatas": 0}
+
+    dados, quase_duplicatas = _resolver_quase_duplicatas(db, [_dados_vaga(vaga) for vaga in vagas])
+
+    linhas = []
+    if dados:
+        stmt = _insert_ignorando_duplicatas(db).returning(*_colunas_stats())
+        linhas = db.execute(stmt, dados).all()
+        _aplicar_deltas_stats(db, _deltas_stats(linhas, +1))
+        db.commit()
+
+    inseridas = len(linhas)
+
+    return {"inseridas": inseridas, "ignoradas": len(vagas) - inseridas, "quase_duplicatas": quase_duplicatas}
 
 
 def update_vaga(db: Session, vaga_id: int, vaga_update: schemas.VagaUpdate) -> Optional[models.Vaga]:
@@ -61,10 +314,17 @@ def update_vaga(db: Session, vaga_id: int, vaga_update: schemas.VagaUpdate) -> O
     if not db_vaga:
         return None
 
+    deltas = _deltas_stats([db_vaga], -1)
+
     update_data = vaga_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_vaga, field, value)
 
+    if update_data.keys() & {"titulo", "empresa", "link_vaga"}:
+        db_vaga.fingerprint = gerar_fingerprint(db_vaga.titulo, db_vaga.empresa, db_vaga.link_vaga)
+
+    deltas.update(_deltas_stats([db_vaga], +1))
+    _aplicar_deltas_stats(db, deltas)
     db.commit()
     db.refresh(db_vaga)
     return db_vaga
@@ -75,55 +335,100 @@ def delete_vaga(db: Session, vaga_id: int) -> bool:
     if not db_vaga:
         return False
 
+    _aplicar_deltas_stats(db, _deltas_stats([db_vaga], -1))
     db.delete(db_vaga)
     db.commit()
     return True
 
 
-def get_stats(db: Session) -> dict:
-    total = db.query(models.Vaga).count()
+def _stats_vazias() -> dict:
+    return {
+        "total_vagas": 0,
+        "por_fonte": {},
+        "por_status": {},
+        "por_modalidade": {},
+        "por_tipo_vaga": {},
+        "ultimas_24h": 0,
+    }
 
-    # Por fonte
-    por_fonte = dict(
-        db.query(models.Vaga.fonte, func.count(models.Vaga.id))
-        .group_by(models.Vaga.fonte)
-        .all()
-    )
 
-    # Por status
-    por_status = dict(
-        db.query(models.Vaga.status, func.count(models.Vaga.id))
-        .group_by(models.Vaga.status)
+def calcular_stats(db: Session) -> dict:
+    """
+    Calcula as estatísticas numa única varredura de vagas.
+
+    Agrupa pela combinação das facetas (poucas dezenas de grupos) e soma as
+    vagas recentes com agregação condicional; os totais por faceta são dobrados aqui.
+    """
+    ontem = date.today() - timedelta(days=1)
+    linhas = (
+        db.query(
+            models.Vaga.fonte,
+            models.Vaga.status,
+            models.Vaga.modalidade,
+            models.Vaga.tipo_vaga,
+            func.count(models.Vaga.id),
+            func.sum(case((models.Vaga.data_coleta >= ontem, 1), else_=0)),
+        )
+        .group_by(models.Vaga.fonte, models.Vaga.status, models.Vaga.modalidade, models.Vaga.tipo_vaga)
         .all()
     )
 
-    # Por modalidade
-    por_modalidade = dict(
-        db.query(models.Vaga.modalidade, func.count(models.Vaga.id))
-        .group_by(models.Vaga.modalidade)
-        .all()
+    stats = _stats_vazias()
+    for fonte, status, modalidade, tipo_vaga, total, recentes in linhas:
+        stats["total_vagas"] += total
+        stats["ultimas_24h"] += recentes or 0
+        for chave, valor in (
+            ("por_fonte", fonte),
+            ("por_status", status),
+            ("por_modalidade", modalidade),
+            ("por_tipo_vaga", tipo_vaga),
+        ):
+            if valor is not None:
+                stats[chave][valor] = stats[chave].get(valor, 0) + total
+
+    return stats
+
+
+def _stats_dos_contadores(db: Session) -> dict:
+    """Lê as estatísticas da tabela vagas_stats (custo independente do tamanho de vagas)."""
+    ontem = (date.today() - timedelta(days=1)).isoformat()
+    linhas = db.query(models.VagaStat.faceta, models.VagaStat.valor, models.VagaStat.total).filter(
+        or_(models.VagaStat.faceta != "data_coleta", models.VagaStat.valor >= ontem)
     )
 
-    # Por tipo de vaga
-    por_tipo_vaga = dict(
-        db.query(models.Vaga.tipo_vaga, func.count(models.Vaga.id))
-        .filter(models.Vaga.tipo_vaga.isnot(None))
-        .group_by(models.Vaga.tipo_vaga)
+    stats = _stats_vazias()
+    for faceta, valor, total in linhas:
+        if faceta == "total":
+            stats["total_vagas"] = total
+        elif faceta == "data_coleta":
+            stats["ultimas_24h"] += total
+        elif total:
+            stats[f"por_{faceta}"][valor] = total
+
+    return stats
+
+
+def get_stats(db: Session) -> dict:
+    if STATS_CONTADORES:
+        return _stats_dos_contadores(db)
+    return calcular_stats(db)
+
+
+def reconstruir_stats(db: Session):
+    """Recalcula vagas_stats a partir de uma varredura de vagas (usado na migração)."""
+    linhas = (
+        db.query(*_colunas_stats(), func.count(models.Vaga.id).label("quantidade"))
+        .group_by(*_colunas_stats())
         .all()
     )
 
-    # Últimas 24h
-    ontem = date.today() - timedelta(days=1)
-    ultimas_24h = db.query(models.Vaga).filter(models.Vaga.data_coleta >= ontem).count()
+    deltas = Counter()
+    for linha in linhas:
+        deltas.update(_deltas_stats([linha], linha.quantidade))
 
-    return {
-        "total_vagas": total,
-        "por_fonte": por_fonte,
-        "por_status": por_status,
-        "por_modalidade": por_modalidade,
-        "por_tipo_vaga": por_tipo_vaga,
-        "ultimas_24h": ultimas_24h,
-    }
+    db.query(models.VagaStat).delete()
+    _aplicar_deltas_stats(db, deltas, substituir=True)
+    db.commit()
 
 
 def check_duplicate(db: Session, titulo: str, empresa: Optional[str], link_vaga: Optional[str]) -> bool:
@@ -144,3 +449,198 @@ def check_duplicate(db: Session, titulo: str, empresa: Optional[str], link_vaga:
             return True
 
     return False
+
+
+# Limite de parâmetros por IN (...) para não estourar o limite do SQLite
+TAMANHO_LOTE_CONSULTA = 500
+
+
+def _em_lotes(itens: list, tamanho: int = TAMANHO_LOTE_CONSULTA):
+    for i in range(0, len(itens), tamanho):
+        yield itens[i:i + tamanho]
+
+
+def filtrar_duplicatas(db: Session, vagas: list[schemas.VagaCreate]) -> list[schemas.VagaCreate]:
+    """
+    Remove de um lote as vagas que já existem no banco ou que se repetem no próprio lote.
+
+    Mesma regra de check_duplicate (mesmo link ou mesmo título + empresa), mas resolvida
+    com poucas consultas por conjunto em vez de até duas consultas por vaga.
+    """
+    links = list({v.link_vaga for v in vagas if v.link_vaga})
+    pares = list({(v.titulo, v.empresa) for v in vagas if v.titulo and v.empresa})
+
+    links_existentes = set()
+    for lote in _em_lotes(links):
+        links_existentes.update(
+            link for (link,) in db.query(models.Vaga.link_vaga).filter(models.Vaga.link_vaga.in_(lote))
+        )
+
+    pares_existentes = set()
+    for lote in _em_lotes(pares):
+        pares_existentes.update(
+            (titulo, empresa)
+            for titulo, empresa in db.query(models.Vaga.titulo, models.Vaga.empresa)
+            .filter(tuple_(models.Vaga.titulo, models.Vaga.empresa).in_(lote))
+        )
+
+    novas = []
+    for vaga in vagas:
+        par = (vaga.titulo, vaga.empresa) if vaga.titulo and vaga.empresa else None
+        if vaga.link_vaga and vaga.link_vaga in links_existentes:
+            continue
+        if par and par in pares_existentes:
+            continue
+
+        # Marca como visto para descartar repetições dentro do próprio lote
+        if vaga.link_vaga:
+            links_existentes.add(vaga.link_vaga)
+        if par:
+            pares_existentes.add(par)
+        novas.append(vaga)
+
+    return novas
+
+
+def links_recentes(db: Session, fonte: str, dias: int) -> set[str]:
+    """Links das vagas da fonte coletadas nos últimos `dias` dias (coleta incremental)."""
+    desde = date.today() - timedelta(days=dias)
+    return {
+        link
+        for (link,) in db.query(models.Vaga.link_vaga).filter(
+            models.Vaga.fonte == fonte,
+            models.Vaga.data_coleta >= desde,
+            models.Vaga.link_vaga.isnot(None),
+        )
+    }
+
+
+def contar_links(db: Session) -> int:
+    """Vagas com link (dimensiona o filtro de vistos)."""
+    return db.query(func.count(models.Vaga.id)).filter(models.Vaga.link_vaga.isnot(None)).scalar()
+
+
+def todos_os_links(db: Session):
+    """Links de todas as vagas, em lotes (reconstrução do filtro de vistos)."""
+    consulta = db.query(models.Vaga.link_vaga).filter(models.Vaga.link_vaga.isnot(None)).yield_per(10000)
+    return (link for (link,) in consulta)
+
+
+# === Jobs de coleta ===
+
+def _agora() -> datetime:
+    """Horário UTC sem fuso (mesmo formato de CURRENT_TIMESTAMP)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def get_job_coleta(db: Session, job_id: int) -> Optional[models.JobColeta]:
+    return db.query(models.JobColeta).filter(models.JobColeta.id == job_id).first()
+
+
+def _job_ativo(db: Session, chave: str) -> Optional[models.JobColeta]:
+    return db.query(models.JobColeta).filter(
+        models.JobColeta.chave == chave,
+        models.JobColeta.status.in_(models.STATUS_JOB_ATIVOS),
+    ).first()
+
+
+def enfileirar_job_coleta(db: Session, fontes: list[str]) -> tuple[models.JobColeta, bool]:
+    """
+    Enfileira um job de coleta das fontes.
+
+    Se já existe um job ativo (pendente ou executando) com as mesmas fontes, não cria
+    outro: retorna o existente. O índice único parcial garante isso mesmo com pedidos
+    simultâneos. Retorna (job, coalescido).
+    """
+    chave = ",".join(sorted(set(fontes)))
+    while True:
+        ativo = _job_ativo(db, chave)
+        if ativo:
+            return ativo, True
+
+        job = models.JobColeta(
+            chave=chave,
+            status="pendente",
+            progresso={fonte: schemas.ProgressoFonte().model_dump(mode="json") for fonte in chave.split(",")},
+        )
+        db.add(job)
+        try:
+            db.commit()
+        except IntegrityError:
+            # Outro pedido criou o mesmo job entre a consulta e o insert
+            db.rollback()
+            continue
+        db.refresh(job)
+        return job, False
+
+
+def reivindicar_job_coleta(db: Session, worker: str) -> Optional[models.JobColeta]:
+    """
+    Pega o job pendente mais antigo para o worker.
+
+    O UPDATE só vale se o job ainda estiver pendente, então dois workers nunca
+    executam o mesmo job. Retorna None se a fila estiver vazia.
+    """
+    while True:
+        job_id = (
+            db.query(models.JobColeta.id)
+            .filter(models.JobColeta.status == "pendente")
+            .order_by(models.JobColeta.id)
+            .limit(1)
+            .scalar()
+        )
+        if job_id is None:
+            return None
+
+        agora = _agora()
+        pegou = db.query(models.JobColeta).filter(
+            models.JobColeta.id == job_id, models.JobColeta.status == "pendente"
+        ).update(
+            {"status": "executando", "worker": worker, "iniciado_em": agora, "heartbeat_em": agora},
+            synchronize_session=False,
+        )
+        db.commit()
+        if pegou:
+            return get_job_coleta(db, job_id)
+
+
+def atualizar_progresso_job(db: Session, job: models.JobColeta, fonte: str, **campos):
+    """Atualiza o progresso de uma fonte do job (e o heartbeat)."""
+    progresso = dict(job.progresso)
+    progresso[fonte] = {**progresso.get(fonte, {}), **campos}
+    job.progresso = progresso
+    job.heartbeat_em = _agora()
+    db.commit()
+
+
+def registrar_heartbeat_job(db: Session, job_id: int, worker: str) -> bool:
+    """
+    Atualiza o heartbeat do job em execução pelo worker. Retorna False se o job não
+    está mais com ele (foi devolvido à fila ou terminou).
+    """
+    atualizou = db.query(models.JobColeta).filter(
+        models.JobColeta.id == job_id,
+        models.JobColeta.status == "executando",
+        models.JobColeta.worker == worker,
+    ).update({"heartbeat_em": _agora()}, synchronize_session=False)
+    db.commit()
+    return bool(atualizou)
+
+
+def finalizar_job_coleta(db: Session, job: models.JobColeta, erro: Optional[str] = None):
+    """Marca o job como concluído, ou erro se ele falhou ou se todas as fontes falharam."""
+    falhou = erro is not None or all(p.get("status") == "erro" for p in job.progresso.values())
+    job.status = "erro" if falhou else "concluido"
+    job.erro = erro
+    job.finalizado_em = _agora()
+    db.commit()
+
+
+def devolver_jobs_abandonados(db: Session, minutos: int = JOB_TIMEOUT_MINUTOS) -> int:
+    """Devolve à fila jobs em execução cujo worker parou de dar sinal. Retorna quantos."""
+    devolvidos = db.query(models.JobColeta).filter(
+        models.JobColeta.status == "executando",
+        models.JobColeta.heartbeat_em < _agora() - timedelta(minutes=minutos),
+    ).update({"status": "pendente", "worker": None}, synchronize_session=False)
+    db.commit()
+    return devolvidos
@@ -0,0 +1,65 @@
+"""
+Versões assíncronas das funções de crud, para as rotas async.
+
+Cada função executa a implementação de crud.py com AsyncSession.run_sync: a lógica
+e as consultas são as mesmas, mas o I/O do banco passa pelo driver assíncrono
+(aiosqlite / asyncpg) e a rota não ocupa uma thread do threadpool enquanto espera.
+"""
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import crud, models, schemas
+
+
+async def get_vaga(db: AsyncSession, vaga_id: int) -> Optional[models.Vaga]:
+    return await db.run_sync(crud.get_vaga, vaga_id)
+
+
+async def get_vagas(db: AsyncSession, **filtros) -> tuple[list[models.Vaga], Optional[int], Optional[str]]:
+    """Ver crud.get_vagas (mesmos parâmetros nomeados)."""
+    return await db.run_sync(crud.get_vagas, **filtros)
+
+
+async def create_vaga(db: AsyncSession, vaga: schemas.VagaCreate) -> models.Vaga:
+    return await db.run_sync(crud.create_vaga, vaga)
+
+
+async def create_vagas_batch(db: AsyncSession, vagas: list[schemas.VagaCreate]) -> list[schemas.VagaResponse]:
+    return await db.run_sync(crud.create_vagas_batch, vagas)
+
+
+async def inserir_vagas_ignorando_duplicatas(db: AsyncSession, vagas: list[schemas.VagaCreate]) -> dict:
+    return await db.run_sync(crud.inserir_vagas_ignorando_duplicatas, vagas)
+
+
+async def update_vaga(
+    db: AsyncSession, vaga_id: int, vaga_update: schemas.VagaUpdate
+) -> Optional[models.Vaga]:
+    return await db.run_sync(crud.update_vaga, vaga_id, vaga_update)
+
+
+async def delete_vaga(db: AsyncSession, vaga_id: int) -> bool:
+    return await db.run_sync(crud.delete_vaga, vaga_id)
+
+
+async def get_stats(db: AsyncSession) -> dict:
+    return await db.run_sync(crud.get_stats)
+
+
+async def check_duplicate(
+    db: AsyncSession, titulo: str, empresa: Optional[str], link_vaga: Optional[str]
+) -> bool:
+    return await db.run_sync(crud.check_duplicate, titulo, empresa, link_vaga)
+
+
+async def filtrar_duplicatas(db: AsyncSession, vagas: list[schemas.VagaCreate]) -> list[schemas.VagaCreate]:
+    return await db.run_sync(crud.filtrar_duplicatas, vagas)
+
+
+async def enfileirar_job_coleta(db: AsyncSession, fontes: list[str]) -> tuple[models.JobColeta, bool]:
+    return await db.run_sync(crud.enfileirar_job_coleta, fontes)
+
+
+async def get_job_coleta(db: AsyncSession, job_id: int) -> Optional[models.JobColeta]:
+    return await db.run_sync(crud.get_job_coleta, job_id)
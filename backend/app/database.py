@@ -1,4 +1,6 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 import os
 
@@ -8,12 +10,108 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./data/vagas.db")
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+# Perfil aplicado a cada conexão SQLite. WAL deixa leitores lerem enquanto a coleta escreve;
+# com WAL, synchronous=NORMAL só perde as últimas transações numa queda de energia.
+PRAGMAS_SQLITE = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", "-65536")),  # negativo = KiB (64 MiB)
+    "temp_store": os.getenv("SQLITE_TEMP_STORE", "MEMORY"),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT", "5000")),  # ms
+}
+
+
+def url_async(url: str) -> str:
+    """URL equivalente com driver assíncrono (aiosqlite / asyncpg)."""
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if url.startswith("postgresql://"):
+        # asyncpg não entende sslmode=...; o equivalente é ssl=...
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1).replace("sslmode=", "ssl=")
+    return url
+
+
+def _sqlite_em_arquivo(url: str) -> bool:
+    url = make_url(url)
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def configurar_sqlite(engine, somente_leitura: bool = False):
+    """Aplica PRAGMAS_SQLITE a cada nova conexão do engine (sync ou async)."""
+    alvo = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(alvo, "connect")
+    def _aplicar_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for nome, valor in PRAGMAS_SQLITE.items():
+            cursor.execute(f"PRAGMA {nome}={valor}")
+        if somente_leitura:
+            cursor.execute("PRAGMA query_only=1")
+        cursor.close()
+
+    return engine
+
+
+def opcoes_engine(url: str, escrita: bool) -> dict:
+    """
+    Opções de create_engine por papel.
+
+    No SQLite em arquivo o engine de escrita tem uma única conexão: as escritas feitas por
+    ele fazem fila no pool em vez de disputar o lock do arquivo. Isso vale por engine e por
+    processo: o engine síncrono e o assíncrono são dois escritores, e cada processo (workers
+    do gunicorn, worker de coleta, coletar_tudo) tem os seus. Entre eles quem serializa é o
+    lock do SQLite, com espera de busy_timeout. Leitores têm pool próprio.
+    """
+    if not url.startswith("sqlite"):
+        return {}
+    opcoes = {"connect_args": {"check_same_thread": False}}
+    if escrita and _sqlite_em_arquivo(url):
+        opcoes.update(pool_size=1, max_overflow=0)
+    return opcoes
+
+
+def criar_engines(url: str):
+    """Cria (escrita, leitura) síncronos. Fora do SQLite em arquivo a leitura usa o mesmo engine."""
+    escrita = create_engine(url, **opcoes_engine(url, escrita=True))
+    if url.startswith("sqlite"):
+        configurar_sqlite(escrita)
+    if not _sqlite_em_arquivo(url):
+        return escrita, escrita
+    leitura = create_engine(url, **opcoes_engine(url, escrita=False))
+    return escrita, configurar_sqlite(leitura, somente_leitura=True)
+
+
+def criar_async_engines(url: str):
+    """Cria (escrita, leitura) assíncronos, com a mesma divisão de criar_engines."""
+    escrita = create_async_engine(url_async(url), **opcoes_engine(url, escrita=True))
+    if url.startswith("sqlite"):
+        configurar_sqlite(escrita)
+    if not _sqlite_em_arquivo(url):
+        return escrita, escrita
+    leitura = create_async_engine(url_async(url), **opcoes_engine(url, escrita=False))
+    return escrita, configurar_sqlite(leitura, somente_leitura=True)
+
+
+# engine: escrita (coleta, worker, migrações); engine_leitura: consultas.
+# Na API só as migrações usam o engine síncrono; as rotas escrevem pelo async_engine.
+engine, engine_leitura = criar_engines(DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLeitura = sessionmaker(autocommit=False, autoflush=False, bind=engine_leitura)
+
+# Engines assíncronos para as rotas async (listagem, CRUD, stats).
+# Scrapers e scripts continuam nos engines síncronos.
+async_engine, async_engine_leitura = criar_async_engines(DATABASE_URL)
+
+# expire_on_commit=False: os objetos retornados continuam legíveis depois do commit
+# (recarregar atributos expirados fora de um await não é permitido no modo async)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+AsyncSessionLeitura = async_sessionmaker(
+    async_engine_leitura, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 
 Base = declarative_base()
 
@@ -25,3 +123,24 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_db_leitura():
+    """Dependency para rotas que só leem (no SQLite não disputa a conexão de escrita)."""
+    db = SessionLeitura()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """Dependency para injetar sessão assíncrona do banco nas rotas async."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_db_leitura():
+    """Versão assíncrona de get_db_leitura."""
+    async with AsyncSessionLeitura() as db:
+        yield db
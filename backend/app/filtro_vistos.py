@@ -0,0 +1,290 @@
+"""
+Filtro de Bloom persistente dos itens já vistos pelos coletores (Indeed, vagas e
+posts do LinkedIn), para descartar os repetidos antes de qualquer trabalho por item
+(parse, classificação, validação e deduplicação no banco).
+
+O filtro fica num arquivo mapeado em memória (FILTRO_VISTOS_ARQUIVO), compartilhado
+pelos processos dos coletores: ~1,7 MB para 1 milhão de itens com 0,1% de falsos
+positivos. "Não está no filtro" é certeza de item novo; "está" pode ser engano com
+probabilidade FILTRO_VISTOS_FPR (o item é pulado como se já tivesse sido coletado).
+
+Os coletores só consultam o filtro: as chaves dos itens vistos ficam pendentes no
+processo do coletor (adiar_vistos), voltam ao processo principal no ResultadoFonte
+(coleta_paralela) e só entram no filtro depois que as vagas foram gravadas no banco
+(salvar_vagas do worker e do coletar_tudo). Se a gravação falhar, o processo cair ou o
+job voltar à fila, os itens são coletados de novo na próxima execução.
+
+Chaves: link canônico das vagas (chave_link) e texto dos posts (chave_post). O
+filtro não remove itens: quando passa da capacidade, ou para recomeçar, é
+reconstruído a partir dos links do banco (os textos dos posts não ficam no banco;
+os posts voltam a ser parseados uma vez e o banco descarta os repetidos):
+
+    python -m app.filtro_vistos reconstruir
+    python -m app.filtro_vistos info
+"""
+import hashlib
+import math
+import mmap
+import os
+import struct
+from typing import Callable, Iterable, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem trava entre processos
+    fcntl = None
+
+from .fingerprint import canonizar_link
+
+FILTRO_VISTOS = os.getenv("FILTRO_VISTOS", "1") == "1"
+FILTRO_VISTOS_ARQUIVO = os.getenv(
+    "FILTRO_VISTOS_ARQUIVO",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "vistos.bloom"),
+)
+FILTRO_VISTOS_CAPACIDADE = int(os.getenv("FILTRO_VISTOS_CAPACIDADE", "1000000"))
+FILTRO_VISTOS_FPR = float(os.getenv("FILTRO_VISTOS_FPR", "0.001"))
+
+# Cabeçalho: assinatura, versão, número de hashes, bits do vetor, capacidade, itens adicionados
+CABECALHO = struct.Struct("<4sHHQQQ")
+ASSINATURA = b"VBLM"
+VERSAO = 1
+
+
+def dimensionar(capacidade: int, fpr: float) -> tuple[int, int]:
+    """Bits do vetor (múltiplo de 8) e número de hashes para a capacidade e a taxa de falsos positivos."""
+    bits = math.ceil(-capacidade * math.log(fpr) / math.log(2) ** 2)
+    bits = max(64, (bits + 7) // 8 * 8)
+    return bits, max(1, round(bits / capacidade * math.log(2)))
+
+
+class FiltroBloom:
+    """
+    Filtro de Bloom num arquivo mapeado em memória. Se o arquivo não existe, é criado
+    vazio, dimensionado para `capacidade` itens com taxa de falsos positivos `fpr`.
+    """
+
+    def __init__(self, arquivo: str, capacidade: int = FILTRO_VISTOS_CAPACIDADE, fpr: float = FILTRO_VISTOS_FPR):
+        self.arquivo = arquivo
+        if not os.path.exists(arquivo) or os.path.getsize(arquivo) == 0:
+            self._criar(arquivo, capacidade, fpr)
+        self._arquivo = open(arquivo, "r+b")
+        self._mm = mmap.mmap(self._arquivo.fileno(), 0)
+        assinatura, versao, self.hashes, self.bits, self.capacidade, _ = CABECALHO.unpack_from(self._mm)
+        if assinatura != ASSINATURA or versao != VERSAO:
+            self.fechar()
+            raise ValueError(f"{arquivo} não é um filtro de vistos")
+        self.inode = os.fstat(self._arquivo.fileno()).st_ino
+
+    @staticmethod
+    def _criar(arquivo: str, capacidade: int, fpr: float):
+        bits, hashes = dimensionar(capacidade, fpr)
+        os.makedirs(os.path.dirname(arquivo) or ".", exist_ok=True)
+        temporario = f"{arquivo}.{os.getpid()}.tmp"
+        with open(temporario, "wb") as f:
+            f.write(CABECALHO.pack(ASSINATURA, VERSAO, hashes, bits, capacidade, 0))
+            f.truncate(CABECALHO.size + bits // 8)
+        os.replace(temporario, arquivo)
+
+    @property
+    def itens(self) -> int:
+        """Itens adicionados (os que ligaram algum bit; aproximado com vários processos)."""
+        return CABECALHO.unpack_from(self._mm)[5]
+
+    @property
+    def tamanho(self) -> int:
+        """Bytes do arquivo (e do mapeamento)."""
+        return len(self._mm)
+
+    def fpr_estimado(self) -> float:
+        """Taxa de falsos positivos esperada com os itens atuais."""
+        return (1 - math.exp(-self.hashes * self.itens / self.bits)) ** self.hashes
+
+    def _posicoes(self, chave: str):
+        # Hashing duplo: k posições a partir de dois hashes de 64 bits
+        digest = hashlib.blake2b(chave.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        bits = self.bits
+        return [(h1 + i * h2) % bits for i in range(self.hashes)]
+
+    def __contains__(self, chave: str) -> bool:
+        mm = self._mm
+        inicio = CABECALHO.size
+        for p in self._posicoes(chave):
+            if not mm[inicio + (p >> 3)] >> (p & 7) & 1:
+                return False
+        return True
+
+    def adicionar(self, chaves: Iterable[str]) -> int:
+        """Adiciona as chaves e retorna quantas eram novas (travando o arquivo entre processos)."""
+        mm = self._mm
+        inicio = CABECALHO.size
+        novas = 0
+        if fcntl:
+            fcntl.flock(self._arquivo, fcntl.LOCK_EX)
+        try:
+            for chave in chaves:
+                nova = False
+                for p in self._posicoes(chave):
+                    i = inicio + (p >> 3)
+                    bit = 1 << (p & 7)
+                    if not mm[i] & bit:
+                        mm[i] |= bit
+                        nova = True
+                novas += nova
+            if novas:
+                cabecalho = list(CABECALHO.unpack_from(mm))
+                cabecalho[5] += novas
+                CABECALHO.pack_into(mm, 0, *cabecalho)
+        finally:
+            if fcntl:
+                fcntl.flock(self._arquivo, fcntl.LOCK_UN)
+        return novas
+
+    def gravar(self):
+        """Força a escrita no disco (o sistema grava sozinho; útil antes de copiar o arquivo)."""
+        self._mm.flush()
+
+    def fechar(self):
+        self._mm.close()
+        self._arquivo.close()
+
+
+def chave_link(link: Optional[str]) -> Optional[str]:
+    """Chave de uma vaga pelo link canônico (None sem link)."""
+    canonico = canonizar_link(link)
+    return f"link:{canonico}" if canonico else None
+
+
+def chave_post(texto: str) -> str:
+    """Chave de um post pelo texto (o mesmo post relido no feed tem o mesmo texto)."""
+    return f"post:{texto.strip()}"
+
+
+def chaves_da_vaga(vaga: dict) -> list[str]:
+    """Chaves que levaram à vaga: o link e, nas vagas de posts, o texto do post."""
+    chaves = [chave_link(vaga.get("link_vaga"))]
+    if vaga.get("texto_post"):
+        chaves.append(chave_post(vaga["texto_post"]))
+    return [c for c in chaves if c]
+
+
+# Chaves vistas pelos coletores deste processo, ainda não gravadas no filtro
+_pendentes: list[str] = []
+
+
+def adiar_vistos(chaves: Iterable[Optional[str]]):
+    """Guarda as chaves vistas pelo coletor para marcar depois que as vagas forem gravadas."""
+    _pendentes.extend(c for c in chaves if c)
+
+
+def tomar_pendentes() -> list[str]:
+    """Retorna e esvazia as chaves pendentes deste processo (ver adiar_vistos)."""
+    pendentes = list(_pendentes)
+    _pendentes.clear()
+    return pendentes
+
+
+_filtro: Optional[FiltroBloom] = None
+
+
+def filtro_vistos() -> Optional[FiltroBloom]:
+    """Filtro do processo (reaberto se o arquivo foi reconstruído); None se FILTRO_VISTOS=0 ou sem acesso."""
+    global _filtro
+    if not FILTRO_VISTOS:
+        return None
+    try:
+        if _filtro is not None and os.stat(FILTRO_VISTOS_ARQUIVO).st_ino != _filtro.inode:
+            _filtro.fechar()
+            _filtro = None
+        if _filtro is None:
+            _filtro = FiltroBloom(FILTRO_VISTOS_ARQUIVO)
+            if _filtro.itens > _filtro.capacidade:
+                print(f"  Filtro de vistos acima da capacidade ({_filtro.itens} itens, "
+                      f"~{_filtro.fpr_estimado():.2%} de falsos positivos); reconstrua")
+    except (OSError, ValueError) as e:
+        print(f"  Filtro de vistos indisponível: {e}")
+        _filtro = None
+    return _filtro
+
+
+def ja_visto(chave: Optional[str]) -> bool:
+    """True se a chave provavelmente já foi vista; False é certeza de item novo."""
+    filtro = filtro_vistos()
+    return bool(chave) and filtro is not None and chave in filtro
+
+
+def marcar_vistos(chaves: Iterable[Optional[str]]) -> int:
+    """Adiciona as chaves ao filtro (as vazias são ignoradas) e retorna quantas eram novas."""
+    filtro = filtro_vistos()
+    if filtro is None:
+        return 0
+    return filtro.adicionar(c for c in chaves if c)
+
+
+def so_novos(itens: list, chave: Callable = lambda v: chave_link(v["link_vaga"])) -> list:
+    """Os itens fora do filtro (com certeza novos); as chaves deles ficam pendentes (adiar_vistos)."""
+    filtro = filtro_vistos()
+    if filtro is None:
+        novos = itens
+    else:
+        novos = [item for item, c in zip(itens, map(chave, itens)) if not c or c not in filtro]
+        if len(novos) < len(itens):
+            print(f"  Filtro de vistos: {len(itens) - len(novos)} de {len(itens)} já vistos")
+    adiar_vistos(map(chave, novos))
+    return novos
+
+
+def marcar_gravados(chaves: Iterable[str], descartadas: Iterable[dict] = ()) -> int:
+    """
+    Marca no filtro as chaves de uma coleta já gravada no banco, menos as das vagas
+    descartadas (inválidas), que precisam ser coletadas de novo.
+    """
+    fora = {c for vaga in descartadas for c in chaves_da_vaga(vaga)}
+    return marcar_vistos(c for c in chaves if c not in fora)
+
+
+def reconstruir(db, arquivo: str = FILTRO_VISTOS_ARQUIVO, capacidade: int = FILTRO_VISTOS_CAPACIDADE,
+                fpr: float = FILTRO_VISTOS_FPR) -> FiltroBloom:
+    """Recria o filtro com os links das vagas do banco (troca o arquivo de uma vez)."""
+    from . import crud
+
+    capacidade = max(capacidade, 2 * crud.contar_links(db))
+    temporario = f"{arquivo}.novo"
+    if os.path.exists(temporario):
+        os.remove(temporario)
+    filtro = FiltroBloom(temporario, capacidade, fpr)
+    filtro.adicionar(chave_link(link) for link in crud.todos_os_links(db))
+    filtro.gravar()
+    filtro.fechar()
+    os.replace(temporario, arquivo)
+    return FiltroBloom(arquivo, capacidade, fpr)
+
+
+def garantir_filtro(db) -> Optional[FiltroBloom]:
+    """Reconstrói o filtro pelo banco se o arquivo não existe ou passou da capacidade."""
+    if not FILTRO_VISTOS:
+        return None
+    if os.path.exists(FILTRO_VISTOS_ARQUIVO):
+        filtro = filtro_vistos()
+        if filtro is not None and filtro.itens <= filtro.capacidade:
+            return filtro
+    filtro = reconstruir(db)
+    print(f"Filtro de vistos reconstruído: {filtro.itens} links do banco")
+    filtro.fechar()
+    return filtro_vistos()
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "reconstruir":
+        from .database import SessionLocal
+
+        with SessionLocal() as db:
+            filtro = reconstruir(db)
+        print(f"{FILTRO_VISTOS_ARQUIVO}: {filtro.itens} links do banco")
+    else:
+        filtro = FiltroBloom(FILTRO_VISTOS_ARQUIVO)
+    print(f"{filtro.itens} itens, {filtro.bits} bits, {filtro.hashes} hashes, {filtro.tamanho / 2**20:.2f} MB, "
+          f"~{filtro.fpr_estimado():.3%} de falsos positivos")
@@ -0,0 +1,62 @@
+"""
+Impressão digital canônica das vagas, usada para deduplicação no banco.
+
+A vaga é identificada pelo link canônico quando existe; sem link, por título + empresa
+normalizados. Vagas sem link e sem empresa não têm fingerprint (NULL não conflita
+no índice único).
+"""
+import hashlib
+import re
+import unicodedata
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Parâmetros de rastreamento que não mudam a vaga apontada pelo link
+PARAMETROS_IGNORADOS = {
+    "trk", "trackingid", "refid", "lipi", "originalsubdomain", "ebp",
+    "from", "ref", "src", "source", "tk", "advn", "adid",
+}
+
+
+def normalizar_texto(texto: Optional[str]) -> str:
+    """Minúsculas, sem acentos e com pontuação/espaços colapsados."""
+    if not texto:
+        return ""
+    texto = unicodedata.normalize("NFKD", texto)
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    return re.sub(r"[\W_]+", " ", texto.lower()).strip()
+
+
+def canonizar_link(link: Optional[str]) -> Optional[str]:
+    """Normaliza um link: esquema/host em minúsculas, sem fragmento e sem parâmetros de rastreamento."""
+    if not link:
+        return None
+    link = link.strip()
+    partes = urlsplit(link)
+    if not partes.netloc:
+        return link.lower()
+
+    host = partes.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+
+    parametros = sorted(
+        (chave, valor)
+        for chave, valor in parse_qsl(partes.query, keep_blank_values=False)
+        if chave.lower() not in PARAMETROS_IGNORADOS and not chave.lower().startswith("utm_")
+    )
+
+    caminho = partes.path.rstrip("/") or "/"
+    return urlunsplit(("https", host, caminho, urlencode(parametros), ""))
+
+
+def gerar_fingerprint(titulo: Optional[str], empresa: Optional[str], link_vaga: Optional[str]) -> Optional[str]:
+    """Retorna o hash SHA-256 (hex) da chave canônica da vaga, ou None se não houver chave."""
+    link = canonizar_link(link_vaga)
+    if link:
+        chave = f"link:{link}"
+    elif titulo and empresa:
+        chave = f"vaga:{normalizar_texto(titulo)}|{normalizar_texto(empresa)}"
+    else:
+        return None
+    return hashlib.sha256(chave.encode("utf-8")).hexdigest()
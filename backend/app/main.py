@@ -1,20 +1,32 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import os
 
-from .database import engine, Base
+from .database import engine
+from .migrations import aplicar_migracoes
 from .api import vagas, stats, scraper
 
 # Criar diretório data se não existir
 os.makedirs("data", exist_ok=True)
 
-# Criar tabelas no banco
-Base.metadata.create_all(bind=engine)
+# O gunicorn.conf.py migra no processo mestre e desliga a migração dos workers
+MIGRAR_NA_INICIALIZACAO = os.getenv("MIGRAR_NA_INICIALIZACAO", "1") == "1"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Criar tabelas e migrar (uvicorn direto); fora do import, para não rodar em cada import do app
+    if MIGRAR_NA_INICIALIZACAO:
+        aplicar_migracoes(engine)
+    yield
+
 
 app = FastAPI(
     title="Vagas UX Platform API",
     description="API para gerenciamento de vagas de UX/Product Design",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS para permitir frontend local e produção
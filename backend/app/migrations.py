@@ -0,0 +1,161 @@
+"""
+Migrações simples do esquema, aplicadas na inicialização da API e da coleta.
+
+O projeto não usa Alembic: create_all cria as tabelas novas e aqui ficam as
+alterações em tabelas que já existem (colunas, índices e backfills).
+Todas são idempotentes. No Postgres rodam sob um pg_advisory_lock (trava_migracoes):
+os workers do gunicorn, o worker da coleta e o coletar_tudo podem subir ao mesmo
+tempo e só um verifica e altera o esquema por vez. Com o gunicorn elas rodam uma vez,
+no processo mestre, antes dos workers (gunicorn.conf.py).
+
+Uso manual:
+    python -m app.migrations
+    python -m app.migrations --reconstruir-stats
+"""
+from contextlib import contextmanager
+
+from sqlalchemy import bindparam, inspect, select, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from . import crud, models
+from .busca import criar_indice_busca
+from .database import Base
+from .fingerprint import gerar_fingerprint
+
+
+# Chave do pg_advisory_lock das migrações (qualquer inteiro fixo do projeto)
+TRAVA_MIGRACOES = 7_245_071
+
+
+@contextmanager
+def trava_migracoes(engine: Engine):
+    """No Postgres, segura o pg_advisory_lock das migrações (espera quem estiver migrando)."""
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+    with engine.connect() as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:chave)"), {"chave": TRAVA_MIGRACOES})
+        conn.commit()  # a trava é da sessão: não precisa da transação aberta
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:chave)"), {"chave": TRAVA_MIGRACOES})
+            conn.commit()
+
+
+def _adicionar_coluna(conn, tabela: str, nome: str, tipo: str):
+    # IF NOT EXISTS só no Postgres (o SQLite não aceita em ADD COLUMN)
+    se_nao_existe = "IF NOT EXISTS " if conn.dialect.name == "postgresql" else ""
+    conn.execute(text(f"ALTER TABLE {tabela} ADD COLUMN {se_nao_existe}{nome} {tipo}"))
+
+
+def _colunas(conn, tabela: str) -> set[str]:
+    return {c["name"] for c in inspect(conn).get_columns(tabela)}
+
+
+def _indices(conn, tabela: str) -> set[str]:
+    return {i["name"] for i in inspect(conn).get_indexes(tabela)}
+
+
+def migrar_fingerprint(engine: Engine):
+    """Adiciona a coluna fingerprint, preenche as vagas existentes e cria o índice único."""
+    tabela = models.Vaga.__table__
+
+    with engine.begin() as conn:
+        if "idx_fingerprint" in _indices(conn, "vagas"):
+            return
+
+        if "fingerprint" not in _colunas(conn, "vagas"):
+            _adicionar_coluna(conn, "vagas", "fingerprint", "VARCHAR(64)")
+
+        vistos = set(conn.scalars(select(tabela.c.fingerprint).where(tabela.c.fingerprint.isnot(None))))
+        atualizacoes = []
+        linhas = conn.execute(
+            select(tabela.c.id, tabela.c.titulo, tabela.c.empresa, tabela.c.link_vaga)
+            .where(tabela.c.fingerprint.is_(None))
+            .order_by(tabela.c.id)
+        )
+        for vaga_id, titulo, empresa, link_vaga in linhas:
+            fingerprint = gerar_fingerprint(titulo, empresa, link_vaga)
+            # Duplicatas antigas ficam sem fingerprint: a mais antiga vira a canônica
+            if fingerprint and fingerprint not in vistos:
+                vistos.add(fingerprint)
+                atualizacoes.append({"b_id": vaga_id, "b_fingerprint": fingerprint})
+
+        if atualizacoes:
+            conn.execute(
+                update(tabela)
+                .where(tabela.c.id == bindparam("b_id"))
+                .values(fingerprint=bindparam("b_fingerprint")),
+                atualizacoes,
+            )
+            print(f"Fingerprint preenchido em {len(atualizacoes)} vagas")
+
+        for indice in tabela.indexes:
+            if indice.name == "idx_fingerprint":
+                indice.create(conn, checkfirst=True)
+
+
+# Colunas adicionadas a vagas depois da criação da tabela: (nome, tipo SQL)
+COLUNAS_NOVAS_VAGAS = [
+    ("simhash", "BIGINT"),
+    ("simhash_banda_0", "INTEGER"),
+    ("simhash_banda_1", "INTEGER"),
+    ("simhash_banda_2", "INTEGER"),
+    ("simhash_banda_3", "INTEGER"),
+    ("vaga_canonica_id", "INTEGER"),
+]
+
+
+def adicionar_colunas_faltantes(engine: Engine):
+    """Adiciona a vagas as colunas novas (nulas; vagas antigas não têm o texto do post para assinar)."""
+    with engine.begin() as conn:
+        existentes = _colunas(conn, "vagas")
+        for nome, tipo in COLUNAS_NOVAS_VAGAS:
+            if nome not in existentes:
+                _adicionar_coluna(conn, "vagas", nome, tipo)
+
+
+def criar_indices_faltantes(engine: Engine):
+    """Cria os índices declarados nos modelos que ainda não existem no banco."""
+    with engine.begin() as conn:
+        for tabela in Base.metadata.sorted_tables:
+            existentes = _indices(conn, tabela.name)
+            for indice in tabela.indexes:
+                if indice.name not in existentes:
+                    indice.create(conn)
+
+
+def migrar_stats(engine: Engine):
+    """Preenche vagas_stats quando a tabela de contadores é nova num banco que já tem vagas."""
+    with Session(engine) as db:
+        if db.query(models.VagaStat.faceta).first() is None and db.query(models.Vaga.id).first() is not None:
+            crud.reconstruir_stats(db)
+            print("Contadores de vagas_stats reconstruídos")
+
+
+def aplicar_migracoes(engine: Engine):
+    """Cria as tabelas que faltam e aplica todas as migrações pendentes (um processo por vez)."""
+    with trava_migracoes(engine):
+        Base.metadata.create_all(bind=engine)
+        migrar_fingerprint(engine)
+        adicionar_colunas_faltantes(engine)
+        criar_indices_faltantes(engine)
+        migrar_stats(engine)
+        criar_indice_busca(engine)
+
+
+if __name__ == "__main__":
+    import argparse
+    from .database import engine
+
+    parser = argparse.ArgumentParser(description="Aplica as migrações do banco")
+    parser.add_argument("--reconstruir-stats", action="store_true", help="Recalcula a tabela vagas_stats")
+    args = parser.parse_args()
+
+    aplicar_migracoes(engine)
+    if args.reconstruir_stats:
+        with Session(engine) as db:
+            crud.reconstruir_stats(db)
+    print("Migrações aplicadas")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Index
+from sqlalchemy import Column, BigInteger, Integer, JSON, String, Text, Date, DateTime, Index
 from sqlalchemy.sql import func
 from .database import Base
 
@@ -22,6 +22,13 @@ class Vaga(Base):
     data_coleta = Column(Date, nullable=False)
     status = Column(String(20), default="pendente")  # 'pendente', 'aplicada', 'descartada'
     observacoes = Column(Text)
+    fingerprint = Column(String(64))  # Hash do link canônico ou de título + empresa (ver app/fingerprint.py)
+    simhash = Column(BigInteger)  # Assinatura do texto do post, para quase-duplicatas (ver app/simhash.py)
+    simhash_banda_0 = Column(Integer)
+    simhash_banda_1 = Column(Integer)
+    simhash_banda_2 = Column(Integer)
+    simhash_banda_3 = Column(Integer)
+    vaga_canonica_id = Column(Integer)  # Vaga original quando esta é uma quase-duplicata vinculada
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
@@ -29,8 +36,59 @@ class Vaga(Base):
         Index("idx_fonte", "fonte"),
         Index("idx_status", "status"),
         Index("idx_data_coleta", "data_coleta"),
+        Index("idx_data_coleta_id", "data_coleta", "id"),  # Paginação por cursor
         Index("idx_modalidade", "modalidade"),
+        Index("idx_fingerprint", "fingerprint", unique=True),
+        Index("idx_link_vaga", "link_vaga"),  # filtrar_duplicatas / check_duplicate
+        Index("idx_titulo_empresa", "titulo", "empresa"),
+        Index("idx_simhash_banda_0", "simhash_banda_0"),
+        Index("idx_simhash_banda_1", "simhash_banda_1"),
+        Index("idx_simhash_banda_2", "simhash_banda_2"),
+        Index("idx_simhash_banda_3", "simhash_banda_3"),
     )
 
     def __repr__(self):
         return f"<Vaga(id={self.id}, titulo='{self.titulo}', empresa='{self.empresa}')>"
+
+
+class VagaStat(Base):
+    """Contadores de estatísticas por faceta, mantidos pelo crud a cada escrita em vagas."""
+    __tablename__ = "vagas_stats"
+
+    faceta = Column(String(20), primary_key=True)  # 'total', 'fonte', 'status', 'modalidade', 'tipo_vaga', 'data_coleta'
+    valor = Column(String(50), primary_key=True)  # Valor da faceta ('' para o total, data ISO para data_coleta)
+    total = Column(Integer, nullable=False, default=0)
+
+
+# Status de job que ainda não terminou (no máximo um job ativo por chave)
+STATUS_JOB_ATIVOS = ("pendente", "executando")
+
+
+class JobColeta(Base):
+    """Job de coleta enfileirado pela API e executado pelo worker (app/scrapers/worker.py)."""
+    __tablename__ = "jobs_coleta"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    chave = Column(String(100), nullable=False)  # Fontes ordenadas, ex.: 'indeed,linkedin_jobs'
+    status = Column(String(20), nullable=False, default="pendente")  # 'pendente', 'executando', 'concluido', 'erro'
+    progresso = Column(JSON, nullable=False, default=dict)  # {fonte: {status, coletadas, novas, ignoradas, erro}}
+    erro = Column(Text)
+    worker = Column(String(100))  # Identificação do worker que pegou o job
+    created_at = Column(DateTime, server_default=func.now())
+    iniciado_em = Column(DateTime)
+    heartbeat_em = Column(DateTime)  # Atualizado durante a execução; jobs parados são devolvidos à fila
+    finalizado_em = Column(DateTime)
+
+    __table_args__ = (
+        # Coalescência: dois jobs iguais não ficam ativos ao mesmo tempo
+        Index(
+            "idx_jobs_coleta_chave_ativo", "chave", unique=True,
+            sqlite_where=status.in_(STATUS_JOB_ATIVOS),
+            postgresql_where=status.in_(STATUS_JOB_ATIVOS),
+        ),
+        Index("idx_jobs_coleta_status", "status", "id"),
+    )
+
+    @property
+    def fontes(self) -> list[str]:
+        return self.chave.split(",")
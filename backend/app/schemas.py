@@ -56,7 +56,8 @@ class VagaBase(BaseModel):
 
 
 class VagaCreate(VagaBase):
-    pass
+    # Texto completo do post, usado só para detectar quase-duplicatas (não é gravado)
+    texto_post: Optional[str] = Field(None, exclude=True)
 
 
 class VagaUpdate(BaseModel):
@@ -84,8 +85,9 @@ class VagaResponse(VagaBase):
 
 
 class VagaListResponse(BaseModel):
-    total: int
+    total: Optional[int] = None  # None quando include_total=false
     vagas: list[VagaResponse]
+    next_cursor: Optional[str] = None  # Cursor opaco da próxima página (None na última)
 
 
 class StatsResponse(BaseModel):
@@ -95,3 +97,39 @@ class StatsResponse(BaseModel):
     por_modalidade: dict[str, int]
     por_tipo_vaga: dict[str, int]
     ultimas_24h: int
+
+
+class StatusJobEnum(str, Enum):
+    pendente = "pendente"
+    executando = "executando"
+    concluido = "concluido"
+    erro = "erro"
+
+
+class ProgressoFonte(BaseModel):
+    status: StatusJobEnum = StatusJobEnum.pendente
+    coletadas: int = 0
+    novas: int = 0
+    ignoradas: int = 0
+    segundos: Optional[float] = None  # Duração da coleta da fonte
+    erro: Optional[str] = None
+
+
+class JobColetaResponse(BaseModel):
+    id: int
+    fontes: list[FonteEnum]
+    status: StatusJobEnum
+    progresso: dict[str, ProgressoFonte]
+    erro: Optional[str] = None
+    created_at: Optional[datetime] = None
+    iniciado_em: Optional[datetime] = None
+    finalizado_em: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class JobColetaCriado(BaseModel):
+    job_id: int
+    status: StatusJobEnum
+    coalescido: bool  # True se já havia um job igual ativo (o id é o dele)
@@ -0,0 +1,96 @@
+"""
+Eventos do Chrome DevTools Protocol (CDP) lidos pelo Selenium.
+
+O Selenium só faz comandos CDP (execute_cdp_cmd); os eventos (Network.*, Page.*) chegam
+pelo log de performance do chromedriver, ligado com habilitar_eventos(options) ao criar
+o driver. driver.get_log("performance") esvazia o log, então quem precisa de eventos
+se inscreve no registro único do driver e o registro distribui:
+
+    registro = registro_cdp(driver)
+    registro.ouvir("Network.responseReceived", lambda params: ...)
+    registro.drenar()
+"""
+import json
+import time
+import weakref
+from collections import defaultdict
+from typing import Callable
+
+_registros: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def habilitar_eventos(options):
+    """Liga o log de performance (eventos CDP de rede e página) nas opções do Chrome."""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+class RegistroCDP:
+    """Lê o log de performance de um driver e repassa cada evento aos ouvintes do método."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.disponivel = True
+        self._ouvintes: dict[str, list[Callable]] = defaultdict(list)
+
+    def ouvir(self, metodo: str, callback: Callable[[dict], None]) -> Callable[[], None]:
+        """Inscreve callback(params) no evento (ou "*" para todos); retorna a função que desinscreve."""
+        self._ouvintes[metodo].append(callback)
+        return lambda: self._ouvintes[metodo].remove(callback)
+
+    def drenar(self) -> int:
+        """Lê os eventos pendentes e os repassa aos ouvintes. Retorna quantos foram lidos."""
+        if not self.disponivel:
+            return 0
+        try:
+            entradas = self.driver.get_log("performance")
+        except Exception:
+            # Driver criado sem habilitar_eventos (ou navegador sem suporte)
+            self.disponivel = False
+            return 0
+
+        for entrada in entradas:
+            try:
+                mensagem = json.loads(entrada["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            params = mensagem.get("params", {})
+            for callback in self._ouvintes.get(mensagem.get("method"), []) + self._ouvintes.get("*", []):
+                callback(params)
+        return len(entradas)
+
+
+def registro_cdp(driver) -> RegistroCDP:
+    """Registro único do driver (o do pool, DriverMonitorado, usa o do driver real)."""
+    driver = getattr(driver, "_driver", driver)
+    if driver not in _registros:
+        _registros[driver] = RegistroCDP(driver)
+    return _registros[driver]
+
+
+class MonitorRede:
+    """Requisições em andamento, a partir de Network.requestWillBeSent / loadingFinished / loadingFailed."""
+
+    def __init__(self, registro: RegistroCDP):
+        self.registro = registro
+        self.pendentes: set[str] = set()
+        self.ultimo_evento = time.monotonic()
+        registro.ouvir("Network.requestWillBeSent", self._inicio)
+        registro.ouvir("Network.loadingFinished", self._fim)
+        registro.ouvir("Network.loadingFailed", self._fim)
+
+    def _inicio(self, params: dict):
+        self.pendentes.add(params.get("requestId"))
+        self.ultimo_evento = time.monotonic()
+
+    def _fim(self, params: dict):
+        self.pendentes.discard(params.get("requestId"))
+        self.ultimo_evento = time.monotonic()
+
+
+def monitor_rede(driver) -> MonitorRede:
+    """Monitor de rede do driver (criado na primeira chamada)."""
+    registro = registro_cdp(driver)
+    if not hasattr(registro, "monitor_rede"):
+        registro.monitor_rede = MonitorRede(registro)
+    return registro.monitor_rede
@@ -0,0 +1,203 @@
+"""
+Classificação por termos compartilhada pelos coletores: vaga de produto ou não, tipo
+da vaga e modalidade, a partir do título (Indeed, vagas do LinkedIn) ou do texto do
+post.
+
+Todos os termos ficam num único autômato de Aho-Corasick (pyahocorasick) que acha
+todas as ocorrências, inclusive as sobrepostas, numa passada pelo texto (sem a
+biblioteca, um `in` por termo). As regras
+saem do conjunto de termos encontrados (termos_encontrados), calculado uma vez por
+texto e reaproveitado entre eh_vaga_produto e classificar_tipo_vaga (ou
+eh_post_produto, classificar_tipo_post e classificar_modalidade).
+
+Em lote (classificar_titulos, classificar_posts) os textos são unidos e percorridos
+numa passada só.
+"""
+import bisect
+from functools import lru_cache
+from typing import Iterable, Optional
+
+try:
+    import ahocorasick
+except ImportError:  # um `in` por termo (em textos longos, mais rápido que uma regex com todos os termos)
+    ahocorasick = None
+
+# Termos para filtrar vagas de produto (aceitar)
+TERMOS_PRODUTO = [
+    "product designer", "product design", "product manager", "ux designer", "ui designer",
+    "ux/ui", "ui/ux", "service designer", "head de produto", "product owner",
+    "product operations", "design de produto", "designer de produto",
+]
+
+# Posts: os mesmos e os anúncios informais de vaga
+TERMOS_PRODUTO_POSTS = TERMOS_PRODUTO + [
+    "vaga de ux", "vaga ux", "vaga product", "vaga designer", "oportunidade ux", "oportunidade product",
+    "ux research", "ux researcher", "design ops", "designops",
+]
+
+# Termos para excluir (não são vagas de produto)
+TERMOS_EXCLUIR = [
+    "developer", "desenvolvedor", "engineer", "engenheiro", "qa", "tester",
+    "analista de dados", "data analyst", "designer gráfico", "graphic designer",
+    "marketing", "growth", "devops", "backend", "frontend", "fullstack",
+]
+
+# Usados só nas regras de tipo e modalidade
+TERMOS_REGRAS = ["head", "produto", "ux", "remoto", "remote", "híbrido", "hibrido", "presencial"]
+
+# Post que pede para entrar em contato com o autor
+TERMOS_CONTATO = [
+    "entre em contato", "entrar em contato", "mande mensagem", "envie mensagem",
+    "fale com", "falar com", "dm", "inbox", "chama no", "me chama",
+    "entre em contacto", "manda msg", "manda mensagem",
+]
+
+# Palavras que os padrões de título dos posts exigem (extracao_posts)
+TERMOS_CARGO = ["vaga", "oportunidade", "contratando", "hiring", "designer", "ux research", "product manager",
+                "product owner"]
+
+# Não aparece em nenhum termo: separa os textos de um lote
+SEPARADOR = "\x00"
+
+_PRODUTO = frozenset(TERMOS_PRODUTO)
+_PRODUTO_POSTS = frozenset(TERMOS_PRODUTO_POSTS)
+_EXCLUIR = frozenset(TERMOS_EXCLUIR)
+_CONTATO = frozenset(TERMOS_CONTATO)
+
+
+class Automato:
+    """Acha todos os termos presentes num texto (já em minúsculas)."""
+
+    def __init__(self, termos: Iterable[str], usar_ahocorasick: bool = True):
+        self.termos = sorted(set(termos))
+        self.ahocorasick = usar_ahocorasick and ahocorasick is not None
+        if self.ahocorasick:
+            self._automato = ahocorasick.Automaton()
+            for termo in self.termos:
+                self._automato.add_word(termo, termo)
+            self._automato.make_automaton()
+
+    def encontrar(self, texto: str) -> frozenset:
+        if self.ahocorasick:
+            return frozenset(termo for _, termo in self._automato.iter(texto))
+        return frozenset(termo for termo in self.termos if termo in texto)
+
+    def encontrar_em_lote(self, textos: list[str]) -> list[frozenset]:
+        """Termos de cada texto, numa passada pelos textos unidos."""
+        if not self.ahocorasick:
+            return [self.encontrar(texto) for texto in textos]
+        fins = []
+        posicao = -1
+        for texto in textos:
+            posicao += len(texto) + len(SEPARADOR)
+            fins.append(posicao)
+        achados = [set() for _ in textos]
+        for fim, termo in self._automato.iter(SEPARADOR.join(textos)):
+            achados[bisect.bisect_left(fins, fim)].add(termo)
+        return [frozenset(a) for a in achados]
+
+
+AUTOMATO = Automato(TERMOS_PRODUTO_POSTS + TERMOS_EXCLUIR + TERMOS_REGRAS + TERMOS_CONTATO + TERMOS_CARGO)
+
+
+@lru_cache(maxsize=1024)
+def termos_encontrados(texto: str) -> frozenset:
+    """Termos presentes no texto (sem diferenciar maiúsculas)."""
+    return AUTOMATO.encontrar(texto.lower())
+
+
+def termos_em_lote(textos: list[str]) -> list[frozenset]:
+    return AUTOMATO.encontrar_em_lote([t.lower() for t in textos])
+
+
+# Regras sobre os termos encontrados (para quem já tem o conjunto, como extracao_posts)
+
+def vaga_produto_nos_termos(achados: frozenset) -> bool:
+    return achados.isdisjoint(_EXCLUIR) and not achados.isdisjoint(_PRODUTO)
+
+
+def post_produto_nos_termos(achados: frozenset) -> bool:
+    return not achados.isdisjoint(_PRODUTO_POSTS)
+
+
+def pede_contato_nos_termos(achados: frozenset) -> bool:
+    return not achados.isdisjoint(_CONTATO)
+
+
+def tipo_vaga_dos_termos(achados: frozenset) -> str:
+    if "product manager" in achados or "product owner" in achados:
+        return "Product Manager"
+    elif "head" in achados and "produto" in achados:
+        return "Head de Produto"
+    elif "service designer" in achados:
+        return "Service Designer"
+    elif "ui/ux" in achados or "ux/ui" in achados:
+        return "UX/UI Designer"
+    elif "ui designer" in achados:
+        return "UI Designer"
+    elif "ux" in achados:
+        return "UX Designer"
+    return "Product Designer"
+
+
+def tipo_post_dos_termos(achados: frozenset) -> str:
+    if "product manager" in achados or "product owner" in achados:
+        return "Product Manager"
+    elif "ux/ui" in achados or "ui/ux" in achados:
+        return "UX/UI Designer"
+    elif "ux designer" in achados:
+        return "UX Designer"
+    elif "ui designer" in achados:
+        return "UI Designer"
+    return "Product Designer"
+
+
+def modalidade_dos_termos(achados: frozenset) -> str:
+    if "remoto" in achados or "remote" in achados:
+        return "remoto"
+    elif "híbrido" in achados or "hibrido" in achados:
+        return "hibrido"
+    elif "presencial" in achados:
+        return "presencial"
+    return "nao_especificado"
+
+
+def eh_vaga_produto(titulo: str) -> bool:
+    """Verifica se o título é uma vaga de produto."""
+    return vaga_produto_nos_termos(termos_encontrados(titulo))
+
+
+def classificar_tipo_vaga(titulo: str) -> str:
+    """Classifica o tipo da vaga baseado no título."""
+    return tipo_vaga_dos_termos(termos_encontrados(titulo))
+
+
+def eh_post_produto(texto: str) -> bool:
+    """O post fala de vaga de produto (algum termo de TERMOS_PRODUTO_POSTS)."""
+    return post_produto_nos_termos(termos_encontrados(texto))
+
+
+def classificar_tipo_post(texto: str) -> str:
+    return tipo_post_dos_termos(termos_encontrados(texto))
+
+
+def classificar_modalidade(texto: str) -> str:
+    return modalidade_dos_termos(termos_encontrados(texto))
+
+
+def pede_contato(texto: str) -> bool:
+    """Verifica se o texto pede explicitamente para entrar em contato."""
+    return pede_contato_nos_termos(termos_encontrados(texto))
+
+
+def classificar_titulos(titulos: list[str]) -> list[Optional[str]]:
+    """Tipo da vaga de cada título, ou None se não for vaga de produto."""
+    return [tipo_vaga_dos_termos(a) if vaga_produto_nos_termos(a) else None for a in termos_em_lote(titulos)]
+
+
+def classificar_posts(textos: list[str]) -> list[Optional[tuple[str, str]]]:
+    """(tipo, modalidade) de cada post, ou None se não for de vaga de produto."""
+    return [
+        (tipo_post_dos_termos(a), modalidade_dos_termos(a)) if post_produto_nos_termos(a) else None
+        for a in termos_em_lote(textos)
+    ]
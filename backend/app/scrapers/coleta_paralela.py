@@ -0,0 +1,118 @@
+"""
+Execução das fontes de coleta em sequência ou em paralelo.
+
+No modo paralelo cada fonte roda no seu próprio processo, com o seu próprio Chrome;
+as fontes do LinkedIn usam cópias do perfil logado (o Chrome não abre o mesmo
+perfil duas vezes). Os resultados voltam ao processo principal na ordem em que as
+fontes terminam, e só ele grava as vagas no banco. As chaves do filtro de
+vistos voltam junto (ResultadoFonte.vistos) e só são marcadas depois da gravação.
+"""
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, NamedTuple, Optional
+
+from app.filtro_vistos import tomar_pendentes
+from .indeed import coletar_vagas_indeed
+from .indeed_async import coletar_vagas_indeed_async
+from .indeed_http import INDEED_HTTP
+from .linkedin_api import LINKEDIN_EXTRACAO, coletar_vagas_linkedin_api, coletar_vagas_linkedin_posts_api
+from .linkedin_jobs import coletar_vagas_linkedin
+from .linkedin_posts import coletar_vagas_linkedin_posts
+from .esperas import HISTORICO
+from .login_helper import copiar_perfil
+from .modo_leve import imprimir_economia, iniciar_economia
+
+FONTES = ("indeed", "linkedin_jobs", "linkedin_posts")
+
+# Fontes que abrem o Chrome com o perfil persistente (PROFILE_DIR)
+FONTES_COM_PERFIL = {"linkedin_jobs", "linkedin_posts"}
+
+# Processos da coleta paralela (1 = sequencial)
+COLETA_PARALELO = int(os.getenv("COLETA_PARALELO", "1"))
+
+
+class ResultadoFonte(NamedTuple):
+    fonte: str
+    vagas: list[dict]
+    segundos: float
+    erro: Optional[str] = None
+    # Chaves do filtro de vistos (filtro_vistos.adiar_vistos), a marcar depois de gravar as vagas
+    vistos: tuple = ()
+
+
+def coletar_fonte(fonte: str, headless: bool = False, profile_dir: Optional[str] = None, driver=None) -> list[dict]:
+    """Executa o coletor da fonte (com a sessão `driver` do pool, se informada)."""
+    if fonte == "indeed":
+        if INDEED_HTTP and driver is None:
+            return coletar_vagas_indeed_async()
+        return coletar_vagas_indeed(driver=driver)
+    if fonte == "linkedin_jobs":
+        if LINKEDIN_EXTRACAO == "api":
+            return coletar_vagas_linkedin_api(headless=headless, profile_dir=profile_dir, driver=driver)
+        return coletar_vagas_linkedin(headless=headless, profile_dir=profile_dir, driver=driver)
+    if fonte == "linkedin_posts":
+        if LINKEDIN_EXTRACAO == "api":
+            return coletar_vagas_linkedin_posts_api(headless=headless, profile_dir=profile_dir, driver=driver)
+        return coletar_vagas_linkedin_posts(headless=headless, profile_dir=profile_dir, driver=driver)
+    raise ValueError(f"Fonte desconhecida: {fonte}")
+
+
+def _executar_fonte(fonte: str, headless: bool, copiar: bool, pool=None) -> ResultadoFonte:
+    """
+    Coleta uma fonte medindo o tempo.
+
+    Com copiar=True usa uma cópia descartável do perfil; com pool usa uma sessão do pool.
+    """
+    inicio = time.perf_counter()
+    tomar_pendentes()  # sobras de uma coleta anterior neste processo
+    iniciar_economia(fonte)
+    HISTORICO.nova_execucao()
+    profile_dir = copiar_perfil() if copiar and fonte in FONTES_COM_PERFIL else None
+    try:
+        if fonte == "indeed" and INDEED_HTTP:
+            # Só pega um Chrome do pool se o HTTP não bastar
+            vagas = coletar_vagas_indeed_async(pool=pool)
+        elif pool is not None:
+            with pool.obter() as driver:
+                vagas = coletar_fonte(fonte, headless, driver=driver)
+        else:
+            vagas = coletar_fonte(fonte, headless, profile_dir)
+        return ResultadoFonte(fonte, vagas, time.perf_counter() - inicio, vistos=tuple(tomar_pendentes()))
+    except Exception as e:
+        tomar_pendentes()
+        return ResultadoFonte(fonte, [], time.perf_counter() - inicio, str(e))
+    finally:
+        if profile_dir:
+            shutil.rmtree(os.path.dirname(profile_dir), ignore_errors=True)
+        # Quanto cada espera levou (e o histórico para as próximas execuções)
+        HISTORICO.imprimir_resumo()
+        HISTORICO.salvar()
+        imprimir_economia(fonte)
+
+
+def coletar_fontes(
+    fontes, paralelo: int = COLETA_PARALELO, headless: bool = False, pools: Optional[dict] = None
+) -> Iterator[ResultadoFonte]:
+    """
+    Coleta as fontes e gera um ResultadoFonte por fonte, na ordem em que terminam.
+
+    Com paralelo > 1 usa até esse número de processos; o tempo total tende ao da fonte
+    mais lenta em vez da soma. Com paralelo = 1 roda em sequência no próprio processo,
+    usando o perfil original ou, se houver, a sessão quente de pools[fonte] (ver driver_pool).
+    """
+    fontes = list(fontes)
+    pools = pools or {}
+    if paralelo <= 1 or len(fontes) <= 1:
+        for fonte in fontes:
+            yield _executar_fonte(fonte, headless, copiar=False, pool=pools.get(fonte))
+        return
+
+    with ProcessPoolExecutor(max_workers=min(paralelo, len(fontes))) as processos:
+        futuros = {processos.submit(_executar_fonte, fonte, headless, True): fonte for fonte in fontes}
+        for futuro in as_completed(futuros):
+            try:
+                yield futuro.result()
+            except Exception as e:  # processo filho morreu (ex.: falta de memória)
+                yield ResultadoFonte(futuros[futuro], [], 0.0, str(e))
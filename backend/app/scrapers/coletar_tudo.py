@@ -10,86 +10,79 @@ import os
 # Adiciona o diretório raiz ao path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+import time
 from datetime import datetime
-from app.database import SessionLocal, engine, Base
+from app.database import SessionLocal, engine
 from app import crud, schemas
-from app.scrapers.indeed import coletar_vagas_indeed
-from app.scrapers.linkedin_jobs import coletar_vagas_linkedin
-from app.scrapers.linkedin_posts import coletar_vagas_linkedin_posts
+from app.filtro_vistos import garantir_filtro, marcar_gravados
+from app.migrations import aplicar_migracoes
+from app.scrapers.coleta_paralela import COLETA_PARALELO, FONTES, coletar_fontes
 
+TITULOS = {
+    "indeed": "📋 INDEED",
+    "linkedin_jobs": "💼 LINKEDIN VAGAS",
+    "linkedin_posts": "📝 LINKEDIN PUBLICAÇÕES",
+}
 
-def salvar_vagas(db, vagas: list[dict], fonte: str) -> int:
-    """Salva vagas no banco, retorna quantidade de novas."""
-    novas = 0
+
+def salvar_vagas(db, vagas: list[dict], fonte: str, vistos=()) -> int:
+    """Salva vagas no banco, retorna quantidade de novas. Depois marca `vistos` no filtro de vistos."""
+    validas = []
+    invalidas = []
     for vaga_dict in vagas:
         try:
-            if not crud.check_duplicate(db, vaga_dict.get("titulo"), vaga_dict.get("empresa"), vaga_dict.get("link_vaga")):
-                vaga = schemas.VagaCreate(**vaga_dict)
-                crud.create_vaga(db, vaga)
-                novas += 1
+            validas.append(schemas.VagaCreate(**vaga_dict))
         except Exception as e:
+            invalidas.append(vaga_dict)
             print(f"  Erro ao salvar: {e}")
-    return novas
+
+    novas = crud.filtrar_duplicatas(db, validas)
+    inseridas = crud.inserir_vagas_ignorando_duplicatas(db, novas)["inseridas"]
+    marcar_gravados(vistos, invalidas)
+    return inseridas
 
 
-def coletar_tudo(mostrar_janela: bool = True):
+def coletar_tudo(mostrar_janela: bool = True, paralelo: int = COLETA_PARALELO):
     """
     Executa coleta de todas as fontes.
 
     Args:
         mostrar_janela: Se True, mostra o navegador (usa sessões do usuário).
                        Se False, roda headless (pode não ter login).
+        paralelo: Quantas fontes coletar ao mesmo tempo, cada uma no seu processo
+                  e Chrome (1 = uma depois da outra).
     """
     print("=" * 60)
     print(f"COLETA DE VAGAS - {datetime.now().strftime('%d/%m/%Y %H:%M')}")
+    if paralelo > 1:
+        print(f"Modo paralelo: até {paralelo} fontes ao mesmo tempo")
     print("=" * 60)
 
     # Garante que as tabelas existem
-    Base.metadata.create_all(bind=engine)
+    aplicar_migracoes(engine)
     db = SessionLocal()
+    garantir_filtro(db)
 
-    resultados = {
-        "indeed": {"coletadas": 0, "novas": 0, "erro": None},
-        "linkedin_jobs": {"coletadas": 0, "novas": 0, "erro": None},
-        "linkedin_posts": {"coletadas": 0, "novas": 0, "erro": None},
-    }
+    resultados = {fonte: {"coletadas": 0, "novas": 0, "erro": None, "segundos": 0.0} for fonte in FONTES}
+    inicio = time.perf_counter()
 
     try:
-        # 1. Indeed (não precisa de login)
-        print("\n📋 INDEED")
-        print("-" * 40)
-        try:
-            vagas_indeed = coletar_vagas_indeed()
-            resultados["indeed"]["coletadas"] = len(vagas_indeed)
-            resultados["indeed"]["novas"] = salvar_vagas(db, vagas_indeed, "indeed")
-            print(f"✓ {resultados['indeed']['coletadas']} coletadas, {resultados['indeed']['novas']} novas")
-        except Exception as e:
-            resultados["indeed"]["erro"] = str(e)
-            print(f"✗ Erro: {e}")
-
-        # 2. LinkedIn Vagas
-        print("\n💼 LINKEDIN VAGAS")
-        print("-" * 40)
-        try:
-            vagas_linkedin = coletar_vagas_linkedin(headless=not mostrar_janela)
-            resultados["linkedin_jobs"]["coletadas"] = len(vagas_linkedin)
-            resultados["linkedin_jobs"]["novas"] = salvar_vagas(db, vagas_linkedin, "linkedin_jobs")
-            print(f"✓ {resultados['linkedin_jobs']['coletadas']} coletadas, {resultados['linkedin_jobs']['novas']} novas")
-        except Exception as e:
-            resultados["linkedin_jobs"]["erro"] = str(e)
-            print(f"✗ Erro: {e}")
-
-        # 3. LinkedIn Publicações
-        print("\n📝 LINKEDIN PUBLICAÇÕES")
-        print("-" * 40)
-        try:
-            vagas_posts = coletar_vagas_linkedin_posts(headless=not mostrar_janela)
-            resultados["linkedin_posts"]["coletadas"] = len(vagas_posts)
-            resultados["linkedin_posts"]["novas"] = salvar_vagas(db, vagas_posts, "linkedin_posts")
-            print(f"✓ {resultados['linkedin_posts']['coletadas']} coletadas, {resultados['linkedin_posts']['novas']} novas")
-        except Exception as e:
-            resultados["linkedin_posts"]["erro"] = str(e)
-            print(f"✗ Erro: {e}")
+        # Cada fonte é gravada assim que termina; só este processo escreve no banco
+        for resultado in coletar_fontes(FONTES, paralelo=paralelo, headless=not mostrar_janela):
+            fonte = resultado.fonte
+            print(f"\n{TITULOS[fonte]} ({resultado.segundos:.0f}s)")
+            print("-" * 40)
+            resultados[fonte]["segundos"] = resultado.segundos
+            resultados[fonte]["coletadas"] = len(resultado.vagas)
+            try:
+                if resultado.erro:
+                    raise RuntimeError(resultado.erro)
+                resultados[fonte]["novas"] = salvar_vagas(db, resultado.vagas, fonte, resultado.vistos)
+                print(f"✓ {resultados[fonte]['coletadas']} coletadas, {resultados[fonte]['novas']} novas")
+            except Exception as e:
+                db.rollback()
+                resultados[fonte]["erro"] = str(e)
+                print(f"✗ Erro: {e}")
 
         # Resumo
         total_novas = sum(r["novas"] for r in resultados.values())
@@ -101,6 +94,11 @@ def coletar_tudo(mostrar_janela: bool = True):
         print(f"Total coletadas: {total_coletadas}")
         print(f"Novas salvas: {total_novas}")
 
+        print(f"\nTempo por fonte:")
+        for fonte, r in resultados.items():
+            print(f"  {fonte}: {r['segundos']:.0f}s")
+        print(f"  Total: {time.perf_counter() - inicio:.0f}s (soma das fontes: {sum(r['segundos'] for r in resultados.values()):.0f}s)")
+
         # Estatísticas do banco
         stats = crud.get_stats(db)
         print(f"\nNo banco de dados:")
@@ -123,6 +121,8 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser(description="Coleta vagas de todas as fontes")
     parser.add_argument("--headless", action="store_true", help="Rodar sem mostrar navegador")
+    parser.add_argument("--parallel", type=int, default=COLETA_PARALELO, metavar="N",
+                        help="Coletar até N fontes ao mesmo tempo (processos separados)")
     args = parser.parse_args()
 
-    coletar_tudo(mostrar_janela=not args.headless)
+    coletar_tudo(mostrar_janela=not args.headless, paralelo=args.parallel)
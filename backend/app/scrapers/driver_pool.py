@@ -0,0 +1,303 @@
+"""
+Pool de sessões do Chrome (WebDriver) mantidas abertas entre coletas.
+
+Abrir o Chrome + chromedriver e carregar o perfil custa alguns segundos por coleta.
+Num processo de vida longa (worker) o pool mantém até N sessões quentes e já logadas:
+
+    pool = criar_pool_linkedin(headless=True)
+    with pool.obter() as driver:
+        coletar_vagas_linkedin(driver=driver)
+
+Ao devolver, a sessão é reciclada (fechada; outra é aberta quando necessário) depois
+de POOL_MAX_PAGINAS páginas ou se a memória (RSS) do chromedriver e dos processos do
+Chrome crescer mais que POOL_MAX_CRESCIMENTO_MB desde a criação; senão é limpa (fecha
+abas extras e navega para about:blank) e volta ao pool. As páginas são contadas pelas
+navegações do frame principal (eventos CDP), não só pelos driver.get: cliques e links
+de paginação também contam.
+"""
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+try:
+    import psutil
+except ImportError:  # sem a medida de memória: a sessão só é reciclada por páginas
+    psutil = None
+
+from .cdp import registro_cdp
+from .modo_leve import fechar_driver
+
+POOL_TAMANHO = int(os.getenv("POOL_TAMANHO", "1"))
+POOL_MAX_PAGINAS = int(os.getenv("POOL_MAX_PAGINAS", "200"))
+POOL_MAX_CRESCIMENTO_MB = float(os.getenv("POOL_MAX_CRESCIMENTO_MB", "300"))
+
+
+class DriverMonitorado:
+    """
+    Repassa tudo ao WebDriver, contando as páginas abertas.
+
+    Conta as navegações do frame principal pelos eventos CDP (Page.frameNavigated e,
+    nas páginas que trocam a URL sem recarregar, Page.navigatedWithinDocument). Sem o
+    log de performance (driver criado sem habilitar_eventos) conta só os driver.get.
+    """
+
+    def __init__(self, driver):
+        self._driver = driver
+        self._gets = 0
+        self._navegacoes = 0
+        self._frame_principal = None
+        self._registro = registro_cdp(driver)
+        self._registro.ouvir("Page.frameNavigated", self._navegou)
+        self._registro.ouvir("Page.navigatedWithinDocument", self._navegou_no_documento)
+
+    def _navegou(self, params: dict):
+        frame = params.get("frame", {})
+        if frame.get("parentId"):
+            return
+        self._frame_principal = frame.get("id")
+        if not frame.get("url", "").startswith("about:"):
+            self._navegacoes += 1
+
+    def _navegou_no_documento(self, params: dict):
+        if params.get("frameId") == self._frame_principal:
+            self._navegacoes += 1
+
+    @property
+    def paginas(self) -> int:
+        self._registro.drenar()
+        return max(self._navegacoes, self._gets)
+
+    def get(self, url: str):
+        self._gets += 1
+        return self._driver.get(url)
+
+    def __getattr__(self, nome):
+        return getattr(self._driver, nome)
+
+
+class _Sessao:
+    def __init__(self, driver, ao_encerrar: Optional[Callable] = None):
+        self.driver = DriverMonitorado(driver)
+        self.ao_encerrar = ao_encerrar
+        self.usos = 0
+        self.memoria_inicial = _memoria_processos(driver)
+
+    def encerrar(self):
+        try:
+            fechar_driver(self.driver)
+        except Exception:
+            pass
+        if self.ao_encerrar:
+            self.ao_encerrar()
+
+
+def _memoria_processos(driver) -> Optional[int]:
+    """
+    RSS (bytes) do chromedriver e de todos os processos do Chrome abertos por ele.
+
+    None sem psutil ou sem o processo local do chromedriver (ex.: driver remoto).
+    """
+    if psutil is None:
+        return None
+    try:
+        processo = psutil.Process(driver.service.process.pid)
+        processos = [processo, *processo.children(recursive=True)]
+    except Exception:
+        return None
+    total = 0
+    for processo in processos:
+        try:
+            total += processo.memory_info().rss
+        except psutil.Error:  # processo do Chrome que terminou no meio da leitura
+            pass
+    return total
+
+
+class PoolDrivers:
+    """
+    Pool de até `tamanho` sessões criadas por `fabrica`.
+
+    fabrica() retorna (driver, ao_encerrar); ao_encerrar (opcional) é chamado depois
+    do quit, por exemplo para apagar uma cópia do perfil.
+    """
+
+    def __init__(
+        self,
+        fabrica: Callable[[], tuple],
+        tamanho: int = POOL_TAMANHO,
+        max_paginas: int = POOL_MAX_PAGINAS,
+        max_crescimento_mb: float = POOL_MAX_CRESCIMENTO_MB,
+    ):
+        self.fabrica = fabrica
+        self.tamanho = tamanho
+        self.max_paginas = max_paginas
+        self.max_crescimento_mb = max_crescimento_mb
+
+        self._livres: list[_Sessao] = []
+        self._abertas = 0
+        self._condicao = threading.Condition()
+        self._fechado = False
+        self._metricas = {
+            "obtencoes": 0,
+            "reusos": 0,
+            "criadas": 0,
+            "recicladas_paginas": 0,
+            "recicladas_memoria": 0,
+            "descartadas_erro": 0,
+            "espera_total_s": 0.0,
+            "espera_max_s": 0.0,
+        }
+
+    @contextmanager
+    def obter(self, timeout: Optional[float] = None):
+        """Empresta uma sessão (espera se todas estiverem em uso) e a devolve ao sair."""
+        sessao = self._emprestar(timeout)
+        erro = False
+        try:
+            yield sessao.driver
+        except BaseException:
+            erro = True
+            raise
+        finally:
+            self._devolver(sessao, erro)
+
+    def _emprestar(self, timeout: Optional[float]) -> _Sessao:
+        inicio = time.perf_counter()
+        with self._condicao:
+            while True:
+                if self._fechado:
+                    raise RuntimeError("Pool de drivers encerrado")
+                if self._livres:
+                    sessao = self._livres.pop()
+                    break
+                if self._abertas < self.tamanho:
+                    self._abertas += 1
+                    sessao = None
+                    break
+                restante = None if timeout is None else timeout - (time.perf_counter() - inicio)
+                if restante is not None and restante <= 0:
+                    raise TimeoutError("Nenhuma sessão do Chrome livre no pool")
+                self._condicao.wait(restante)
+
+        if sessao is None:
+            try:
+                sessao = _Sessao(*self.fabrica())
+            except BaseException:
+                with self._condicao:
+                    self._abertas -= 1
+                    self._condicao.notify()
+                raise
+
+        espera = time.perf_counter() - inicio
+        with self._condicao:
+            self._metricas["obtencoes"] += 1
+            if sessao.usos:
+                self._metricas["reusos"] += 1
+            else:
+                self._metricas["criadas"] += 1
+            self._metricas["espera_total_s"] += espera
+            self._metricas["espera_max_s"] = max(self._metricas["espera_max_s"], espera)
+        sessao.usos += 1
+        return sessao
+
+    def _devolver(self, sessao: _Sessao, erro: bool):
+        # Mede antes de limpar: a navegação para about:blank não pode entrar na conta
+        motivo = "descartadas_erro" if erro else self._motivo_reciclagem(sessao)
+        if motivo is None and not self._limpar(sessao):
+            motivo = "descartadas_erro"
+
+        with self._condicao:
+            if motivo is None and not self._fechado:
+                self._livres.append(sessao)
+            else:
+                self._abertas -= 1
+                if motivo:
+                    self._metricas[motivo] += 1
+            self._condicao.notify()
+
+        if motivo is not None or self._fechado:
+            sessao.encerrar()
+
+    @staticmethod
+    def _limpar(sessao: _Sessao) -> bool:
+        """Fecha abas extras e volta para about:blank. False se a sessão não responde."""
+        driver = sessao.driver
+        try:
+            abas = driver.window_handles
+            for aba in abas[1:]:
+                driver.switch_to.window(aba)
+                driver.close()
+            driver.switch_to.window(abas[0])
+            driver._driver.get("about:blank")  # não conta como página coletada
+            return True
+        except Exception:
+            return False
+
+    def _motivo_reciclagem(self, sessao: _Sessao) -> Optional[str]:
+        if sessao.driver.paginas >= self.max_paginas:
+            return "recicladas_paginas"
+        if sessao.memoria_inicial is not None:
+            memoria = _memoria_processos(sessao.driver._driver)
+            if memoria is not None and (memoria - sessao.memoria_inicial) / 2**20 > self.max_crescimento_mb:
+                return "recicladas_memoria"
+        return None
+
+    def metricas(self) -> dict:
+        """Obtenções, reusos, sessões criadas/recicladas e espera para obter uma sessão."""
+        with self._condicao:
+            metricas = dict(self._metricas)
+            metricas["abertas"] = self._abertas
+            metricas["livres"] = len(self._livres)
+        obtencoes = metricas["obtencoes"]
+        metricas["taxa_reuso"] = metricas["reusos"] / obtencoes if obtencoes else 0.0
+        metricas["espera_media_s"] = metricas["espera_total_s"] / obtencoes if obtencoes else 0.0
+        return metricas
+
+    def encerrar(self):
+        """Fecha as sessões livres; as emprestadas são fechadas quando voltarem."""
+        with self._condicao:
+            self._fechado = True
+            livres, self._livres = self._livres, []
+            self._abertas -= len(livres)
+            self._condicao.notify_all()
+        for sessao in livres:
+            sessao.encerrar()
+
+
+def criar_pool_indeed(tamanho: int = POOL_TAMANHO) -> PoolDrivers:
+    """Pool para o Indeed (Chrome headless sem perfil; os cookies são carregados na coleta)."""
+    from .indeed import criar_driver
+
+    return PoolDrivers(lambda: (criar_driver(), None), tamanho)
+
+
+def criar_pool_linkedin(headless: bool = False, tamanho: int = POOL_TAMANHO) -> PoolDrivers:
+    """
+    Pool para o LinkedIn, com a sessão logada do perfil persistente.
+
+    Com uma sessão usa o próprio PROFILE_DIR; com mais, cada sessão abre uma cópia
+    (o Chrome não abre o mesmo perfil duas vezes), apagada quando a sessão é fechada.
+    """
+    from .login_helper import copiar_perfil, criar_driver_com_perfil
+
+    def fabrica():
+        if tamanho <= 1:
+            return criar_driver_com_perfil(headless=headless), None
+        copia = copiar_perfil()
+        try:
+            driver = criar_driver_com_perfil(headless=headless, profile_dir=copia)
+        except BaseException:
+            shutil.rmtree(os.path.dirname(copia), ignore_errors=True)
+            raise
+        return driver, lambda: shutil.rmtree(os.path.dirname(copia), ignore_errors=True)
+
+    return PoolDrivers(fabrica, tamanho)
+
+
+def criar_pools(headless: bool = False, tamanho: int = POOL_TAMANHO) -> dict[str, PoolDrivers]:
+    """Pools por fonte (as duas fontes do LinkedIn compartilham o mesmo pool e login)."""
+    linkedin = criar_pool_linkedin(headless, tamanho)
+    return {"indeed": criar_pool_indeed(tamanho), "linkedin_jobs": linkedin, "linkedin_posts": linkedin}
@@ -0,0 +1,207 @@
+"""
+Esperas por condição no lugar dos time.sleep fixos dos coletores.
+
+Cada espera tem um nome ("linkedin_jobs.proxima_pagina") e termina assim que a
+condição vale: elemento na página, mais elementos que antes, altura do scroll mudou
+ou rede ociosa (eventos CDP, ver cdp.py). O tempo máximo de cada espera é aprendido
+das execuções anteriores (MARGEM x p95 das esperas que deram certo, entre
+ESPERA_MINIMA e o máximo informado), e a duração de cada espera fica registrada em
+ESPERAS_HISTORICO (JSON) para as próximas execuções.
+"""
+import json
+import os
+import threading
+import time
+from collections import Counter, deque
+from typing import Callable
+
+from .cdp import monitor_rede
+
+ESPERAS_HISTORICO = os.getenv(
+    "ESPERAS_HISTORICO",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "esperas.json"),
+)
+AMOSTRAS = 50  # durações guardadas por espera
+MIN_AMOSTRAS = 5  # antes disso usa o máximo informado
+MARGEM = 2.0
+ESPERA_MINIMA = 0.5
+
+
+class HistoricoEsperas:
+    """Durações recentes por espera, para calcular o tempo máximo e o resumo."""
+
+    def __init__(self, arquivo: str = ESPERAS_HISTORICO, amostras: int = AMOSTRAS):
+        self.arquivo = arquivo
+        self.amostras = amostras
+        self._duracoes: dict[str, deque] = {}
+        self._timeouts: Counter = Counter()
+        self._execucao: dict[str, list[float]] = {}
+        self._alteradas: set[str] = set()
+        self._trava = threading.Lock()
+        for nome, duracoes in self._ler_arquivo().items():
+            self._duracoes[nome] = deque(duracoes, maxlen=amostras)
+
+    def _ler_arquivo(self) -> dict:
+        try:
+            with open(self.arquivo, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def timeout(self, nome: str, maximo: float) -> float:
+        """Tempo máximo da espera: MARGEM x p95 das últimas esperas (limitado a [ESPERA_MINIMA, maximo])."""
+        with self._trava:
+            duracoes = sorted(self._duracoes.get(nome, ()))
+        if len(duracoes) < MIN_AMOSTRAS:
+            return maximo
+        p95 = duracoes[int(0.95 * (len(duracoes) - 1))]
+        return min(maximo, max(ESPERA_MINIMA, p95 * MARGEM))
+
+    def registrar(self, nome: str, segundos: float, ok: bool):
+        """Guarda a duração; só as esperas que deram certo entram no cálculo do tempo máximo."""
+        with self._trava:
+            self._execucao.setdefault(nome, []).append(segundos)
+            if ok:
+                self._duracoes.setdefault(nome, deque(maxlen=self.amostras)).append(round(segundos, 3))
+                self._alteradas.add(nome)
+            else:
+                self._timeouts[nome] += 1
+
+    def nova_execucao(self):
+        """Zera as esperas e timeouts da execução (o histórico das durações continua)."""
+        with self._trava:
+            self._execucao.clear()
+            self._timeouts.clear()
+
+    def resumo(self) -> dict:
+        """Por espera, nesta execução (desde nova_execucao): quantidade, tempo total, médio, maior e timeouts."""
+        with self._trava:
+            return {
+                nome: {
+                    "esperas": len(tempos),
+                    "total_s": round(sum(tempos), 2),
+                    "media_s": round(sum(tempos) / len(tempos), 3),
+                    "max_s": round(max(tempos), 3),
+                    "timeouts": self._timeouts[nome],
+                }
+                for nome, tempos in sorted(self._execucao.items())
+            }
+
+    def salvar(self):
+        """
+        Grava as durações no arquivo. Só as esperas alteradas neste processo são
+        sobrescritas, para processos paralelos (uma fonte cada) não apagarem as dos outros.
+        """
+        with self._trava:
+            if not self._alteradas:
+                return
+            dados = self._ler_arquivo()
+            for nome in self._alteradas:
+                dados[nome] = list(self._duracoes[nome])
+            self._alteradas.clear()
+
+        os.makedirs(os.path.dirname(self.arquivo) or ".", exist_ok=True)
+        temporario = f"{self.arquivo}.{os.getpid()}.tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump(dados, f, indent=1, sort_keys=True)
+        os.replace(temporario, self.arquivo)
+
+    def imprimir_resumo(self, prefixo: str = ""):
+        """Imprime o resumo das esperas cujo nome começa com `prefixo` (ex.: a fonte)."""
+        for nome, r in self.resumo().items():
+            if not nome.startswith(prefixo):
+                continue
+            print(f"  espera {nome}: {r['esperas']}x, total {r['total_s']}s, média {r['media_s']}s, "
+                  f"máx {r['max_s']}s, timeouts {r['timeouts']}")
+
+
+HISTORICO = HistoricoEsperas()
+
+
+def esperar(driver, nome: str, condicao: Callable, maximo: float, intervalo: float = 0.1) -> bool:
+    """
+    Espera condicao(driver) ser verdadeira, por no máximo o tempo aprendido para `nome`
+    (nunca mais que `maximo`). Retorna False se o tempo acabou (sem exceção).
+
+    Com o driver de snapshots.py o resultado é gravado (ou reproduzido, sem esperar).
+    """
+    espera_gravada = getattr(driver, "espera_gravada", None)
+    if espera_gravada is not None:
+        return espera_gravada(nome, lambda: _esperar(driver, nome, condicao, maximo, intervalo))
+    return _esperar(driver, nome, condicao, maximo, intervalo)
+
+
+def _esperar(driver, nome: str, condicao: Callable, maximo: float, intervalo: float) -> bool:
+    limite = HISTORICO.timeout(nome, maximo)
+    inicio = time.monotonic()
+    while True:
+        try:
+            ok = bool(condicao(driver))
+        except Exception:  # elemento sumiu no meio da verificação, página navegando, etc.
+            ok = False
+        decorrido = time.monotonic() - inicio
+        if ok or decorrido >= limite:
+            break
+        time.sleep(intervalo)
+    HISTORICO.registrar(nome, decorrido, ok)
+    return ok
+
+
+def esperar_seletor(driver, nome: str, seletor: str, maximo: float = 10) -> bool:
+    """Até existir um elemento com o seletor CSS."""
+    return esperar(
+        driver, nome, lambda d: d.execute_script("return document.querySelector(arguments[0]) !== null", seletor), maximo
+    )
+
+
+def esperar_contagem(driver, nome: str, seletor: str, maior_que: int, maximo: float = 5) -> bool:
+    """Até haver mais de `maior_que` elementos com o seletor (ex.: posts novos carregados)."""
+    return esperar(
+        driver,
+        nome,
+        lambda d: d.execute_script("return document.querySelectorAll(arguments[0]).length", seletor) > maior_que,
+        maximo,
+    )
+
+
+def altura_scroll(driver, elemento=None) -> int:
+    """scrollHeight do elemento (ou da página)."""
+    return driver.execute_script("return (arguments[0] || document.scrollingElement).scrollHeight", elemento)
+
+
+def esperar_altura(driver, nome: str, altura_anterior: int, elemento=None, maximo: float = 3) -> bool:
+    """Até a altura do scroll (do elemento ou da página) mudar, isto é, carregar mais conteúdo."""
+    return esperar(driver, nome, lambda d: altura_scroll(d, elemento) != altura_anterior, maximo)
+
+
+def esperar_rede_ociosa(
+    driver, nome: str, maximo: float = 10, ociosa: float = 0.5, max_pendentes: int = 0
+) -> bool:
+    """
+    Até a rede ficar `ociosa` segundos sem eventos com no máximo `max_pendentes`
+    requisições em andamento (o LinkedIn mantém conexões abertas; use 2 nele).
+
+    Usa os eventos CDP (driver criado com cdp.habilitar_eventos); sem eles, espera o
+    readyState "complete" e o número de recursos carregados (Resource Timing) parar de mudar.
+    """
+    monitor = monitor_rede(driver)
+    monitor.registro.drenar()
+
+    if monitor.registro.disponivel:
+        def condicao(d):
+            monitor.registro.drenar()
+            return len(monitor.pendentes) <= max_pendentes and time.monotonic() - monitor.ultimo_evento >= ociosa
+    else:
+        estado = {"recursos": None, "desde": time.monotonic()}
+
+        def condicao(d):
+            recursos = d.execute_script(
+                "return document.readyState === 'complete' ? performance.getEntriesByType('resource').length : -1"
+            )
+            agora = time.monotonic()
+            if recursos != estado["recursos"]:
+                estado.update(recursos=recursos, desde=agora)
+                return False
+            return recursos >= 0 and agora - estado["desde"] >= ociosa
+
+    return esperar(driver, nome, condicao, maximo)
@@ -0,0 +1,136 @@
+"""
+Etapa de parse separada da captura.
+
+O coletor (etapa do navegador) só captura os dados brutos de cada scroll/página e os
+envia em lotes; o parse e a classificação (regex de título, empresa, e-mails...)
+rodam num ProcessPoolExecutor enquanto o navegador segue rolando. Um erro no parse
+perde só o item, não a coleta.
+
+    etapa = EtapaParse("linkedin_posts", vaga_de_post_bruto)
+    for lote in ...:
+        etapa.enviar(lote)
+    vagas = etapa.resultados()
+    etapa.imprimir_metricas()
+
+As métricas de cada etapa (itens/s, tempo de CPU do parse, espera pelo parse no fim)
+mostram se a coleta está limitada pelo navegador ou pela CPU.
+"""
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Optional
+
+# Processos do parse (0 = no próprio processo, entre os scrolls)
+PARSE_PROCESSOS = int(os.getenv("PARSE_PROCESSOS", str(min(4, (os.cpu_count() or 1) - 1))))
+
+# Espera no fim maior que esta fração da captura = coleta limitada pela CPU
+LIMITE_ESPERA_CPU = 0.1
+
+
+def parsear_lote(parser: Callable, itens: list) -> tuple[list[dict], int, float]:
+    """Aplica o parser a cada item: (vagas, erros, segundos). Roda nos processos do pool."""
+    inicio = time.perf_counter()
+    vagas = []
+    erros = 0
+    for item in itens:
+        try:
+            vaga = parser(item)
+        except Exception:
+            erros += 1
+            continue
+        if vaga:
+            vagas.append(vaga)
+    return vagas, erros, time.perf_counter() - inicio
+
+
+class EtapaParse:
+    """Recebe os lotes capturados, parseia em paralelo e conta o desempenho de cada etapa."""
+
+    def __init__(self, nome: str, parser: Callable, processos: int = PARSE_PROCESSOS):
+        self.nome = nome
+        self.parser = parser
+        self.processos = processos
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lotes: list[Future] = []
+        self._inicio = time.perf_counter()
+        self._fim_captura = None
+        self.capturados = 0
+        self.vagas = 0
+        self.erros = 0
+        self.segundos_parse = 0.0
+        self.espera_final = 0.0
+
+    def enviar(self, itens: list):
+        """Envia um lote capturado para o parse (sem esperar)."""
+        if not itens:
+            return
+        self.capturados += len(itens)
+        if self.processos > 0 and self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.processos)
+        if self._pool is not None:
+            self._lotes.append(self._pool.submit(parsear_lote, self.parser, list(itens)))
+        else:
+            futuro = Future()
+            futuro.set_result(parsear_lote(self.parser, itens))
+            self._lotes.append(futuro)
+
+    def resultados(self) -> list[dict]:
+        """Fim da captura: espera os lotes pendentes e retorna as vagas, na ordem de captura."""
+        self._fim_captura = time.perf_counter()
+        vagas = []
+        try:
+            for futuro in self._lotes:
+                try:
+                    vagas_lote, erros, segundos = futuro.result()
+                except Exception as e:
+                    # Processo do parse morreu: perde o lote, não a coleta
+                    print(f"  Erro no parse de um lote ({self.nome}): {e}")
+                    self.erros += 1
+                    continue
+                vagas += vagas_lote
+                self.erros += erros
+                self.segundos_parse += segundos
+        finally:
+            self.espera_final = time.perf_counter() - self._fim_captura
+            self.encerrar()
+        self.vagas = len(vagas)
+        return vagas
+
+    def encerrar(self):
+        """Fecha o pool (e descarta o que não foi parseado, se a coleta foi abandonada)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def metricas(self) -> dict:
+        captura = (self._fim_captura or time.perf_counter()) - self._inicio
+        # Sem pool o parse roda entre os scrolls, dentro do tempo da captura
+        navegador = captura - (self.segundos_parse if self.processos <= 0 else 0)
+        limitado_cpu = (
+            self.espera_final > LIMITE_ESPERA_CPU * captura if self.processos > 0 else self.segundos_parse > navegador
+        )
+        return {
+            "captura": {
+                "itens": self.capturados,
+                "segundos": round(navegador, 2),
+                "itens_s": round(self.capturados / navegador, 1) if navegador > 0 else None,
+            },
+            "parse": {
+                "processos": self.processos,
+                "lotes": len(self._lotes),
+                "vagas": self.vagas,
+                "erros": self.erros,
+                "segundos_cpu": round(self.segundos_parse, 3),
+                "itens_s": round(self.capturados / self.segundos_parse, 1) if self.segundos_parse > 0 else None,
+                "espera_final_s": round(self.espera_final, 3),
+            },
+            "limitado_por": "cpu" if limitado_cpu else "navegador",
+        }
+
+    def imprimir_metricas(self):
+        m = self.metricas()
+        c, p = m["captura"], m["parse"]
+        print(f"  etapas {self.nome}: captura {c['itens']} itens em {c['segundos']}s ({c['itens_s']}/s); "
+              f"parse {p['processos']} processos, {p['segundos_cpu']}s de CPU ({p['itens_s']}/s), "
+              f"{p['vagas']} vagas, {p['erros']} erros, espera no fim {p['espera_final_s']}s; "
+              f"limitado por {m['limitado_por']}")
@@ -0,0 +1,151 @@
+"""
+Extração dos campos de um post de vaga do LinkedIn numa passada só: o texto é
+convertido para minúsculas uma vez, os termos (produto, tipo, modalidade, pedido de
+contato e palavras de cargo) saem de uma varredura do autômato de classificacao, e as
+regexes, compiladas no carregamento do módulo, só rodam quando os termos que elas
+exigem estão no texto.
+
+Usado por linkedin_posts (montar_vaga_post e extrair_dados_post_elemento). Benchmark
+em benchmarks/bench_extracao_posts.py.
+"""
+import re
+from typing import Optional
+
+from . import classificacao
+from .classificacao import modalidade_dos_termos, pede_contato_nos_termos, post_produto_nos_termos, tipo_post_dos_termos
+
+RE_EMAIL = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+RE_LINK = re.compile(r'https?://[^\s<>"{}|\\^`\[\])(\']+')
+RE_EMPRESA = re.compile(r'(?:@|na|at)[:\s]+([A-Z][a-zA-Z0-9\s&\-\.]{2,30})')
+
+# Padrões de cargo, em ordem de prioridade, com os termos que cada um exige no texto
+PADROES_CARGO = (
+    # Vagas explícitas
+    (frozenset(["vaga", "oportunidade", "contratando", "hiring"]),
+     re.compile(r'(?:vaga|oportunidade|contratando|hiring)[:\s\-]+(?:de\s+)?([A-Za-z][A-Za-z\s/\-]+(?:jr|pleno|sênior|senior|remoto)?)')),
+    # Designer com qualificador
+    (frozenset(["designer"]),
+     re.compile(r'\b((?:product |ux |ui |ux/ui |ui/ux |service )?designer(?:\s+(?:jr|pleno|sênior|senior|remoto))?)\b')),
+    # Manager/Owner
+    (frozenset(["product manager", "product owner"]),
+     re.compile(r'\b(product (?:manager|owner)(?:\s+(?:jr|pleno|sênior|senior))?)\b')),
+    # Head de área
+    (frozenset(["head"]),
+     re.compile(r'\b(head (?:de |of )?(?:produto|product|design|ux))\b')),
+    # UX Research
+    (frozenset(["ux research"]),
+     re.compile(r'\b(ux research(?:er)?)\b')),
+)
+
+RE_BORDA_INICIO = re.compile(r'^[:\s\-•→🔹📣🚀💼✨|]+')
+RE_BORDA_FIM = re.compile(r'[:\s\-•→🔹📣🚀💼✨|]+$')
+RE_SIMBOLOS = re.compile(r'[^\w\s]')
+
+FRASES_IGNORAR = ('link do instagram', 'vale a pena', 'passando na sua', 'ajudaria muito')
+PALAVRAS_NAO_TITULO = ('instagram', 'curtir', 'comentar', 'seguir')
+# Termos de cargo específicos (não só "designer") para aceitar uma linha como título
+TERMOS_LINHA_TITULO = ('ux', 'ui', 'product', 'manager', 'head de', 'head of', 'sênior', 'senior', 'pleno',
+                       'júnior', 'junior', 'jr')
+
+
+def limpar_titulo(titulo: Optional[str]) -> Optional[str]:
+    """Limpa e valida um título extraído."""
+    if not titulo:
+        return None
+    # Remove caracteres especiais do início e fim
+    titulo = RE_BORDA_FIM.sub('', RE_BORDA_INICIO.sub('', titulo))
+    # Remove URLs
+    if titulo.startswith('http') or 'lnkd.in' in titulo:
+        return None
+    # Remove se for muito curto ou só emojis/símbolos
+    if len(RE_SIMBOLOS.sub('', titulo).strip()) < 5:
+        return None
+    titulo_lower = titulo.lower()
+    if any(f in titulo_lower for f in FRASES_IGNORAR):
+        return None
+    return titulo.strip()[:100]
+
+
+def extrair_emails(texto: str) -> list[str]:
+    """E-mails do texto, sem repetir, na ordem em que aparecem."""
+    if '@' not in texto:
+        return []
+    # Um e-mail não tem espaços: a regex só roda nas palavras com "@"
+    emails = [e for palavra in texto.split() if '@' in palavra for e in RE_EMAIL.findall(palavra)]
+    return list(dict.fromkeys(e for e in emails if 'example' not in e.lower()))
+
+
+def extrair_links_externos(texto: str) -> list[str]:
+    """Links fora do LinkedIn, sem repetir, na ordem em que aparecem."""
+    if 'http' not in texto:
+        return []
+    links = (link.rstrip('.,;:!?') for link in RE_LINK.findall(texto))
+    return list(dict.fromkeys(link for link in links if 'linkedin.com' not in link.lower()))
+
+
+def extrair_empresa(texto: str) -> Optional[str]:
+    match = RE_EMPRESA.search(texto)
+    return match.group(1).strip()[:50] if match else None
+
+
+def nome_autor_do_texto(linhas: list[str]) -> Optional[str]:
+    """Nome do autor no cabeçalho do post ("Nome • 2º")."""
+    for linha in linhas[:3]:
+        if '•' in linha:
+            return linha.split('•')[0].strip()
+    return None
+
+
+def _titulo(texto_lower: str, linhas: list[str], achados: frozenset, tipo: str, modalidade: str) -> str:
+    for exigidos, padrao in PADROES_CARGO:
+        if achados.isdisjoint(exigidos):
+            continue
+        match = padrao.search(texto_lower)
+        if match:
+            titulo = limpar_titulo(match.group(1).strip())
+            if titulo and len(titulo) > 5:
+                return titulo.title()
+
+    # Busca em linhas específicas (só as que têm "designer")
+    if 'designer' in achados:
+        for linha in linhas[:10]:
+            linha = linha.strip()
+            if linha.startswith('http') or len(linha) < 8 or len(linha) > 100:
+                continue
+            linha_lower = linha.lower()
+            if 'designer' not in linha_lower or any(x in linha_lower for x in PALAVRAS_NAO_TITULO):
+                continue
+            if any(t in linha_lower for t in TERMOS_LINHA_TITULO):
+                titulo = limpar_titulo(linha)
+                if titulo and len(titulo) > 8:
+                    return titulo
+
+    # Fallback: usa o tipo de vaga detectado
+    if modalidade != 'nao_especificado':
+        return f"{tipo} ({modalidade.title()})"
+    return tipo
+
+
+def extrair_post(texto: str) -> Optional[dict]:
+    """
+    Campos de um post de vaga de produto (titulo, empresa, emails, links, modalidade,
+    tipo_vaga, pede_contato, nome_autor), ou None se o post não for de produto.
+    """
+    texto_lower = texto.lower()
+    achados = classificacao.AUTOMATO.encontrar(texto_lower)
+    if not post_produto_nos_termos(achados):
+        return None
+
+    linhas = texto.split('\n')
+    tipo = tipo_post_dos_termos(achados)
+    modalidade = modalidade_dos_termos(achados)
+    return {
+        "titulo": _titulo(texto_lower, linhas, achados, tipo, modalidade),
+        "empresa": extrair_empresa(texto),
+        "emails": extrair_emails(texto),
+        "links": extrair_links_externos(texto),
+        "modalidade": modalidade,
+        "tipo_vaga": tipo,
+        "pede_contato": pede_contato_nos_termos(achados),
+        "nome_autor": nome_autor_do_texto(linhas),
+    }
@@ -6,64 +6,47 @@ from selenium.webdriver.support import expected_conditions as EC
 from datetime import date
 import os
 import re
-import time
 
+from app.filtro_vistos import adiar_vistos, chave_link, filtro_vistos
+from .cdp import habilitar_eventos
+from .classificacao import classificar_tipo_vaga, eh_vaga_produto
+from .esperas import esperar_rede_ociosa
 from .login_helper import carregar_cookies
-
-# Termos para filtrar vagas de produto (aceitar)
-TERMOS_PRODUTO = [
-    "product designer", "product manager", "ux designer", "ui designer",
-    "ux/ui", "ui/ux", "service designer", "head de produto", "product owner",
-    "product operations", "design de produto", "designer de produto",
-]
-
-# Termos para excluir (não são vagas de produto)
-TERMOS_EXCLUIR = [
-    "developer", "desenvolvedor", "engineer", "engenheiro", "qa", "tester",
-    "analista de dados", "data analyst", "designer gráfico", "graphic designer",
-    "marketing", "growth", "devops", "backend", "frontend", "fullstack",
-]
-
-
-def eh_vaga_produto(titulo: str) -> bool:
-    """Verifica se o título é uma vaga de produto."""
-    titulo_lower = titulo.lower()
-
-    for termo in TERMOS_EXCLUIR:
-        if termo in titulo_lower:
-            return False
-
-    for termo in TERMOS_PRODUTO:
-        if termo in titulo_lower:
-            return True
-
-    return False
-
-
-def classificar_tipo_vaga(titulo: str) -> str:
-    """Classifica o tipo da vaga baseado no título."""
-    titulo_lower = titulo.lower()
-
-    if "product manager" in titulo_lower or "product owner" in titulo_lower:
-        return "Product Manager"
-    elif "head" in titulo_lower and "produto" in titulo_lower:
-        return "Head de Produto"
-    elif "service designer" in titulo_lower:
-        return "Service Designer"
-    elif "ui/ux" in titulo_lower or "ux/ui" in titulo_lower:
-        return "UX/UI Designer"
-    elif "ui designer" in titulo_lower:
-        return "UI Designer"
-    elif "ux designer" in titulo_lower or "ux" in titulo_lower:
-        return "UX Designer"
-    elif "product designer" in titulo_lower or "designer de produto" in titulo_lower:
-        return "Product Designer"
-
-    return "Product Designer"
-
-
-def criar_driver():
-    """Cria driver do Chrome com opções otimizadas."""
+from .modo_leve import NAVEGADOR_LEVE, aplicar_preferencias, ativar_bloqueios, fechar_driver
+from .snapshots import gravador_se_ativo
+
+# Filtros: UX, Brasil, Home Office, Português, Últimas 24h
+URL_BUSCA = "https://br.indeed.com/empregos?q=UX&l=Brasil&sc=0kf%3Aattr%28DSQF7%29%3B&radius=25&fromage=1&lang=pt"
+
+
+def link_da_vaga(href: str, jk: str = None) -> str:
+    """Link canônico da vaga (viewjob?vjk=...), a partir do href do card ou do id (data-jk)."""
+    vjk_match = re.search(r"[?&]v?jk=([^&]+)", href or "")
+    if vjk_match:
+        jk = vjk_match.group(1)
+    if jk:
+        return f"https://br.indeed.com/viewjob?vjk={jk}"
+    return href
+
+
+def montar_vaga(titulo: str, link_vaga: str, empresa: str = None, localizacao: str = None) -> dict:
+    """Dicionário da vaga no formato dos coletores."""
+    return {
+        "titulo": titulo,
+        "empresa": empresa,
+        "tipo_vaga": classificar_tipo_vaga(titulo),
+        "fonte": "indeed",
+        "link_vaga": link_vaga,
+        "localizacao": localizacao,
+        "modalidade": "remoto",
+        "requisito_ingles": "nao_especificado",
+        "forma_contato": "indeed",
+        "data_coleta": date.today().isoformat(),
+    }
+
+
+def criar_driver(leve=NAVEGADOR_LEVE):
+    """Cria driver do Chrome com opções otimizadas (leve: sem imagens, mídia, fontes e rastreadores)."""
     options = Options()
     options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
@@ -72,26 +55,36 @@ def criar_driver():
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--lang=pt-BR")
     options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    habilitar_eventos(options)
+    if leve:
+        aplicar_preferencias(options, "indeed")
 
     driver = webdriver.Chrome(options=options)
+    if leve:
+        ativar_bloqueios(driver, "indeed")
     return driver
 
 
-def coletar_vagas_indeed() -> list[dict]:
-    """Coleta vagas do Indeed Brasil usando Selenium (sem login)."""
+def coletar_vagas_indeed(driver=None) -> list[dict]:
+    """
+    Coleta vagas do Indeed Brasil usando Selenium (sem login).
 
-    # Filtros: UX, Brasil, Home Office, Português, Últimas 24h
-    url = "https://br.indeed.com/empregos?q=UX&l=Brasil&sc=0kf%3Aattr%28DSQF7%29%3B&radius=25&fromage=1&lang=pt"
+    driver: sessão emprestada (ex.: do driver_pool); se None abre um Chrome e fecha ao final.
+    Os cards do filtro de vistos (filtro_vistos) são pulados antes de ler empresa e local.
+    """
+
+    url = URL_BUSCA
 
     vagas = []
-    driver = None
+    driver_proprio = driver is None
+    filtro = filtro_vistos()
 
     try:
-        driver = criar_driver()
+        if driver_proprio:
+            driver = criar_driver()
 
-        # Primeiro acessa o domínio para poder adicionar cookies
+        # Primeiro acessa o domínio para poder adicionar cookies (o get espera o load)
         driver.get("https://br.indeed.com")
-        time.sleep(1)
 
         # Tenta carregar cookies salvos (login)
         if carregar_cookies(driver, "indeed"):
@@ -105,7 +98,12 @@ def coletar_vagas_indeed() -> list[dict]:
             EC.presence_of_element_located((By.CSS_SELECTOR, "div.job_seen_beacon, td.resultContent"))
         )
 
-        time.sleep(2)  # Extra wait para JS carregar
+        # Espera o JS da página terminar de carregar (rede ociosa)
+        esperar_rede_ociosa(driver, "indeed.resultados", maximo=2)
+
+        gravador = gravador_se_ativo("indeed")
+        if gravador:
+            gravador.pagina(driver.current_url, driver.page_source)
 
         # Encontrar cards de vagas
         job_cards = driver.find_elements(By.CSS_SELECTOR, "div.job_seen_beacon, td.resultContent")
@@ -122,13 +120,9 @@ def coletar_vagas_indeed() -> list[dict]:
                     continue
 
                 href = title_elem.get_attribute("href") or ""
-
-                # Extrair vjk do link
-                vjk_match = re.search(r"vjk=([^&]+)", href)
-                if vjk_match:
-                    link_vaga = f"https://br.indeed.com/viewjob?vjk={vjk_match.group(1)}"
-                else:
-                    link_vaga = href
+                link_vaga = link_da_vaga(href, title_elem.get_attribute("data-jk"))
+                if filtro is not None and chave_link(link_vaga) in filtro:
+                    continue
 
                 # Empresa
                 try:
@@ -144,18 +138,7 @@ def coletar_vagas_indeed() -> list[dict]:
                 except:
                     localizacao = None
 
-                vaga = {
-                    "titulo": titulo,
-                    "empresa": empresa,
-                    "tipo_vaga": classificar_tipo_vaga(titulo),
-                    "fonte": "indeed",
-                    "link_vaga": link_vaga,
-                    "localizacao": localizacao,
-                    "modalidade": "remoto",
-                    "requisito_ingles": "nao_especificado",
-                    "forma_contato": "indeed",
-                    "data_coleta": date.today().isoformat(),
-                }
+                vaga = montar_vaga(titulo, link_vaga, empresa, localizacao)
 
                 # Evitar duplicatas pelo link
                 if not any(v["link_vaga"] == link_vaga for v in vagas):
@@ -169,9 +152,10 @@ def coletar_vagas_indeed() -> list[dict]:
         print(f"Erro: {e}")
 
     finally:
-        if driver:
-            driver.quit()
+        if driver and driver_proprio:
+            fechar_driver(driver)
 
+    adiar_vistos(chave_link(v["link_vaga"]) for v in vagas)
     return vagas
 
 
@@ -0,0 +1,218 @@
+"""
+Coleta do Indeed com várias buscas e páginas ao mesmo tempo (asyncio + httpx.AsyncClient).
+
+Todas as requisições saem de um único AsyncClient (pool de conexões compartilhado),
+limitadas por:
+  - um semáforo (no máximo INDEED_CONCORRENCIA requisições em andamento);
+  - um balde de tokens por host (INDEED_REQ_POR_SEGUNDO, rajada de INDEED_RAJADA),
+    para não tomar bloqueio (HTTP 429) do Indeed.
+
+Para cada busca a primeira página é lida antes; as demais (start=10, 20, ...) são
+pedidas juntas se ela tiver próxima página. Os cards passam pelo mesmo parse do
+coletor HTTP (indeed_http.parsear_cards: filtro eh_vaga_produto e classificar_tipo_vaga).
+"""
+import asyncio
+import os
+import time
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+
+from app.filtro_vistos import so_novos
+from .indeed import URL_BUSCA
+from .indeed_http import (
+    HEADERS,
+    INDEED_MAX_PAGINAS,
+    RESULTADOS_POR_PAGINA,
+    PaginaPrecisaJS,
+    coletar_vagas_indeed_selenium,
+    cookies_indeed,
+    parsear_cards,
+    precisa_js,
+    tem_proxima_pagina,
+)
+from .snapshots import gravador_se_ativo
+
+# Variações da busca (parâmetro q); as vagas repetidas entre elas são descartadas
+CONSULTAS = ["UX", "UX designer", "product designer", "UI designer", "product manager"]
+
+INDEED_CONCORRENCIA = int(os.getenv("INDEED_CONCORRENCIA", "4"))
+INDEED_REQ_POR_SEGUNDO = float(os.getenv("INDEED_REQ_POR_SEGUNDO", "2"))
+INDEED_RAJADA = int(os.getenv("INDEED_RAJADA", "4"))
+
+TENTATIVAS_429 = 3
+
+
+class BaldeTokens:
+    """Balde de tokens: `taxa` requisições/s em média, até `capacidade` de uma vez."""
+
+    def __init__(self, taxa: float, capacidade: int):
+        self.taxa = taxa
+        self.capacidade = capacidade
+        self._tokens = float(capacidade)
+        self._ultimo = time.monotonic()
+        self._trava = asyncio.Lock()
+
+    async def adquirir(self):
+        # A trava deixa os pedidos em fila: quem chegou antes recebe o próximo token
+        async with self._trava:
+            while True:
+                agora = time.monotonic()
+                self._tokens = min(self.capacidade, self._tokens + (agora - self._ultimo) * self.taxa)
+                self._ultimo = agora
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.taxa)
+
+
+class ColetorIndeedAsync:
+    """Busca páginas do Indeed com concorrência limitada e limite de taxa por host."""
+
+    def __init__(
+        self,
+        cliente: httpx.AsyncClient,
+        concorrencia: int = INDEED_CONCORRENCIA,
+        req_por_segundo: float = INDEED_REQ_POR_SEGUNDO,
+        rajada: int = INDEED_RAJADA,
+    ):
+        self.cliente = cliente
+        self.req_por_segundo = req_por_segundo
+        self.rajada = rajada
+        self._semaforo = asyncio.Semaphore(concorrencia)
+        self._baldes: dict[str, BaldeTokens] = {}
+        self.estatisticas = {"requisicoes": 0, "bloqueios_429": 0, "erros": 0}
+        self.gravador = gravador_se_ativo("indeed")
+
+    def _balde(self, url: str) -> BaldeTokens:
+        host = urlsplit(url).netloc
+        if host not in self._baldes:
+            self._baldes[host] = BaldeTokens(self.req_por_segundo, self.rajada)
+        return self._baldes[host]
+
+    async def buscar(self, url: str) -> httpx.Response:
+        """GET respeitando o limite do host; em HTTP 429 espera (Retry-After) e tenta de novo."""
+        for tentativa in range(TENTATIVAS_429):
+            await self._balde(url).adquirir()
+            async with self._semaforo:
+                resposta = await self.cliente.get(url)
+            self.estatisticas["requisicoes"] += 1
+            if resposta.status_code != 429:
+                return resposta
+            self.estatisticas["bloqueios_429"] += 1
+            espera = resposta.headers.get("Retry-After", "")
+            await asyncio.sleep(float(espera) if espera.isdigit() else 2 ** tentativa)
+        return resposta
+
+    async def _pagina(self, url: str) -> Optional[str]:
+        """HTML da página de resultados, ou None se falhou ou veio sem os cards."""
+        try:
+            resposta = await self.buscar(url)
+        except httpx.HTTPError as e:
+            self.estatisticas["erros"] += 1
+            print(f"  Erro em {url}: {e}")
+            return None
+        if resposta.status_code != 200 or precisa_js(resposta.text):
+            self.estatisticas["erros"] += 1
+            return None
+        if self.gravador:
+            self.gravador.pagina(url, resposta.text)
+        return resposta.text
+
+    async def coletar_consulta(self, consulta: str, max_paginas: int, url_base: str) -> tuple[list[dict], bool]:
+        """Vagas de uma busca e se a primeira página veio renderizada."""
+        primeira = await self._pagina(url_consulta(consulta, 0, url_base))
+        if primeira is None:
+            return [], False
+
+        paginas = [primeira]
+        if max_paginas > 1 and tem_proxima_pagina(primeira):
+            restantes = await asyncio.gather(
+                *(self._pagina(url_consulta(consulta, p, url_base)) for p in range(1, max_paginas))
+            )
+            paginas += [html for html in restantes if html]
+
+        vagas = []
+        for html in paginas:
+            vagas += parsear_cards(html, url_base)
+        return vagas, True
+
+    async def coletar(
+        self, consultas: list[str], max_paginas: int = INDEED_MAX_PAGINAS, url_base: str = URL_BUSCA
+    ) -> list[dict]:
+        """
+        Coleta todas as buscas ao mesmo tempo e junta as vagas sem repetir link.
+
+        Levanta PaginaPrecisaJS se nenhuma busca teve a primeira página renderizada.
+        """
+        resultados = await asyncio.gather(*(self.coletar_consulta(c, max_paginas, url_base) for c in consultas))
+        if consultas and not any(ok for _, ok in resultados):
+            raise PaginaPrecisaJS("nenhuma busca retornou a lista de vagas")
+
+        vagas = []
+        links = set()
+        for vagas_consulta, _ in resultados:
+            for vaga in vagas_consulta:
+                if vaga["link_vaga"] not in links:
+                    links.add(vaga["link_vaga"])
+                    vagas.append(vaga)
+        return vagas
+
+
+def url_consulta(consulta: str, pagina: int, url_base: str = URL_BUSCA) -> str:
+    """URL da busca com q=consulta e o deslocamento da página (start=), mantendo os filtros."""
+    partes = urlsplit(url_base)
+    params = [(k, v) for k, v in parse_qsl(partes.query) if k not in ("q", "start")]
+    params.insert(0, ("q", consulta))
+    if pagina:
+        params.append(("start", str(pagina * RESULTADOS_POR_PAGINA)))
+    return urlunsplit(partes._replace(query=urlencode(params)))
+
+
+def criar_cliente_async(concorrencia: int = INDEED_CONCORRENCIA) -> httpx.AsyncClient:
+    """AsyncClient com o pool de conexões do tamanho da concorrência e os cookies salvos."""
+    return httpx.AsyncClient(
+        headers=HEADERS,
+        cookies=cookies_indeed(),
+        timeout=httpx.Timeout(15.0, connect=5.0),
+        limits=httpx.Limits(max_connections=concorrencia, max_keepalive_connections=concorrencia),
+        follow_redirects=True,
+    )
+
+
+async def coletar_indeed_async(
+    consultas: list[str] = CONSULTAS,
+    max_paginas: int = INDEED_MAX_PAGINAS,
+    concorrencia: int = INDEED_CONCORRENCIA,
+    req_por_segundo: float = INDEED_REQ_POR_SEGUNDO,
+    url_base: str = URL_BUSCA,
+) -> list[dict]:
+    """
+    Coleta as buscas em paralelo com um cliente novo (fechado ao final). Retorna só as
+    vagas fora do filtro de vistos (filtro_vistos).
+    """
+    async with criar_cliente_async(concorrencia) as cliente:
+        coletor = ColetorIndeedAsync(cliente, concorrencia, req_por_segundo)
+        vagas = so_novos(await coletor.coletar(consultas, max_paginas, url_base))
+    print(f"Indeed (async): {len(vagas)} vagas de produto, {coletor.estatisticas}")
+    return vagas
+
+
+def coletar_vagas_indeed_async(max_paginas: int = INDEED_MAX_PAGINAS, pool=None) -> list[dict]:
+    """
+    Versão síncrona para os coletores: todas as buscas de CONSULTAS, em paralelo.
+
+    Se o Indeed não entregar o HTML renderizado, usa o Selenium (com o pool, se houver).
+    """
+    try:
+        return asyncio.run(coletar_indeed_async(CONSULTAS, max_paginas))
+    except (PaginaPrecisaJS, httpx.HTTPError) as e:
+        print(f"Indeed por HTTP falhou ({e}); usando o navegador")
+    return coletar_vagas_indeed_selenium(pool)
+
+
+if __name__ == "__main__":
+    inicio = time.perf_counter()
+    vagas = coletar_vagas_indeed_async()
+    print(f"\nTotal: {len(vagas)} vagas de produto em {time.perf_counter() - inicio:.1f}s")
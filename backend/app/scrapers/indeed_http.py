@@ -0,0 +1,117 @@
+"""
+Partes da coleta do Indeed por HTTP (httpx + BeautifulSoup), sem abrir o Chrome.
+
+A lista de resultados do Indeed vem renderizada no HTML, então basta baixar as
+páginas (start=0, 10, 20, ...) e ler os cards. A coleta em si é a de indeed_async;
+aqui ficam os headers e cookies (cookies/indeed_cookies.json), o parse dos cards,
+os sinais de página que exige JS (desafio anti-bot, bloqueio) e o fallback para o
+Selenium (indeed.coletar_vagas_indeed).
+
+O parse é uma função pura (parsear_cards(html)) e pode ser testado com HTML salvo.
+"""
+import os
+from typing import Optional
+from urllib.parse import urljoin
+
+import httpx
+from bs4 import BeautifulSoup
+
+from .classificacao import eh_vaga_produto
+from .indeed import URL_BUSCA, coletar_vagas_indeed, link_da_vaga, montar_vaga
+from .login_helper import ler_cookies
+
+try:
+    import lxml  # noqa: F401
+    PARSER_HTML = "lxml"
+except ImportError:  # parser da biblioteca padrão (mais lento)
+    PARSER_HTML = "html.parser"
+
+# Coletar o Indeed por HTTP (0 = sempre pelo Selenium)
+INDEED_HTTP = os.getenv("INDEED_HTTP", "1") == "1"
+
+INDEED_MAX_PAGINAS = int(os.getenv("INDEED_MAX_PAGINAS", "5"))
+RESULTADOS_POR_PAGINA = 10
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
+}
+
+# Sinais de página que só carrega com JS (desafio do Cloudflare, captcha)
+MARCADORES_JS = ("cf-challenge", "challenge-platform", "<title>Just a moment", "h-captcha")
+
+
+class PaginaPrecisaJS(Exception):
+    """A página não veio com os cards no HTML (precisa do navegador)."""
+
+
+def cookies_indeed() -> httpx.Cookies:
+    """Cookies salvos do Indeed (cookies/indeed_cookies.json) no formato do httpx."""
+    cookies = httpx.Cookies()
+    for cookie in ler_cookies("indeed"):
+        cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain", ""), path=cookie.get("path", "/"))
+    return cookies
+
+
+def _texto(elemento) -> Optional[str]:
+    return elemento.get_text(" ", strip=True) if elemento else None
+
+
+def parsear_cards(html: str, url_base: str = URL_BUSCA) -> list[dict]:
+    """
+    Extrai as vagas de produto de uma página de resultados.
+
+    Mesmos seletores do coletor Selenium; vagas fora de produto são descartadas e
+    repetidas na mesma página (mesmo link) aparecem uma vez.
+    """
+    soup = BeautifulSoup(html, PARSER_HTML)
+    cards = soup.select("div.job_seen_beacon") or soup.select("td.resultContent")
+
+    vagas = []
+    links = set()
+    for card in cards:
+        title_elem = card.select_one("h2.jobTitle a, a.jcs-JobTitle, h2 a")
+        if title_elem is None:
+            continue
+
+        # O título vem num <span title="..."> dentro do link
+        span = title_elem.select_one("span[title]")
+        titulo = span["title"].strip() if span else _texto(title_elem)
+        if not titulo or not eh_vaga_produto(titulo):
+            continue
+
+        href = urljoin(url_base, title_elem.get("href") or "")
+        link_vaga = link_da_vaga(href, title_elem.get("data-jk"))
+        if link_vaga in links:
+            continue
+        links.add(link_vaga)
+
+        empresa = _texto(card.select_one("[data-testid='company-name'], .companyName"))
+        localizacao = _texto(card.select_one("[data-testid='text-location'], .companyLocation"))
+        vagas.append(montar_vaga(titulo, link_vaga, empresa, localizacao))
+
+    return vagas
+
+
+def precisa_js(html: str) -> bool:
+    """True se a página não tem a lista de resultados no HTML (nem o aviso de busca vazia)."""
+    if any(marcador in html for marcador in MARCADORES_JS):
+        return True
+    tem_lista = "job_seen_beacon" in html or "resultContent" in html or "mosaic-provider-jobcards" in html
+    sem_resultados = "jobsearch-NoResult" in html
+    return not (tem_lista or sem_resultados)
+
+
+def tem_proxima_pagina(html: str) -> bool:
+    """O Indeed só mostra o botão de próxima página quando ela existe."""
+    return 'data-testid="pagination-page-next"' in html
+
+
+def coletar_vagas_indeed_selenium(pool=None) -> list[dict]:
+    """Fallback pelo navegador, com uma sessão do pool se houver."""
+    if pool is not None:
+        with pool.obter() as driver:
+            return coletar_vagas_indeed(driver=driver)
+    return coletar_vagas_indeed()
+
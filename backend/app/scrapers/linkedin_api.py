@@ -0,0 +1,408 @@
+"""
+Coleta do LinkedIn pelas respostas JSON da API interna (Voyager) em vez do DOM.
+
+As páginas de vagas e de busca de publicações montam a lista a partir de XHRs
+/voyager/api/...; com o log de performance ligado (cdp.habilitar_eventos) a
+CapturaVoyager guarda o corpo dessas respostas (Network.getResponseBody) enquanto o
+coletor pagina ou rola a página. Os parsers leem o formato normalizado do Voyager
+({"data": ..., "included": [entidades]}) e são funções puras, testáveis com capturas
+salvas (LINKEDIN_SALVAR_CAPTURAS=<pasta>, ver benchmarks/fixtures/linkedin_*_voyager.json).
+
+Se nada for capturado (driver sem eventos CDP, API mudou), os coletores caem na
+extração pelo DOM com o mesmo driver.
+"""
+import base64
+import json
+import os
+import re
+from typing import Optional
+
+from app.filtro_vistos import adiar_vistos, chave_link, chave_post, filtro_vistos
+from .cdp import registro_cdp
+from .esperas import esperar, esperar_rede_ociosa
+from .etapa_parse import EtapaParse
+from .linkedin_jobs import (
+    LINKEDIN_INCREMENTAL,
+    coletar_vagas_linkedin,
+    filtrar_vagas_produto,
+    fim_da_coleta_incremental,
+    fracao_conhecida,
+    ids_conhecidos,
+    url_vagas,
+)
+from .linkedin_posts import coletar_vagas_linkedin_posts, hash_texto, montar_vaga_post
+from .login_helper import criar_driver_com_perfil
+from .modo_leve import fechar_driver
+
+# "api" (respostas JSON, com o DOM de reserva) ou "dom"
+LINKEDIN_EXTRACAO = os.getenv("LINKEDIN_EXTRACAO", "api")
+
+# Pasta para gravar as respostas capturadas (fixtures); vazio = não grava
+LINKEDIN_SALVAR_CAPTURAS = os.getenv("LINKEDIN_SALVAR_CAPTURAS", "")
+
+URL_POSTS = "https://www.linkedin.com/search/results/content/?keywords=ux%20vaga&datePosted=%22past-24h%22&sortBy=%22date_posted%22"
+VAGAS_POR_PAGINA = 25
+
+# Endpoints (REST ou queryId do GraphQL) de cada lista
+ENDPOINTS = {
+    "vagas": re.compile(r"jobcards|jobpostings|jobsearch", re.I),
+    "posts": re.compile(r"searchdashclusters|search/dash/clusters|feeddashupdates|feed/updates", re.I),
+}
+
+RE_ID_VAGA = re.compile(r"(\d{6,})")
+RE_ACTIVITY = re.compile(r"urn:li:(?:activity|ugcPost|share):\d+")
+
+
+class CapturaVoyager:
+    """Guarda os corpos das respostas da API Voyager de vagas e posts recebidas pelo driver."""
+
+    def __init__(self, driver, salvar_em: str = LINKEDIN_SALVAR_CAPTURAS):
+        self.driver = driver
+        self.salvar_em = salvar_em
+        self.payloads: dict[str, list[dict]] = {"vagas": [], "posts": []}
+        self._esperando: dict[str, str] = {}  # requestId -> tipo
+        self.registro = registro_cdp(driver)
+        driver.execute_cdp_cmd("Network.enable", {})
+        self._desinscrever = [
+            self.registro.ouvir("Network.responseReceived", self._resposta),
+            self.registro.ouvir("Network.loadingFinished", self._terminou),
+            self.registro.ouvir("Network.loadingFailed", self._falhou),
+        ]
+
+    @property
+    def disponivel(self) -> bool:
+        return self.registro.disponivel
+
+    def _resposta(self, params: dict):
+        url = params.get("response", {}).get("url", "")
+        if "/voyager/api/" not in url:
+            return
+        for tipo, padrao in ENDPOINTS.items():
+            if padrao.search(url):
+                self._esperando[params.get("requestId")] = tipo
+                return
+
+    def _falhou(self, params: dict):
+        self._esperando.pop(params.get("requestId"), None)
+
+    def _terminou(self, params: dict):
+        tipo = self._esperando.pop(params.get("requestId"), None)
+        if tipo is None:
+            return
+        try:
+            corpo = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": params["requestId"]})
+            texto = corpo["body"]
+            if corpo.get("base64Encoded"):
+                texto = base64.b64decode(texto).decode("utf-8")
+            payload = json.loads(texto)
+        except Exception:
+            # Corpo já descartado (navegação) ou resposta que não é JSON
+            return
+        self.payloads[tipo].append(payload)
+        if self.salvar_em:
+            os.makedirs(self.salvar_em, exist_ok=True)
+            arquivo = os.path.join(self.salvar_em, f"{tipo}_{len(self.payloads[tipo]):03d}.json")
+            with open(arquivo, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+
+    def drenar(self) -> int:
+        """Processa os eventos pendentes. Retorna o total de respostas capturadas."""
+        self.registro.drenar()
+        return sum(len(p) for p in self.payloads.values())
+
+    def esperar(self, nome: str, tipo: str, maximo: float = 10) -> bool:
+        """Até chegar uma resposta nova do tipo ("vagas" ou "posts")."""
+        antes = len(self.payloads[tipo])
+
+        def chegou(_driver):
+            self.drenar()
+            return len(self.payloads[tipo]) > antes
+
+        return esperar(self.driver, nome, chegou, maximo)
+
+    def encerrar(self):
+        for desinscrever in self._desinscrever:
+            desinscrever()
+
+
+def _entidades(payload: dict) -> list[dict]:
+    """Entidades do formato normalizado ("included"), ou os elements do REST antigo."""
+    entidades = payload.get("included")
+    if entidades is None:
+        entidades = payload.get("elements") or payload.get("data", {}).get("elements") or []
+    return [e for e in entidades if isinstance(e, dict)]
+
+
+def _texto(valor) -> Optional[str]:
+    """Campo de texto do Voyager: string ou TextViewModel ({"text": ...})."""
+    if isinstance(valor, dict):
+        valor = valor.get("text")
+        if isinstance(valor, dict):  # commentary.text.text
+            valor = valor.get("text")
+    return valor.strip() if isinstance(valor, str) and valor.strip() else None
+
+
+def _urls(valor) -> list[str]:
+    """URLs (http...) em qualquer nível de um objeto (ex.: os atributos de hyperlink do texto)."""
+    if isinstance(valor, str):
+        return [valor] if valor.startswith("http") else []
+    if isinstance(valor, dict):
+        valor = valor.values()
+    elif not isinstance(valor, list):
+        return []
+    return [url for item in valor for url in _urls(item)]
+
+
+def parsear_vagas(payload: dict) -> list[dict]:
+    """
+    Vagas de uma resposta da busca de vagas: [{id, titulo, empresa, link_vaga, localizacao}].
+
+    Lê os JobPostingCard (dash) e, para ids sem card, os JobPosting (REST antigo).
+    """
+    vagas = {}
+    postings = []
+    for entidade in _entidades(payload):
+        tipo = entidade.get("$type", "")
+        if tipo.endswith("JobPostingCard"):
+            urn = entidade.get("*jobPosting") or entidade.get("jobPostingUrn") or entidade.get("entityUrn", "")
+            id_vaga = RE_ID_VAGA.search(urn)
+            titulo = _texto(entidade.get("jobPostingTitle")) or _texto(entidade.get("title"))
+            if id_vaga and titulo:
+                vagas[id_vaga.group(1)] = {
+                    "titulo": titulo,
+                    "empresa": _texto(entidade.get("primaryDescription")),
+                    "localizacao": _texto(entidade.get("secondaryDescription")),
+                }
+        elif tipo.endswith("JobPosting"):
+            postings.append(entidade)
+
+    for entidade in postings:
+        id_vaga = RE_ID_VAGA.search(entidade.get("entityUrn", ""))
+        titulo = _texto(entidade.get("title"))
+        if not id_vaga or not titulo or id_vaga.group(1) in vagas:
+            continue
+        empresa = entidade.get("companyDetails", {})
+        empresa = next((v for v in empresa.values() if isinstance(v, dict)), empresa)
+        vagas[id_vaga.group(1)] = {
+            "titulo": titulo,
+            "empresa": _texto(empresa.get("companyName")) or _texto(entidade.get("companyName")),
+            "localizacao": _texto(entidade.get("formattedLocation")),
+        }
+
+    return [
+        {"id": id_vaga, "link_vaga": f"https://www.linkedin.com/jobs/view/{id_vaga}", **dados}
+        for id_vaga, dados in vagas.items()
+    ]
+
+
+def parsear_posts(payload: dict) -> list[dict]:
+    """
+    Posts de uma resposta da busca de publicações:
+    [{urn, texto, autor, perfil_autor, links}], com os links do próprio post.
+
+    Lê os Update (texto em commentary, autor em actor) e, para posts sem Update, o
+    resumo dos EntityResultViewModel.
+    """
+    posts = {}
+    resultados = []
+    for entidade in _entidades(payload):
+        tipo = entidade.get("$type", "")
+        if tipo.endswith("Update"):
+            urn = RE_ACTIVITY.search(json.dumps(entidade.get("metadata", {})) + entidade.get("entityUrn", ""))
+            commentary = entidade.get("commentary") or {}
+            texto = _texto(commentary.get("text"))
+            if not urn or not texto:
+                continue
+            ator = entidade.get("actor") or {}
+            perfil = (ator.get("navigationContext") or {}).get("actionTarget")
+            posts[urn.group(0)] = {
+                "urn": urn.group(0),
+                "texto": texto,
+                "autor": _texto(ator.get("name")),
+                "perfil_autor": perfil.split("?")[0] if perfil else None,
+                "links": _urls((commentary.get("text") or {}).get("attributesV2") or (commentary.get("text") or {}).get("attributes")),
+            }
+        elif tipo.endswith("EntityResultViewModel"):
+            resultados.append(entidade)
+
+    for entidade in resultados:
+        urn = RE_ACTIVITY.search(entidade.get("entityUrn", "") + (entidade.get("navigationUrl") or ""))
+        texto = _texto(entidade.get("summary"))
+        if not urn or not texto or urn.group(0) in posts:
+            continue
+        perfil = entidade.get("actorNavigationUrl")
+        posts[urn.group(0)] = {
+            "urn": urn.group(0),
+            "texto": texto,
+            "autor": _texto(entidade.get("title")),
+            "perfil_autor": perfil.split("?")[0] if perfil else None,
+            "links": _urls((entidade.get("summary") or {}).get("attributesV2")),
+        }
+
+    return list(posts.values())
+
+
+def vaga_do_post(post: dict) -> Optional[dict]:
+    """Vaga (formato dos coletores) a partir de um post de parsear_posts, ou None."""
+    perfis = {post["autor"]: post["perfil_autor"]} if post["autor"] and post["perfil_autor"] else {}
+    links_lnkd = [link for link in post["links"] if "lnkd.in" in link]
+    vaga = montar_vaga_post(post["texto"], perfis, links_lnkd, nome_autor=post["autor"])
+    if vaga and not vaga["link_vaga"]:
+        # Links externos do post (o texto pode trazer só o encurtado ou nenhum)
+        externos = [link for link in post["links"] if "linkedin.com" not in link and "lnkd.in" not in link]
+        if externos:
+            vaga.update(link_vaga=externos[0], forma_contato="link")
+    return vaga
+
+
+def coletar_vagas_linkedin_api(
+    max_paginas: int = 20, headless: bool = False, profile_dir: str = None, driver=None, incremental: bool = None
+) -> list[dict]:
+    """
+    Coleta vagas do LinkedIn pelas respostas da API (uma página de 25 por URL, sem
+    scroll). Se a primeira página não trouxer nenhuma resposta capturada, usa a
+    extração pelo DOM (coletar_vagas_linkedin) com o mesmo driver.
+
+    incremental: como em coletar_vagas_linkedin (busca por data, só as vagas novas;
+    para de paginar quando LINKEDIN_FRACAO_PARADA da página já é conhecida). As vagas do filtro de
+    vistos (filtro_vistos) contam como conhecidas.
+    """
+    driver_proprio = driver is None
+    captura = None
+    incremental = LINKEDIN_INCREMENTAL if incremental is None else incremental
+    url = url_vagas(incremental)
+    try:
+        if driver_proprio:
+            driver = criar_driver_com_perfil(headless=headless, profile_dir=profile_dir)
+        captura = CapturaVoyager(driver)
+        conhecidos = ids_conhecidos() if incremental else set()
+        filtro = filtro_vistos()
+        ids_vistos = set()
+        vagas = {}
+
+        for pagina in range(max_paginas):
+            lidas = len(captura.payloads["vagas"])
+            driver.get(f"{url}&start={pagina * VAGAS_POR_PAGINA}")
+            captura.esperar("linkedin_api.vagas", "vagas", maximo=10)
+            # A página pode pedir os cards em mais de uma resposta
+            esperar_rede_ociosa(driver, "linkedin_api.vagas_ociosa", maximo=3, max_pendentes=2)
+            captura.drenar()
+
+            novas = 0
+            vistos_antes = len(ids_vistos)
+            ids_pagina = []
+            for payload in captura.payloads["vagas"][lidas:]:
+                for vaga in parsear_vagas(payload):
+                    ids_pagina.append(vaga["id"])
+                    if filtro is not None and chave_link(vaga["link_vaga"]) in filtro:
+                        conhecidos.add(vaga["id"])
+                    if vaga["id"] not in vagas and vaga["id"] not in conhecidos:
+                        vagas[vaga["id"]] = vaga
+                        novas += 1
+            ids_vistos.update(ids_pagina)
+
+            if pagina == 0 and not captura.payloads["vagas"]:
+                print("AVISO: nenhuma resposta da API capturada; extraindo pelo DOM.")
+                captura.encerrar()
+                captura = None
+                return coletar_vagas_linkedin(max_paginas, driver=driver, incremental=incremental)
+
+            print(f"Página {pagina + 1}: {novas} novas (total: {len(vagas)})")
+            if len(ids_vistos) == vistos_antes:  # página vazia ou repetida
+                break
+            fracao = fracao_conhecida(ids_pagina, conhecidos)
+            if incremental and fim_da_coleta_incremental(url, fracao):
+                print(f"  {fracao:.0%} da página já conhecida; fim da coleta incremental")
+                break
+
+        adiar_vistos(chave_link(f"https://www.linkedin.com/jobs/view/{i}") for i in ids_vistos)
+        vagas_produto = filtrar_vagas_produto(list(vagas.values()))
+        print(f"Vagas de produto: {len(vagas_produto)}")
+        return vagas_produto
+
+    except Exception as e:
+        print(f"Erro: {e}")
+        return []
+
+    finally:
+        if captura:
+            captura.encerrar()
+        if driver and driver_proprio:
+            fechar_driver(driver)
+
+
+def coletar_vagas_linkedin_posts_api(
+    max_scrolls: int = 30, headless: bool = False, profile_dir: str = None, driver=None, scrolls_sem_novos: int = 3
+) -> list[dict]:
+    """
+    Coleta vagas das publicações do LinkedIn pelas respostas da busca de conteúdo
+    (texto, links e autor de cada post, sem ler o DOM). Rola a página só para o
+    LinkedIn pedir a próxima leva. Sem respostas capturadas, usa coletar_vagas_linkedin_posts.
+    Os posts do filtro de vistos (filtro_vistos) não são parseados.
+    """
+    driver_proprio = driver is None
+    captura = None
+    etapa = None
+    try:
+        if driver_proprio:
+            driver = criar_driver_com_perfil(headless=headless, profile_dir=profile_dir)
+        captura = CapturaVoyager(driver)
+        driver.get(URL_POSTS)
+
+        if not captura.esperar("linkedin_api.posts", "posts", maximo=10):
+            print("AVISO: nenhuma resposta da API capturada; extraindo pelo DOM.")
+            captura.encerrar()
+            captura = None
+            return coletar_vagas_linkedin_posts(max_scrolls, driver=driver)
+
+        vistos = set()
+        hashes = set()
+        filtro = filtro_vistos()
+        chaves = []
+        etapa = EtapaParse("linkedin_posts", vaga_do_post)
+        lidas = 0
+        sem_novos = 0
+        for _ in range(max_scrolls):
+            captura.drenar()
+            novos = 0
+            lote = []
+            for payload in captura.payloads["posts"][lidas:]:
+                for post in parsear_posts(payload):
+                    if post["urn"] in vistos:
+                        continue
+                    vistos.add(post["urn"])
+                    novos += 1
+                    # O mesmo texto pode vir de reposts
+                    if hash_texto(post["texto"]) in hashes:
+                        continue
+                    hashes.add(hash_texto(post["texto"]))
+                    chave = chave_post(post["texto"])
+                    if filtro is None or chave not in filtro:
+                        chaves.append(chave)
+                        lote.append(post)
+            etapa.enviar(lote)
+            lidas = len(captura.payloads["posts"])
+
+            sem_novos = 0 if novos else sem_novos + 1
+            if sem_novos >= scrolls_sem_novos:
+                break
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            captura.esperar("linkedin_api.posts_scroll", "posts", maximo=5)
+
+        vagas = etapa.resultados()
+        adiar_vistos(chaves)
+        print(f"{len(vistos)} posts lidos, {etapa.capturados} novos, {len(vagas)} vagas")
+        etapa.imprimir_metricas()
+        return vagas
+
+    except Exception as e:
+        print(f"Erro: {e}")
+        return []
+
+    finally:
+        if etapa:
+            etapa.encerrar()
+        if captura:
+            captura.encerrar()
+        if driver and driver_proprio:
+            fechar_driver(driver)
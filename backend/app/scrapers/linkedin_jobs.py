@@ -4,134 +4,141 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from datetime import date
+import os
 import re
-import time
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
 
+from app.filtro_vistos import adiar_vistos, chave_link, filtro_vistos
+from .classificacao import classificar_titulos
+from .esperas import esperar, esperar_altura, esperar_seletor
+from .etapa_parse import EtapaParse
 from .login_helper import criar_driver_com_perfil
-
-TERMOS_PRODUTO = [
-    "product designer", "product design", "product manager", "ux designer", "ui designer",
-    "ux/ui", "ui/ux", "service designer", "head de produto", "product owner",
-    "product operations", "design de produto", "designer de produto",
-]
-
-TERMOS_EXCLUIR = [
-    "developer", "desenvolvedor", "engineer", "engenheiro", "qa", "tester",
-    "analista de dados", "data analyst", "designer gráfico", "graphic designer",
-    "marketing", "growth", "devops", "backend", "frontend", "fullstack",
-]
-
-
-def eh_vaga_produto(titulo: str) -> bool:
-    titulo_lower = titulo.lower()
-    for termo in TERMOS_EXCLUIR:
-        if termo in titulo_lower:
-            return False
-    for termo in TERMOS_PRODUTO:
-        if termo in titulo_lower:
-            return True
-    return False
-
-
-def classificar_tipo_vaga(titulo: str) -> str:
-    titulo_lower = titulo.lower()
-    if "product manager" in titulo_lower or "product owner" in titulo_lower:
-        return "Product Manager"
-    elif "head" in titulo_lower and "produto" in titulo_lower:
-        return "Head de Produto"
-    elif "service designer" in titulo_lower:
-        return "Service Designer"
-    elif "ui/ux" in titulo_lower or "ux/ui" in titulo_lower:
-        return "UX/UI Designer"
-    elif "ui designer" in titulo_lower:
-        return "UI Designer"
-    elif "ux designer" in titulo_lower or "ux" in titulo_lower:
-        return "UX Designer"
-    elif "product designer" in titulo_lower or "designer de produto" in titulo_lower:
-        return "Product Designer"
-    return "Product Designer"
-
-
-def scroll_e_extrair_vagas(driver, max_scrolls=200):
-    """Faz scroll lento na lista para carregar e extrair todas as vagas."""
+from .modo_leve import fechar_driver
+from .snapshots import gravar_se_ativo
+
+SELETOR_CARDS = "li[data-occludable-job-id]"
+
+# Busca de vagas (últimas 24h, remotas); a ordenação é escolhida por url_vagas
+URL_VAGAS = "https://www.linkedin.com/jobs/search/?f_TPR=r86400&f_WT=2&keywords=ux"
+
+# Coleta incremental: pula as vagas já conhecidas (gravadas no banco ou no filtro de
+# vistos) e, com a lista por data, para de paginar quando LINKEDIN_FRACAO_PARADA da
+# página já é conhecida
+LINKEDIN_INCREMENTAL = os.getenv("LINKEDIN_INCREMENTAL", "1") == "1"
+LINKEDIN_FRACAO_PARADA = float(os.getenv("LINKEDIN_FRACAO_PARADA", "1.0"))
+LINKEDIN_JANELA_DIAS = int(os.getenv("LINKEDIN_JANELA_DIAS", "2"))
+
+RE_ID_VAGA = re.compile(r"/jobs/view/(\d+)")
+
+# Ids de todos os cards da lista (os vazios pela oclusão também). arguments: [0] SELETOR_CARDS.
+JS_IDS_PAGINA = """
+return Array.from(document.querySelectorAll(arguments[0]), (li) => li.getAttribute("data-occludable-job-id"));
+"""
+
+# Id da primeira vaga da lista (muda quando a página troca). arguments: [0] SELETOR_CARDS.
+JS_PRIMEIRO_ID = """
+const li = document.querySelector(arguments[0]);
+return li && li.getAttribute("data-occludable-job-id");
+"""
+
+# Extrai numa só chamada (um round-trip ao chromedriver por passo) os cards já
+# renderizados e ainda não vistos, e rola a lista: até o primeiro card não visto que
+# ainda está vazio (o LinkedIn só renderiza os cards perto da área visível) ou, se não
+# houver, 300px para baixo. Os ids vistos ficam em window.__vagasVistas.
+# arguments: [0] lista (div.scaffold-layout__list), [1] reiniciar os ids vistos,
+# [2] ids já conhecidos (entram como vistos ao reiniciar: nem rola até eles).
+# Devolve também pendente_id, o card vazio para onde rolou, e restantes, os cards
+# ainda não vistos.
+JS_EXTRAIR_CARDS = """
+const lista = arguments[0];
+if (arguments[1] || !window.__vagasVistas) {
+    window.__vagasVistas = new Set(arguments[2] || []);
+    window.__vagasTentativas = {};
+}
+const vistas = window.__vagasVistas;
+const tentativas = window.__vagasTentativas;
+const texto = (el, seletor) => {
+    const e = el.querySelector(seletor);
+    return e && e.innerText.trim() ? e.innerText.trim() : null;
+};
+
+const cards = [];
+let pendente = null;
+for (const li of document.querySelectorAll("li.scaffold-layout__list-item[data-occludable-job-id]")) {
+    const id = li.getAttribute("data-occludable-job-id");
+    if (!id || vistas.has(id)) continue;
+    const titulo = texto(li, "a strong") || texto(li, "strong");
+    if (!titulo) {
+        // Card vazio: rola até ele para renderizar (desiste depois de 3 tentativas)
+        tentativas[id] = (tentativas[id] || 0) + 1;
+        if (tentativas[id] > 3) vistas.add(id);
+        else if (!pendente) pendente = li;
+        continue;
+    }
+    vistas.add(id);
+    cards.push({
+        job_id: id,
+        titulo: titulo,
+        empresa: texto(li, ".artdeco-entity-lockup__subtitle"),
+        localizacao: texto(li, ".job-card-container__metadata-wrapper li") || texto(li, ".artdeco-entity-lockup__caption"),
+    });
+}
+
+if (pendente) pendente.scrollIntoView({block: "center"});
+else lista.scrollTop += 300;
+let restantes = 0;
+for (const li of document.querySelectorAll("li.scaffold-layout__list-item[data-occludable-job-id]")) {
+    if (!vistas.has(li.getAttribute("data-occludable-job-id"))) restantes++;
+}
+return {
+    cards: cards,
+    pendentes: pendente !== null,
+    restantes: restantes,
+    pendente_id: pendente && pendente.getAttribute("data-occludable-job-id"),
+    topo: lista.scrollTop,
+    altura: lista.scrollHeight,
+    visivel: lista.clientHeight,
+};
+"""
+
+
+def scroll_e_extrair_vagas(driver, max_scrolls=200, conhecidos=None):
+    """
+    Faz scroll lento na lista para carregar e extrair todas as vagas (JS_EXTRAIR_CARDS).
+
+    conhecidos: ids a pular (coleta incremental); com eles a extração termina assim que
+    não sobra card desconhecido na lista, sem rolar até o fim.
+    """
     vagas = []
-    links_vistos = set()
 
     try:
         lista = driver.find_element(By.CSS_SELECTOR, "div.scaffold-layout__list")
 
         for i in range(max_scrolls):
-            # Pega todos os cards com job_id
-            cards = driver.find_elements(By.CSS_SELECTOR, "li.scaffold-layout__list-item[data-occludable-job-id]")
-
-            # Extrai vagas dos cards que têm conteúdo carregado
-            for card in cards:
-                try:
-                    job_id = card.get_attribute("data-occludable-job-id")
-                    if not job_id:
-                        continue
-
-                    link_vaga = f"https://www.linkedin.com/jobs/view/{job_id}"
-                    if link_vaga in links_vistos:
-                        continue
-
-                    # Scrolla até o card para forçar renderização
-                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card)
-                    time.sleep(0.15)
-
-                    # Tenta extrair título
-                    titulo = None
-                    try:
-                        titulo = card.find_element(By.CSS_SELECTOR, "a strong").text.strip()
-                    except:
-                        try:
-                            titulo = card.find_element(By.CSS_SELECTOR, "strong").text.strip()
-                        except:
-                            pass
+            passo = driver.execute_script(JS_EXTRAIR_CARDS, lista, i == 0, sorted(conhecidos or ()) if i == 0 else [])
+
+            for card in passo["cards"]:
+                vagas.append({
+                    "titulo": card["titulo"],
+                    "empresa": card["empresa"],
+                    "link_vaga": f"https://www.linkedin.com/jobs/view/{card['job_id']}",
+                    "localizacao": card["localizacao"],
+                })
 
-                    if not titulo:
-                        continue
+            # Os 25 cards da página já estão na lista (vazios pela oclusão)
+            if conhecidos is not None and passo.get("restantes") == 0:
+                break
 
-                    links_vistos.add(link_vaga)
-
-                    # Extrai empresa e localização
-                    empresa = None
-                    localizacao = None
-                    try:
-                        empresa = card.find_element(By.CSS_SELECTOR, ".artdeco-entity-lockup__subtitle").text.strip()
-                    except:
-                        pass
-                    try:
-                        localizacao = card.find_element(By.CSS_SELECTOR, ".job-card-container__metadata-wrapper li").text.strip()
-                    except:
-                        try:
-                            localizacao = card.find_element(By.CSS_SELECTOR, ".artdeco-entity-lockup__caption").text.strip()
-                        except:
-                            pass
-
-                    vagas.append({
-                        "titulo": titulo,
-                        "empresa": empresa,
-                        "link_vaga": link_vaga,
-                        "localizacao": localizacao,
-                    })
-                except:
-                    continue
-
-            # Scroll para baixo na lista
-            driver.execute_script("arguments[0].scrollTop += 300", lista)
-            time.sleep(0.2)
+            if passo["pendentes"]:
+                # Espera o card para onde rolou ser renderizado
+                seletor = f'li[data-occludable-job-id="{passo["pendente_id"]}"] strong'
+                esperar_seletor(driver, "linkedin_jobs.card", seletor, maximo=1)
 
             # Verifica se chegou ao fim
-            scroll_pos = driver.execute_script("return arguments[0].scrollTop", lista)
-            scroll_height = driver.execute_script("return arguments[0].scrollHeight", lista)
-            client_height = driver.execute_script("return arguments[0].clientHeight", lista)
-
-            if scroll_pos + client_height >= scroll_height - 50:
+            elif passo["topo"] + passo["visivel"] >= passo["altura"] - 50:
                 # Chegou ao fim, espera um pouco por mais conteúdo
-                time.sleep(0.5)
-                new_height = driver.execute_script("return arguments[0].scrollHeight", lista)
-                if new_height == scroll_height:
+                if not esperar_altura(driver, "linkedin_jobs.fim_lista", passo["altura"], lista, maximo=0.5):
                     break
 
         return vagas
@@ -140,39 +147,161 @@ def scroll_e_extrair_vagas(driver, max_scrolls=200):
         return vagas
 
 
-def coletar_vagas_linkedin(max_paginas: int = 20, headless: bool = False) -> list[dict]:
-    """Coleta vagas do LinkedIn com scroll e paginação."""
+def vaga_produto(v: dict):
+    """Vaga no formato dos coletores a partir do card ({titulo, empresa, link_vaga, localizacao}), ou None."""
+    return _vaga_do_card(v, classificar_titulos([v["titulo"]])[0])
+
+
+def _vaga_do_card(v: dict, tipo_vaga: Optional[str]):
+    if tipo_vaga is None:
+        return None
+    return {
+        "titulo": v["titulo"],
+        "empresa": v["empresa"],
+        "tipo_vaga": tipo_vaga,
+        "fonte": "linkedin_jobs",
+        "link_vaga": v["link_vaga"],
+        "localizacao": v["localizacao"],
+        "modalidade": "remoto",
+        "requisito_ingles": "nao_especificado",
+        "forma_contato": "link",
+        "data_coleta": date.today().isoformat(),
+    }
+
+
+def filtrar_vagas_produto(vagas: list[dict]) -> list[dict]:
+    """Vagas de produto no formato dos coletores (títulos classificados em lote)."""
+    tipos = classificar_titulos([v["titulo"] for v in vagas])
+    return [vaga for vaga in map(_vaga_do_card, vagas, tipos) if vaga]
+
+
+def id_da_vaga(link: str):
+    """Id numérico da vaga a partir do link /jobs/view/<id>, ou None."""
+    encontrado = RE_ID_VAGA.search(link or "")
+    return encontrado.group(1) if encontrado else None
+
+
+def vistos_no_filtro(ids, filtro) -> set[str]:
+    """Ids cujas vagas já estão no filtro de vistos (filtro_vistos), sem abrir os cards."""
+    if filtro is None:
+        return set()
+    return {i for i in ids if i and chave_link(f"https://www.linkedin.com/jobs/view/{i}") in filtro}
+
+
+def ids_conhecidos(dias: int = LINKEDIN_JANELA_DIAS) -> set[str]:
+    """
+    Ids das vagas do LinkedIn gravadas no banco nos últimos `dias` dias (vagas.link_vaga).
+
+    Só o que já foi gravado conta: uma vaga coletada cuja gravação falhou é coletada de
+    novo. As descartadas pelo filtro de produto entram pelo filtro de vistos
+    (vistos_no_filtro), também marcado só depois da gravação.
+    """
+    from app import crud
+    from app.database import SessionLeitura
+
+    conhecidos = set()
+    db = SessionLeitura()
+    try:
+        conhecidos.update(filter(None, map(id_da_vaga, crud.links_recentes(db, "linkedin_jobs", dias))))
+    except Exception as e:
+        # Sem banco (ou sem a tabela): segue sem ids conhecidos
+        print(f"AVISO: ids conhecidos do banco indisponíveis ({e})")
+    finally:
+        db.close()
+    return conhecidos
+
+
+def fracao_conhecida(ids_pagina: list, conhecidos: set) -> float:
+    """Fração dos ids da página que já são conhecidos (0 se a página está vazia)."""
+    ids_pagina = [i for i in ids_pagina if i]
+    if not ids_pagina:
+        return 0.0
+    return sum(1 for i in ids_pagina if i in conhecidos) / len(ids_pagina)
+
+
+def url_vagas(incremental: bool) -> str:
+    """
+    URL da busca. Na coleta incremental a lista vem das mais recentes para as mais
+    antigas (sortBy=DD); senão, por relevância (sortBy=R).
+    """
+    return f"{URL_VAGAS}&sortBy={'DD' if incremental else 'R'}"
+
+
+def fim_da_coleta_incremental(url: str, fracao: float, limite: float = LINKEDIN_FRACAO_PARADA) -> bool:
+    """
+    Parar de paginar: `limite` da página já é conhecida e a lista está por data.
+
+    Só numa lista por data as páginas seguintes são mais antigas (e também conhecidas);
+    na ordem de relevância uma vaga nova pode aparecer depois de uma página conhecida.
+    """
+    return parse_qs(urlsplit(url).query).get("sortBy") == ["DD"] and fracao >= limite
+
+
+def coletar_vagas_linkedin(
+    max_paginas: int = 20, headless: bool = False, profile_dir: str = None, driver=None, incremental: bool = None
+) -> list[dict]:
+    """
+    Coleta vagas do LinkedIn com scroll e paginação.
+
+    profile_dir: cópia do perfil (ver copiar_perfil). driver: sessão emprestada (ex.: do
+    driver_pool); se None abre um Chrome e fecha ao final. incremental (padrão
+    LINKEDIN_INCREMENTAL): busca por data, pula as vagas já conhecidas e para de paginar
+    quando LINKEDIN_FRACAO_PARADA da página já é conhecida. As vagas do filtro de vistos
+    (filtro_vistos) contam como conhecidas e não são parseadas.
+    """
 
-    base_url = "https://www.linkedin.com/jobs/search/?f_TPR=r86400&f_WT=2&keywords=ux&sortBy=R"
-    todas_vagas = []
     links_vistos = set()
-    driver = None
+    driver_proprio = driver is None
+    incremental = LINKEDIN_INCREMENTAL if incremental is None else incremental
+    base_url = url_vagas(incremental)
+    conhecidos = ids_conhecidos() if incremental else None
+    filtro = filtro_vistos()
+    # Classificar um card é barato: o parse fica no próprio processo, só pelas métricas
+    etapa = EtapaParse("linkedin_jobs", vaga_produto, processos=0)
 
     try:
-        driver = criar_driver_com_perfil(headless=headless)
+        if driver_proprio:
+            driver = criar_driver_com_perfil(headless=headless, profile_dir=profile_dir)
+        driver = gravar_se_ativo(driver, "linkedin_jobs", passos=(JS_EXTRAIR_CARDS,))
         driver.get(base_url)
-        time.sleep(4)
+        esperar_seletor(driver, "linkedin_jobs.carregar", f"{SELETOR_CARDS}, #session_key, form.login__form", maximo=10)
 
         if "Sign in" in driver.page_source or "Entrar" in driver.page_source:
             print("AVISO: Não está logado.")
             return []
 
         print("Login OK. Coletando vagas...")
+        if conhecidos is not None:
+            print(f"Coleta incremental: {len(conhecidos)} vagas já conhecidas")
 
         for pagina in range(1, max_paginas + 1):
             print(f"Página {pagina}...")
 
-            # Scroll e extração na página atual
-            vagas_pagina = scroll_e_extrair_vagas(driver)
-            novas = 0
+            fracao = 0.0
+            if conhecidos is not None:
+                ids_pagina = driver.execute_script(JS_IDS_PAGINA, SELETOR_CARDS) or []
+                conhecidos.update(vistos_no_filtro(ids_pagina, filtro))
+                fracao = fracao_conhecida(ids_pagina, conhecidos)
+                if fim_da_coleta_incremental(base_url, fracao, limite=1.0):
+                    print("  Página só com vagas conhecidas; fim da coleta incremental")
+                    break
+
+            # Scroll e extração na página atual (sem as conhecidas)
+            vagas_pagina = scroll_e_extrair_vagas(driver, conhecidos=conhecidos)
+            novas = []
 
             for v in vagas_pagina:
                 if v["link_vaga"] not in links_vistos:
                     links_vistos.add(v["link_vaga"])
-                    todas_vagas.append(v)
-                    novas += 1
+                    if filtro is None or chave_link(v["link_vaga"]) not in filtro:
+                        novas.append(v)
+            etapa.enviar(novas)
+
+            print(f"  -> {len(novas)} novas (total: {etapa.capturados})")
 
-            print(f"  -> {novas} novas (total: {len(todas_vagas)})")
+            if conhecidos is not None and fim_da_coleta_incremental(base_url, fracao):
+                print(f"  {fracao:.0%} da página já conhecida; fim da coleta incremental")
+                break
 
             # Próxima página
             try:
@@ -199,35 +328,32 @@ def coletar_vagas_linkedin(max_paginas: int = 20, headless: bool = False) -> lis
                     print("Última página")
                     break
 
+                primeiro_id = driver.execute_script(JS_PRIMEIRO_ID, SELETOR_CARDS)
                 driver.execute_script("arguments[0].click();", next_btn)
-                time.sleep(3)
+                # Espera a lista trocar de vagas
+                esperar(
+                    driver,
+                    "linkedin_jobs.proxima_pagina",
+                    lambda d: d.execute_script(JS_PRIMEIRO_ID, SELETOR_CARDS) not in (None, primeiro_id),
+                    maximo=10,
+                )
                 # Scroll para topo da lista
                 lista = driver.find_element(By.CSS_SELECTOR, "div.scaffold-layout__list")
                 driver.execute_script("arguments[0].scrollTop = 0", lista)
-                time.sleep(1)
+                esperar_seletor(driver, "linkedin_jobs.primeiro_card", f"{SELETOR_CARDS} strong", maximo=1)
             except Exception as e:
                 print(f"Fim da paginação: {e}")
                 break
 
-        print(f"\nTotal coletado: {len(todas_vagas)} vagas")
-
-        vagas_produto = []
-        for v in todas_vagas:
-            if eh_vaga_produto(v["titulo"]):
-                vagas_produto.append({
-                    "titulo": v["titulo"],
-                    "empresa": v["empresa"],
-                    "tipo_vaga": classificar_tipo_vaga(v["titulo"]),
-                    "fonte": "linkedin_jobs",
-                    "link_vaga": v["link_vaga"],
-                    "localizacao": v["localizacao"],
-                    "modalidade": "remoto",
-                    "requisito_ingles": "nao_especificado",
-                    "forma_contato": "link",
-                    "data_coleta": date.today().isoformat(),
-                })
+        print(f"\nTotal coletado: {etapa.capturados} vagas")
+
+        vagas_produto = etapa.resultados()
+        # Todas as lidas, inclusive as descartadas pelo filtro de produto, entram no filtro
+        # de vistos depois que o processo principal gravar as vagas
+        adiar_vistos(map(chave_link, links_vistos))
 
         print(f"Vagas de produto: {len(vagas_produto)}")
+        etapa.imprimir_metricas()
         return vagas_produto
 
     except Exception as e:
@@ -235,8 +361,8 @@ def coletar_vagas_linkedin(max_paginas: int = 20, headless: bool = False) -> lis
         return []
 
     finally:
-        if driver:
-            driver.quit()
+        if driver and driver_proprio:
+            fechar_driver(driver)
 
 
 if __name__ == "__main__":
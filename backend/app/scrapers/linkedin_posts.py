@@ -1,24 +1,44 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from datetime import date
-import re
-import time
+import hashlib
+import os
 
+from app.filtro_vistos import adiar_vistos, chave_post, filtro_vistos
+from .esperas import altura_scroll, esperar_altura, esperar_contagem, esperar_rede_ociosa
+from .etapa_parse import EtapaParse
+from .extracao_posts import extrair_post
 from .login_helper import criar_driver_com_perfil
-
-TERMOS_PRODUTO = [
-    "product designer", "product design", "product manager", "ux designer", "ui designer",
-    "ux/ui", "ui/ux", "service designer", "head de produto", "product owner",
-    "product operations", "design de produto", "designer de produto", "vaga de ux",
-    "vaga ux", "vaga product", "vaga designer", "oportunidade ux", "oportunidade product",
-    "ux research", "ux researcher", "design ops", "designops",
-]
-
-TERMOS_EXCLUIR = [
-    "developer", "desenvolvedor", "engineer", "engenheiro", "qa", "tester",
-    "analista de dados", "data analyst", "designer gráfico", "graphic designer",
-    "marketing", "growth", "devops", "backend", "frontend", "fullstack",
-]
+from .modo_leve import fechar_driver
+from .snapshots import gravar_se_ativo
+
+# Coleta incremental dos posts (0 = modo legado, relendo a página inteira a cada scroll)
+POSTS_INCREMENTAL = os.getenv("POSTS_INCREMENTAL", "1") == "1"
+
+# Nó de cada post na busca de publicações
+SELETOR_POSTS = "div.feed-shared-update-v2, div[data-urn^='urn:li:activity']"
+SELETOR_POSTS_NAO_LIDOS = ", ".join(f"{s.strip()}:not([data-vagas-lido])" for s in SELETOR_POSTS.split(","))
+
+# Devolve os posts que apareceram desde a chamada anterior (sem o atributo
+# data-vagas-lido), cada um com o próprio texto e os próprios links, esvazia os
+# lidos para o DOM e a memória do Chrome não crescerem com o scroll e rola até o fim
+# da página para o LinkedIn carregar mais. arguments: [0] SELETOR_POSTS.
+JS_POSTS_NOVOS = """
+const seletor = arguments[0];
+const novos = [];
+for (const post of document.querySelectorAll(seletor)) {
+    // Posts aninhados saem do DOM quando o de fora é esvaziado (ordem do documento)
+    if (!post.isConnected || post.hasAttribute("data-vagas-lido")) continue;
+    post.setAttribute("data-vagas-lido", "1");
+    novos.push({
+        texto: post.innerText,
+        links: Array.from(post.querySelectorAll("a[href]"), (a) => ({href: a.href, texto: a.innerText.trim()})),
+    });
+    post.replaceChildren();
+}
+window.scrollTo(0, document.body.scrollHeight);
+return novos;
+"""
 
 PLATAFORMAS_VAGAS = [
     "gupy.io", "lever.co", "greenhouse.io", "workable.com", "nerdin.com.br",
@@ -26,143 +46,9 @@ PLATAFORMAS_VAGAS = [
 ]
 
 
-def eh_post_produto(texto):
-    texto_lower = texto.lower()
-    for termo in TERMOS_EXCLUIR:
-        if termo in texto_lower:
-            if not any(t in texto_lower for t in TERMOS_PRODUTO):
-                return False
-    for termo in TERMOS_PRODUTO:
-        if termo in texto_lower:
-            return True
-    return False
-
-
-def extrair_emails(texto):
-    pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    emails = re.findall(pattern, texto)
-    return list(set([e for e in emails if 'example' not in e.lower()]))
-
-
-def extrair_links_externos(texto):
-    pattern = r'https?://[^\s<>"{}|\\^`\[\])(\']+'
-    links = re.findall(pattern, texto)
-    resultado = []
-    for link in links:
-        link = link.rstrip('.,;:!?')
-        if 'linkedin.com' not in link.lower():
-            resultado.append(link)
-    return list(set(resultado))
-
-
-def limpar_titulo(titulo):
-    """Limpa e valida um título extraído."""
-    if not titulo:
-        return None
-    # Remove caracteres especiais do início e fim
-    titulo = re.sub(r'^[:\s\-•→🔹📣🚀💼✨|]+', '', titulo)
-    titulo = re.sub(r'[:\s\-•→🔹📣🚀💼✨|]+$', '', titulo)
-    # Remove URLs
-    if titulo.startswith('http') or 'lnkd.in' in titulo:
-        return None
-    # Remove se for muito curto ou só emojis/símbolos
-    titulo_limpo = re.sub(r'[^\w\s]', '', titulo)
-    if len(titulo_limpo.strip()) < 5:
-        return None
-    # Remove frases genéricas
-    frases_ignorar = ['link do instagram', 'vale a pena', 'passando na sua', 'ajudaria muito']
-    if any(f in titulo.lower() for f in frases_ignorar):
-        return None
-    return titulo.strip()[:100]
-
-
-def extrair_titulo_vaga(texto):
-    """Extrai título da vaga do texto do post."""
-
-    # Padrões específicos para cargos
-    padroes_cargo = [
-        # Vagas explícitas
-        r'(?:vaga|oportunidade|contratando|hiring)[:\s\-]+(?:de\s+)?([A-Za-z][A-Za-z\s/\-]+(?:jr|pleno|sênior|senior|remoto)?)',
-        # Designer com qualificador
-        r'\b((?:product |ux |ui |ux/ui |ui/ux |service )?designer(?:\s+(?:jr|pleno|sênior|senior|remoto))?)\b',
-        # Manager/Owner
-        r'\b(product (?:manager|owner)(?:\s+(?:jr|pleno|sênior|senior))?)\b',
-        # Head de área
-        r'\b(head (?:de |of )?(?:produto|product|design|ux))\b',
-        # UX Research
-        r'\b(ux research(?:er)?)\b',
-    ]
-
-    texto_lower = texto.lower()
-    for padrao in padroes_cargo:
-        match = re.search(padrao, texto_lower)
-        if match:
-            titulo = match.group(1).strip()
-            titulo = limpar_titulo(titulo)
-            if titulo and len(titulo) > 5:
-                # Capitaliza corretamente
-                return titulo.title()
-
-    # Busca em linhas específicas
-    linhas = texto.split('\n')
-    for linha in linhas[:10]:
-        linha = linha.strip()
-        linha_lower = linha.lower()
-
-        # Pula linhas que são claramente não-títulos
-        if linha.startswith('http') or len(linha) < 8 or len(linha) > 100:
-            continue
-        if any(x in linha_lower for x in ['instagram', 'curtir', 'comentar', 'seguir']):
-            continue
-
-        # Verifica se contém termos de cargo específicos (não só "designer")
-        termos_especificos = ['ux', 'ui', 'product', 'manager', 'head de', 'head of', 'sênior', 'senior', 'pleno', 'júnior', 'junior', 'jr']
-        if any(t in linha_lower for t in termos_especificos) and 'designer' in linha_lower:
-            titulo = limpar_titulo(linha)
-            if titulo and len(titulo) > 8:
-                return titulo
-
-    # Fallback: usa o tipo de vaga detectado
-    tipo = classificar_tipo_vaga(texto)
-    modalidade = classificar_modalidade(texto)
-    if modalidade != 'nao_especificado':
-        return f"{tipo} ({modalidade.title()})"
-    return tipo
-
-
-def extrair_empresa(texto):
-    padroes = [r'(?:@|na|at)[:\s]+([A-Z][a-zA-Z0-9\s&\-\.]{2,30})']
-    for padrao in padroes:
-        match = re.search(padrao, texto)
-        if match:
-            return match.group(1).strip()[:50]
-    return None
-
-
-def classificar_modalidade(texto):
-    texto_lower = texto.lower()
-    if 'remoto' in texto_lower or 'remote' in texto_lower:
-        return 'remoto'
-    elif 'híbrido' in texto_lower or 'hibrido' in texto_lower:
-        return 'hibrido'
-    elif 'presencial' in texto_lower:
-        return 'presencial'
-    return 'nao_especificado'
-
-
-def classificar_tipo_vaga(texto):
-    texto_lower = texto.lower()
-    if "product manager" in texto_lower or "product owner" in texto_lower:
-        return "Product Manager"
-    elif "ux/ui" in texto_lower or "ui/ux" in texto_lower:
-        return "UX/UI Designer"
-    elif "ux designer" in texto_lower:
-        return "UX Designer"
-    elif "ui designer" in texto_lower:
-        return "UI Designer"
-    elif "product designer" in texto_lower:
-        return "Product Designer"
-    return "Product Designer"
+def hash_texto(texto):
+    """Hash estável entre processos do início do texto (o hash() do Python muda a cada execução)."""
+    return hashlib.sha1(texto[:200].encode("utf-8")).hexdigest()
 
 
 def determinar_forma_contato(emails, links, texto):
@@ -180,7 +66,8 @@ def extrair_dados_post_elemento(post_el):
         if len(texto) < 50:
             return None
 
-        if not eh_post_produto(texto):
+        dados = extrair_post(texto)
+        if dados is None:
             return None
 
         # Extrai todos os links do elemento HTML
@@ -207,19 +94,12 @@ def extrair_dados_post_elemento(post_el):
                 link_limpo = href.split("?")[0].rstrip('.,;:!?')
                 links_externos.append(link_limpo)
 
-        # Extrai emails do texto
-        emails = extrair_emails(texto)
+        emails = dados["emails"]
 
         # Define link da vaga (prioriza links externos)
         if links_externos:
             link_vaga = links_externos[0]
 
-        # Extrai outros dados do texto
-        titulo = extrair_titulo_vaga(texto)
-        empresa = extrair_empresa(texto)
-        modalidade = classificar_modalidade(texto)
-        tipo_vaga = classificar_tipo_vaga(texto)
-
         # Determina forma de contato
         if link_vaga:
             forma_contato = 'link'
@@ -232,51 +112,214 @@ def extrair_dados_post_elemento(post_el):
 
         # Fallback para nome do autor do texto
         if not nome_autor:
-            linhas = texto.split('\n')
-            for linha in linhas[:3]:
-                if '•' in linha:
-                    nome_autor = linha.split('•')[0].strip()
-                    break
+            nome_autor = dados["nome_autor"]
 
         return {
-            "titulo": titulo,
-            "empresa": empresa,
-            "tipo_vaga": tipo_vaga,
+            "titulo": dados["titulo"],
+            "empresa": dados["empresa"],
+            "tipo_vaga": dados["tipo_vaga"],
             "fonte": "linkedin_posts",
             "link_vaga": link_vaga,
             "localizacao": None,
-            "modalidade": modalidade,
+            "modalidade": dados["modalidade"],
             "requisito_ingles": "nao_especificado",
             "forma_contato": forma_contato,
             "email_contato": emails[0] if emails else None,
             "perfil_autor": perfil_autor,
             "nome_autor": nome_autor,
             "data_coleta": date.today().isoformat(),
+            "texto_post": texto,
         }
     except Exception as e:
         print(f"  Erro ao extrair post: {e}")
         return None
 
 
-def texto_pede_contato(texto):
-    """Verifica se o texto pede explicitamente para entrar em contato."""
-    texto_lower = texto.lower()
-    frases_contato = [
-        "entre em contato", "entrar em contato", "mande mensagem", "envie mensagem",
-        "fale com", "falar com", "dm", "inbox", "chama no", "me chama",
-        "entre em contacto", "manda msg", "manda mensagem"
-    ]
-    return any(frase in texto_lower for frase in frases_contato)
+def montar_vaga_post(texto, perfis, links_lnkd, nome_autor=None):
+    """
+    Monta a vaga a partir do texto do post, ou None se não for de produto ou não tiver
+    como aplicar.
 
+    perfis: {nome: url do perfil} dos links /in/; links_lnkd: links lnkd.in candidatos
+    (o primeiro é consumido se o texto não tiver link externo); nome_autor: se None, é
+    lido do cabeçalho do texto ("Nome • 2º").
+    """
+    # Todos os campos do texto numa passada (extracao_posts)
+    dados = extrair_post(texto)
+    if dados is None:
+        return None
+    emails = dados["emails"]
+    if nome_autor is None:
+        nome_autor = dados["nome_autor"]
+
+    # Link da vaga: prioriza links externos (o primeiro do texto), depois lnkd.in
+    link_vaga = None
+    if dados["links"]:
+        link_vaga = dados["links"][0]
+    elif links_lnkd:
+        link_vaga = links_lnkd.pop(0)
+
+    # Perfil para contato: SÓ se o texto pedir explicitamente
+    perfil_autor = None
+    if dados["pede_contato"] and nome_autor:
+        nome_lower = nome_autor.lower()
+        for nome_link, url_perfil in perfis.items():
+            if nome_lower in nome_link.lower() or nome_link.lower() in nome_lower:
+                perfil_autor = url_perfil
+                break
+
+    # Determina forma de contato
+    if link_vaga:
+        forma_contato = 'link'
+    elif emails:
+        forma_contato = 'email'
+    elif perfil_autor:
+        forma_contato = 'mensagem'
+    else:
+        # Só salva se tiver alguma forma de aplicar
+        return None
+
+    return {
+        "titulo": dados["titulo"],
+        "empresa": dados["empresa"],
+        "tipo_vaga": dados["tipo_vaga"],
+        "fonte": "linkedin_posts",
+        "link_vaga": link_vaga,
+        "localizacao": None,
+        "modalidade": dados["modalidade"],
+        "requisito_ingles": "nao_especificado",
+        "forma_contato": forma_contato,
+        "email_contato": emails[0] if emails else None,
+        "perfil_autor": perfil_autor,
+        "nome_autor": None,  # Não precisa mais
+        "data_coleta": date.today().isoformat(),
+        "texto_post": texto,
+    }
+
+
+def texto_do_post(texto_bruto):
+    """Texto do post entre o cabeçalho "Publicação no feed" e o botão "Gostar"."""
+    return texto_bruto.split("Publicação no feed")[-1].split("Gostar")[0].strip()
+
+
+def separar_links(links):
+    """Links de um post ({href, texto}) -> ({nome: perfil}, [links lnkd.in])."""
+    perfis = {}
+    links_lnkd = []
+    for link in links:
+        href = link["href"] or ""
+        # Perfis de usuários
+        if "/in/" in href:
+            nome = link["texto"]
+            if nome and len(nome) > 2 and len(nome) < 50:
+                perfis[nome] = href.split("?")[0]
+        # Links encurtados (lnkd.in) - geralmente são links de vagas
+        elif "lnkd.in" in href:
+            links_lnkd.append(href)
+    return perfis, links_lnkd
+
+
+def vaga_de_post_bruto(post):
+    """Vaga a partir de um post capturado ({texto, links}), para a EtapaParse."""
+    perfis, links_lnkd = separar_links(post["links"])
+    return montar_vaga_post(post["texto"], perfis, links_lnkd)
+
+
+class SeletorPostsDesatualizado(Exception):
+    """Nenhum post encontrado com SELETOR_POSTS (o LinkedIn mudou o HTML)."""
+
+
+def posts_incrementais(driver, max_scrolls=30, scrolls_sem_novos=3):
+    """
+    Rola a página e gera, a cada scroll, só os posts novos: [{texto, links: [{href, texto}]}].
+
+    Usa JS_POSTS_NOVOS (um round-trip por scroll, custo constante). Para depois de
+    `scrolls_sem_novos` scrolls seguidos sem posts novos. Levanta SeletorPostsDesatualizado
+    se nos 3 primeiros scrolls nenhum post for encontrado.
+    """
+    sem_novos = 0
+    total = 0
+    for i in range(max_scrolls):
+        novos = driver.execute_script(JS_POSTS_NOVOS, SELETOR_POSTS)
+        total += len(novos)
+        if total == 0 and i >= 2:
+            raise SeletorPostsDesatualizado(SELETOR_POSTS)
+
+        yield i, novos
+
+        sem_novos = 0 if novos else sem_novos + 1
+        if sem_novos >= scrolls_sem_novos and total:
+            print("  Fim do conteúdo - sem novos posts carregados")
+            break
+        # Espera o LinkedIn carregar posts novos depois do scroll
+        esperar_contagem(driver, "linkedin_posts.scroll", SELETOR_POSTS_NAO_LIDOS, 0, maximo=3)
+
+
+def scroll_e_extrair_posts(driver, max_scrolls=30, incremental=None, filtrar_vistos=True):
+    """
+    Faz scroll e extrai posts de vagas.
+
+    No modo incremental (padrão, POSTS_INCREMENTAL) lê só os posts novos a cada scroll
+    e os parseia na EtapaParse (em outros processos, enquanto rola); se o seletor dos
+    posts não encontrar nada, cai para o modo legado (texto da página). Com
+    filtrar_vistos, os posts do filtro de vistos (filtro_vistos) não são parseados.
+    """
+    print("Fazendo scroll e coletando posts...")
 
-def scroll_e_extrair_posts(driver, max_scrolls=30):
-    """Faz scroll e extrai posts de vagas."""
+    incremental = POSTS_INCREMENTAL if incremental is None else incremental
+    if not incremental:
+        return _scroll_e_extrair_posts_legado(driver, max_scrolls)
+
+    etapa = EtapaParse("linkedin_posts", vaga_de_post_bruto)
+    textos_vistos = set()
+    filtro = filtro_vistos() if filtrar_vistos else None
+    chaves = []
+
+    try:
+        for i, novos in posts_incrementais(driver, max_scrolls):
+            lote = []
+            for post in novos:
+                texto = texto_do_post(post["texto"])
+                if len(texto) < 50:
+                    continue
+
+                texto_hash = hash_texto(texto)
+                if texto_hash in textos_vistos:
+                    continue
+                textos_vistos.add(texto_hash)
+                chave = chave_post(texto)
+                if filtro is not None and chave in filtro:
+                    continue
+                chaves.append(chave)
+                lote.append({"texto": texto, "links": post["links"]})
+            etapa.enviar(lote)
+
+            if i % 5 == 0:
+                print(f"  Scroll {i+1}: {len(novos)} posts novos, {etapa.capturados} capturados")
+    except SeletorPostsDesatualizado:
+        etapa.encerrar()
+        print("  Posts não encontrados pelo seletor; usando o modo legado")
+        return _scroll_e_extrair_posts_legado(driver, max_scrolls)
+    except Exception:
+        etapa.encerrar()
+        raise
+
+    posts_coletados = etapa.resultados()
+    if filtro is not None:
+        adiar_vistos(chaves)
+        print(f"  {len(textos_vistos) - len(chaves)} posts já vistos pulados")
+    for vaga in posts_coletados:
+        print(f"  + {vaga['titulo'][:40]}... ({vaga['forma_contato']})")
+    etapa.imprimir_metricas()
+    return posts_coletados
+
+
+def _scroll_e_extrair_posts_legado(driver, max_scrolls=30):
+    """Modo legado: relê o texto e os links da página inteira a cada scroll."""
     posts_coletados = []
     textos_vistos = set()
     ultimo_posts_pagina = 0
 
-    print("Fazendo scroll e coletando posts...")
-
     # Clica no body para focar
     try:
         body = driver.find_element(By.TAG_NAME, "body")
@@ -285,15 +328,15 @@ def scroll_e_extrair_posts(driver, max_scrolls=30):
         pass
 
     for i in range(max_scrolls):
-        # Usa Page Down para scroll
+        # Usa Page Down para scroll e espera a página crescer
+        altura = altura_scroll(driver)
         try:
             body = driver.find_element(By.TAG_NAME, "body")
             for _ in range(5):
                 body.send_keys(Keys.PAGE_DOWN)
-                time.sleep(0.2)
         except:
             driver.execute_script("window.scrollBy(0, 1000);")
-        time.sleep(1.5)
+        esperar_altura(driver, "linkedin_posts.scroll_legado", altura, maximo=3)
 
         # Pega texto e HTML da página
         try:
@@ -301,22 +344,13 @@ def scroll_e_extrair_posts(driver, max_scrolls=30):
 
             # Coleta todos os links úteis da página
             all_links = driver.find_elements(By.TAG_NAME, "a")
-            perfis_na_pagina = {}
-            links_lnkd = []  # Links encurtados do LinkedIn (vagas)
-
+            links = []
             for link in all_links:
                 try:
-                    href = link.get_attribute("href") or ""
-                    # Perfis de usuários
-                    if "/in/" in href:
-                        nome = link.text.strip()
-                        if nome and len(nome) > 2 and len(nome) < 50:
-                            perfis_na_pagina[nome] = href.split("?")[0]
-                    # Links encurtados (lnkd.in) - geralmente são links de vagas
-                    elif "lnkd.in" in href:
-                        links_lnkd.append(href)
+                    links.append({"href": link.get_attribute("href") or "", "texto": link.text.strip()})
                 except:
                     pass
+            perfis_na_pagina, links_lnkd = separar_links(links)
         except:
             continue
 
@@ -331,78 +365,15 @@ def scroll_e_extrair_posts(driver, max_scrolls=30):
             if len(texto) < 50:
                 continue
 
-            texto_hash = hash(texto[:200])
+            texto_hash = hash_texto(texto)
             if texto_hash in textos_vistos:
                 continue
             textos_vistos.add(texto_hash)
 
-            if not eh_post_produto(texto):
-                continue
-
-            # Extrai dados do texto
-            emails = extrair_emails(texto)
-            links_externos = extrair_links_externos(texto)
-            titulo = extrair_titulo_vaga(texto)
-            empresa = extrair_empresa(texto)
-            modalidade = classificar_modalidade(texto)
-            tipo_vaga = classificar_tipo_vaga(texto)
-
-            # Extrai autor do texto
-            nome_autor = None
-            linhas = texto.split('\n')
-            for linha in linhas[:3]:
-                if '•' in linha:
-                    nome_autor = linha.split('•')[0].strip()
-                    break
-
-            # Link da vaga: prioriza links externos, depois lnkd.in
-            link_vaga = None
-            if links_externos:
-                link_vaga = links_externos[0]
-            elif links_lnkd:
-                # Pega o próximo link lnkd.in disponível
-                link_vaga = links_lnkd.pop(0) if links_lnkd else None
-
-            # Perfil para contato: SÓ se o texto pedir explicitamente
-            perfil_autor = None
-            if texto_pede_contato(texto) and nome_autor:
-                nome_lower = nome_autor.lower()
-                for nome_link, url_perfil in perfis_na_pagina.items():
-                    if nome_lower in nome_link.lower() or nome_link.lower() in nome_lower:
-                        perfil_autor = url_perfil
-                        break
-
-            # Determina forma de contato
-            if link_vaga:
-                forma_contato = 'link'
-            elif emails:
-                forma_contato = 'email'
-            elif perfil_autor:
-                forma_contato = 'mensagem'
-            else:
-                forma_contato = 'indefinido'
-
-            # Só salva se tiver alguma forma de aplicar
-            if forma_contato == 'indefinido':
-                continue
-
-            posts_coletados.append({
-                "titulo": titulo,
-                "empresa": empresa,
-                "tipo_vaga": tipo_vaga,
-                "fonte": "linkedin_posts",
-                "link_vaga": link_vaga,
-                "localizacao": None,
-                "modalidade": modalidade,
-                "requisito_ingles": "nao_especificado",
-                "forma_contato": forma_contato,
-                "email_contato": emails[0] if emails else None,
-                "perfil_autor": perfil_autor,
-                "nome_autor": None,  # Não precisa mais
-                "data_coleta": date.today().isoformat(),
-            })
-
-            print(f"  + {titulo[:40]}... ({forma_contato})")
+            vaga = montar_vaga_post(texto, perfis_na_pagina, links_lnkd)
+            if vaga:
+                posts_coletados.append(vaga)
+                print(f"  + {vaga['titulo'][:40]}... ({vaga['forma_contato']})")
 
         # Para se não encontrou novos posts
         posts_pagina = len(partes) - 1
@@ -414,6 +385,11 @@ def scroll_e_extrair_posts(driver, max_scrolls=30):
     return posts_coletados
 
 
+def _links_para_ia(hrefs):
+    """Links que interessam à análise com IA (vagas encurtadas, perfis, vagas do LinkedIn)."""
+    return [h.split("?")[0] for h in hrefs if "lnkd.in" in h or "/in/" in h or "/jobs/" in h]
+
+
 def coletar_posts_brutos(max_scrolls=30, headless=False):
     """Coleta posts brutos (texto + links) para análise com IA."""
 
@@ -422,37 +398,62 @@ def coletar_posts_brutos(max_scrolls=30, headless=False):
     posts_brutos = []
     textos_vistos = set()
 
+    def adicionar(texto, links_post):
+        if len(texto) < 50:
+            return
+        texto_hash = hash_texto(texto)
+        if texto_hash in textos_vistos:
+            return
+        textos_vistos.add(texto_hash)
+        posts_brutos.append({
+            "id": len(posts_brutos) + 1,
+            "texto": texto[:500],
+            "links": links_post
+        })
+
     try:
         driver = criar_driver_com_perfil(headless=headless)
         driver.get(url)
-        time.sleep(5)
+        esperar_rede_ociosa(driver, "linkedin_posts.carregar", maximo=8, max_pendentes=2)
 
         print(f"URL: {driver.current_url}")
         print("Coletando posts brutos...")
 
+        if POSTS_INCREMENTAL:
+            try:
+                for i, novos in posts_incrementais(driver, max_scrolls):
+                    # Cada post leva os próprios links
+                    for post in novos:
+                        adicionar(texto_do_post(post["texto"]), _links_para_ia(l["href"] for l in post["links"]))
+                    if i % 5 == 0:
+                        print(f"  Scroll {i+1}: {len(novos)} posts novos, {len(posts_brutos)} coletados")
+                print(f"\nTotal: {len(posts_brutos)} posts brutos coletados")
+                return posts_brutos
+            except SeletorPostsDesatualizado:
+                print("  Posts não encontrados pelo seletor; usando o modo legado")
+
         body = driver.find_element(By.TAG_NAME, "body")
         body.click()
 
         for i in range(max_scrolls):
-            # Scroll
+            # Scroll e espera a página crescer
+            altura = altura_scroll(driver)
             for _ in range(5):
                 body.send_keys(Keys.PAGE_DOWN)
-                time.sleep(0.2)
-            time.sleep(1.5)
+            esperar_altura(driver, "linkedin_posts.scroll_legado", altura, maximo=3)
 
             # Coleta texto e links
             body_text = driver.find_element(By.TAG_NAME, "body").text
             all_links = driver.find_elements(By.TAG_NAME, "a")
 
             # Mapeia links por posição aproximada
-            links_pagina = []
+            hrefs = []
             for link in all_links:
                 try:
-                    href = link.get_attribute("href") or ""
-                    if "lnkd.in" in href or "/in/" in href or "/jobs/" in href:
-                        links_pagina.append(href.split("?")[0])
+                    hrefs.append(link.get_attribute("href") or "")
                 except:
                     pass
+            links_pagina = _links_para_ia(hrefs)
 
             # Divide posts
             partes = body_text.split("Publicação no feed")
@@ -461,23 +462,9 @@ def coletar_posts_brutos(max_scrolls=30, headless=False):
                 print(f"  Scroll {i+1}: {len(partes)-1} posts, {len(posts_brutos)} coletados")
 
             for idx, parte in enumerate(partes[1:]):
-                texto = parte.split("Gostar")[0].strip()
-                if len(texto) < 50:
-                    continue
-
-                texto_hash = hash(texto[:200])
-                if texto_hash in textos_vistos:
-                    continue
-                textos_vistos.add(texto_hash)
-
                 # Associa links próximos ao post
                 links_post = links_pagina[idx*3:(idx+1)*3] if links_pagina else []
-
-                posts_brutos.append({
-                    "id": len(posts_brutos) + 1,
-                    "texto": texto[:500],
-                    "links": links_post
-                })
+                adicionar(parte.split("Gostar")[0].strip(), links_post)
 
         print(f"\nTotal: {len(posts_brutos)} posts brutos coletados")
         return posts_brutos
@@ -488,19 +475,25 @@ def coletar_posts_brutos(max_scrolls=30, headless=False):
 
     finally:
         if driver:
-            driver.quit()
+            fechar_driver(driver)
 
 
-def coletar_vagas_linkedin_posts(max_scrolls=30, headless=False):
-    """Coleta vagas de publicações do LinkedIn (método legado sem IA)."""
+def coletar_vagas_linkedin_posts(max_scrolls=30, headless=False, profile_dir=None, driver=None):
+    """
+    Coleta vagas de publicações do LinkedIn (método legado sem IA).
+
+    driver: sessão emprestada (ex.: do driver_pool); se None abre um Chrome e fecha ao final.
+    """
 
     url = "https://www.linkedin.com/search/results/content/?keywords=ux%20vaga&datePosted=%22past-24h%22&sortBy=%22date_posted%22"
-    driver = None
+    driver_proprio = driver is None
 
     try:
-        driver = criar_driver_com_perfil(headless=headless)
+        if driver_proprio:
+            driver = criar_driver_com_perfil(headless=headless, profile_dir=profile_dir)
+        driver = gravar_se_ativo(driver, "linkedin_posts", passos=(JS_POSTS_NOVOS,))
         driver.get(url)
-        time.sleep(5)
+        esperar_rede_ociosa(driver, "linkedin_posts.carregar", maximo=8, max_pendentes=2)
 
         print(f"URL: {driver.current_url}")
         print("Coletando publicações...")
@@ -515,8 +508,8 @@ def coletar_vagas_linkedin_posts(max_scrolls=30, headless=False):
         return []
 
     finally:
-        if driver:
-            driver.quit()
+        if driver and driver_proprio:
+            fechar_driver(driver)
 
 
 def coletar_e_analisar_com_ia(max_scrolls=30, headless=False):
@@ -5,7 +5,11 @@ from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 import json
 import os
-import time
+import shutil
+import tempfile
+
+from .cdp import habilitar_eventos
+from .modo_leve import NAVEGADOR_LEVE, aplicar_preferencias, ativar_bloqueios
 
 COOKIES_DIR = os.path.join(os.path.dirname(__file__), "cookies")
 # Usa pasta no home do usuário para evitar problemas de permissão
@@ -22,14 +26,21 @@ def salvar_cookies(driver, site: str):
     print(f"Cookies salvos em: {filepath}")
 
 
-def carregar_cookies(driver, site: str) -> bool:
-    """Carrega cookies de arquivo JSON para o navegador."""
+def ler_cookies(site: str) -> list[dict]:
+    """Cookies salvos do site (formato do Selenium); lista vazia se não houver."""
     filepath = os.path.join(COOKIES_DIR, f"{site}_cookies.json")
     if not os.path.exists(filepath):
-        return False
+        return []
 
     with open(filepath, "r") as f:
-        cookies = json.load(f)
+        return json.load(f) or []
+
+
+def carregar_cookies(driver, site: str) -> bool:
+    """Carrega cookies de arquivo JSON para o navegador."""
+    cookies = ler_cookies(site)
+    if not cookies:
+        return False
 
     for cookie in cookies:
         try:
@@ -39,12 +50,36 @@ def carregar_cookies(driver, site: str) -> bool:
     return True
 
 
-def criar_driver_com_perfil(headless=False):
-    """Cria driver do Chrome com perfil persistente."""
+def copiar_perfil() -> str:
+    """
+    Copia o perfil persistente para uma pasta temporária e retorna o caminho.
+
+    O Chrome não abre o mesmo perfil em duas instâncias, então cada processo da coleta
+    paralela usa a sua cópia (com a sessão logada). Caches e travas não são copiados.
+    Quem chama remove a pasta ao terminar.
+    """
     os.makedirs(PROFILE_DIR, exist_ok=True)
+    destino = os.path.join(tempfile.mkdtemp(prefix="vagas_ux_perfil_"), "perfil")
+    shutil.copytree(
+        PROFILE_DIR,
+        destino,
+        symlinks=True,
+        ignore=shutil.ignore_patterns("Singleton*", "*Cache*", "Crashpad", "lockfile"),
+    )
+    return destino
+
+
+def criar_driver_com_perfil(headless=False, profile_dir=None, leve=NAVEGADOR_LEVE):
+    """
+    Cria driver do Chrome com perfil persistente (ou com a cópia em profile_dir).
+
+    leve: sem imagens, mídia, fontes e rastreadores (ver modo_leve).
+    """
+    profile_dir = profile_dir or PROFILE_DIR
+    os.makedirs(profile_dir, exist_ok=True)
 
     options = Options()
-    options.add_argument(f"--user-data-dir={PROFILE_DIR}")
+    options.add_argument(f"--user-data-dir={profile_dir}")
     options.add_argument("--window-size=1200,800")
     options.add_argument("--lang=pt-BR")
     options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
@@ -55,7 +90,13 @@ def criar_driver_com_perfil(headless=False):
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
 
+    habilitar_eventos(options)
+    if leve:
+        aplicar_preferencias(options, "linkedin")
+
     driver = webdriver.Chrome(options=options)
+    if leve:
+        ativar_bloqueios(driver, "linkedin")
     return driver
 
 
@@ -67,7 +108,7 @@ def login_linkedin():
     print("3. Quando estiver logado, volte aqui e pressione ENTER")
     print("=" * 30)
 
-    driver = criar_driver_com_perfil(headless=False)
+    driver = criar_driver_com_perfil(headless=False, leve=False)
     driver.get("https://www.linkedin.com/login")
 
     input("\nPressione ENTER quando terminar o login...")
@@ -85,7 +126,7 @@ def login_indeed():
     print("3. Quando estiver logado, volte aqui e pressione ENTER")
     print("=" * 30)
 
-    driver = criar_driver_com_perfil(headless=False)
+    driver = criar_driver_com_perfil(headless=False, leve=False)
     driver.get("https://secure.indeed.com/auth")
 
     input("\nPressione ENTER quando terminar o login...")
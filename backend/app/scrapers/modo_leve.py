@@ -0,0 +1,140 @@
+"""
+Modo "leve" do Chrome: não carrega imagens, vídeos, fontes nem rastreadores.
+
+Os coletores só leem texto e links, então o resto só atrasa o carregamento e ocupa
+memória. As imagens são bloqueadas pelas preferências do Chrome (nem chegam a ser
+pedidas) e o resto por padrões de URL via CDP (Network.setBlockedURLs):
+
+    options = Options()
+    aplicar_preferencias(options, "linkedin")
+    driver = webdriver.Chrome(options=options)
+    ativar_bloqueios(driver, "linkedin")
+
+Cada site tem uma lista de permissões (NAVEGADOR_LEVE_PERMITIR_<SITE>: categorias de
+BLOQUEIOS ou padrões de URL, separados por vírgula) para quando algo bloqueado fizer
+falta. As requisições bloqueadas e os bytes recebidos são contados pelos eventos CDP
+(as imagens barradas pelas preferências não chegam a virar requisição e não entram
+na contagem), por fonte: iniciar_economia(fonte) zera a contagem e atribui a ela o
+tráfego de todos os navegadores do processo até a próxima fonte.
+"""
+import os
+from collections import Counter
+
+from .cdp import registro_cdp
+
+NAVEGADOR_LEVE = os.getenv("NAVEGADOR_LEVE", "1") == "1"
+
+BLOQUEIOS = {
+    "imagens": [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+        "*media.licdn.com/dms/image*",
+    ],
+    "midia": ["*.mp4", "*.webm", "*.m3u8", "*.mp3", "*dms.licdn.com/playlist*"],
+    "fontes": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"],
+    "rastreadores": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+        "*connect.facebook.net*", "*hotjar.com*", "*px.ads.linkedin.com*", "*linkedin.com/li/track*",
+        "*bat.bing.com*", "*clarity.ms*", "*scorecardresearch.com*", "*quantserve.com*",
+    ],
+}
+
+# Tamanho típico (bytes) de cada tipo de recurso, para estimar a economia
+TAMANHO_MEDIO = {"Image": 40_000, "Media": 500_000, "Font": 30_000, "Script": 60_000}
+TAMANHO_OUTROS = 10_000
+
+_economia: dict[str, Counter] = {}
+_fonte = None  # fonte em coleta neste processo (iniciar_economia); sem ela conta por site
+
+
+def permitidos(site: str) -> set[str]:
+    """Categorias e padrões liberados para o site (NAVEGADOR_LEVE_PERMITIR_<SITE>)."""
+    valor = os.getenv(f"NAVEGADOR_LEVE_PERMITIR_{site.upper()}", "")
+    return {item.strip() for item in valor.split(",") if item.strip()}
+
+
+def padroes_bloqueados(site: str) -> list[str]:
+    """Padrões de URL bloqueados no site, já sem os da lista de permissões."""
+    liberados = permitidos(site)
+    return [
+        padrao
+        for categoria, padroes in BLOQUEIOS.items()
+        if categoria not in liberados
+        for padrao in padroes
+        if padrao not in liberados
+    ]
+
+
+def aplicar_preferencias(options, site: str):
+    """Preferências do Chrome do modo leve (imagens, som e notificações desligados)."""
+    prefs = {"profile.default_content_setting_values.notifications": 2}
+    if "imagens" not in permitidos(site):
+        prefs["profile.managed_default_content_settings.images"] = 2
+        options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", prefs)
+    options.add_argument("--mute-audio")
+    return options
+
+
+def ativar_bloqueios(driver, site: str):
+    """Bloqueia os padrões do site via CDP e passa a contar o que foi bloqueado/recebido."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": padroes_bloqueados(site)})
+
+    tipos: dict[str, str] = {}
+    registro = registro_cdp(driver)
+
+    def contagem() -> Counter:
+        return _economia.setdefault(_fonte or site, Counter())
+
+    def pedido(params):
+        tipos[params.get("requestId")] = params.get("type", "Other")
+
+    def recebido(params):
+        tipos.pop(params.get("requestId"), None)
+        economia = contagem()
+        economia["requisicoes"] += 1
+        economia["bytes_recebidos"] += int(params.get("encodedDataLength", 0))
+
+    def falhou(params):
+        tipo = tipos.pop(params.get("requestId"), params.get("type", "Other"))
+        if params.get("blockedReason") == "inspector":  # bloqueada por setBlockedURLs
+            economia = contagem()
+            economia["bloqueadas"] += 1
+            economia[f"bloqueadas_{tipo}"] += 1
+            economia["bytes_economizados_estimados"] += TAMANHO_MEDIO.get(tipo, TAMANHO_OUTROS)
+
+    registro.ouvir("Network.requestWillBeSent", pedido)
+    registro.ouvir("Network.loadingFinished", recebido)
+    registro.ouvir("Network.loadingFailed", falhou)
+
+
+def fechar_driver(driver):
+    """Lê os últimos eventos (para a contagem do modo leve) e fecha o navegador."""
+    try:
+        registro_cdp(driver).drenar()
+    except Exception:
+        pass
+    driver.quit()
+
+
+def iniciar_economia(fonte: str):
+    """Zera a contagem da fonte; o tráfego dos navegadores do processo passa a contar para ela."""
+    global _fonte
+    _fonte = fonte
+    _economia[fonte] = Counter()
+
+
+def economia(fonte: str) -> dict:
+    """Requisições e bytes recebidos, requisições bloqueadas (por tipo) e bytes economizados (estimativa)."""
+    return dict(_economia.get(fonte, {}))
+
+
+def imprimir_economia(fonte: str):
+    """Resumo do modo leve na coleta da fonte (desde iniciar_economia)."""
+    dados = economia(fonte)
+    if not dados:
+        return
+    por_tipo = ", ".join(f"{k.removeprefix('bloqueadas_')} {v}" for k, v in sorted(dados.items()) if k.startswith("bloqueadas_"))
+    print(f"  modo leve {fonte}: {dados.get('bloqueadas', 0)} requisições bloqueadas ({por_tipo or 'nenhuma'}), "
+          f"~{dados.get('bytes_economizados_estimados', 0) / 2**20:.1f} MB economizados; "
+          f"{dados.get('requisicoes', 0)} requisições e {dados.get('bytes_recebidos', 0) / 2**20:.1f} MB recebidos")
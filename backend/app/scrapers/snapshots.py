@@ -0,0 +1,307 @@
+"""
+Gravação e reprodução das páginas coletadas (snapshots), para testar e medir os
+parsers sem navegador e sem login.
+
+Com SNAPSHOTS=gravar cada coletor grava os passos da coleta em
+SNAPSHOTS_DIR/<fonte>/<execução>/<passo>.json.gz: URL, HTML da página (SNAPSHOTS_HTML),
+os dados extraídos no passo (texto e links dos posts, cards das vagas) e os
+resultados dos demais comandos ao navegador desde o passo anterior (execute_script
+e esperas). Os coletores do LinkedIn usam o DriverGravador (um passo por chamada do JS
+de extração); o Indeed grava o HTML de cada página de resultados.
+
+Na reprodução o DriverReproducao devolve os resultados gravados, na ordem, para os
+mesmos scripts e esperas, então scroll_e_extrair_vagas e scroll_e_extrair_posts rodam
+como no navegador; o Indeed passa o HTML de cada passo ao parsear_cards:
+
+    python -m app.scrapers.snapshots listar
+    python -m app.scrapers.snapshots reproduzir linkedin_posts [execução]
+
+As respostas da API do LinkedIn (linkedin_api) são gravadas à parte, por
+LINKEDIN_SALVAR_CAPTURAS.
+"""
+import glob
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Iterator, Optional
+
+SNAPSHOTS = os.getenv("SNAPSHOTS", "")  # "gravar" liga a gravação
+SNAPSHOTS_DIR = os.getenv(
+    "SNAPSHOTS_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "snapshots"),
+)
+# Grava o HTML da página em cada passo (um page_source a mais por passo)
+SNAPSHOTS_HTML = os.getenv("SNAPSHOTS_HTML", "1") == "1"
+
+
+class GravacaoEsgotada(Exception):
+    """A reprodução pediu um comando além dos gravados (o coletor mudou de comportamento)."""
+
+
+def chave_script(script: str) -> str:
+    """Identifica o script nos comandos gravados."""
+    return hashlib.sha1(script.encode("utf-8")).hexdigest()[:12]
+
+
+def _serializavel(valor):
+    """Resultado de comando em JSON (WebElements viram None: não há como reproduzi-los)."""
+    if isinstance(valor, (str, int, float, bool)) or valor is None:
+        return valor
+    if isinstance(valor, dict):
+        return {str(k): _serializavel(v) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_serializavel(v) for v in valor]
+    return None
+
+
+class GravadorSnapshots:
+    """Grava os passos de uma execução de uma fonte (um arquivo .json.gz por passo)."""
+
+    def __init__(self, fonte: str, execucao: str = None, diretorio: str = SNAPSHOTS_DIR):
+        self.fonte = fonte
+        self.execucao = execucao or f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.pasta = os.path.join(diretorio, fonte, self.execucao)
+        self.passos = 0
+        self._trava = threading.Lock()
+        os.makedirs(self.pasta, exist_ok=True)
+
+    def passo(self, url: str = None, html: str = None, dados=None, comandos: list = ()) -> str:
+        """Grava um passo e retorna o caminho do arquivo."""
+        with self._trava:
+            numero = self.passos
+            self.passos += 1
+        registro = {
+            "fonte": self.fonte,
+            "execucao": self.execucao,
+            "passo": numero,
+            "url": url,
+            "html": html,
+            "dados": _serializavel(dados),
+            "comandos": list(comandos),
+        }
+        arquivo = os.path.join(self.pasta, f"{numero:05d}.json.gz")
+        with gzip.open(arquivo, "wt", encoding="utf-8", compresslevel=6) as f:
+            json.dump(registro, f, ensure_ascii=False)
+        return arquivo
+
+    def pagina(self, url: str, html: str) -> str:
+        """Passo de uma página baixada por HTTP (Indeed)."""
+        return self.passo(url=url, html=html)
+
+
+def gravador_se_ativo(fonte: str) -> Optional[GravadorSnapshots]:
+    """Gravador de uma nova execução da fonte, se SNAPSHOTS=gravar."""
+    return GravadorSnapshots(fonte) if SNAPSHOTS == "gravar" else None
+
+
+class DriverGravador:
+    """
+    Repassa tudo ao WebDriver e grava os resultados de execute_script e das esperas.
+
+    Cada chamada de um dos scripts em `passos` (o JS de extração do coletor) fecha um
+    passo, com os comandos desde o passo anterior, o resultado como dados e o HTML.
+    """
+
+    def __init__(self, driver, gravador: GravadorSnapshots, passos: tuple = ()):
+        self._driver = driver
+        self.gravador = gravador
+        self._passos = {chave_script(script) for script in passos}
+        self._comandos: list = []
+        self._pausado = False
+
+    def __getattr__(self, nome):
+        return getattr(self._driver, nome)
+
+    def get(self, url: str):
+        self._comandos.append(["get", url])
+        return self._driver.get(url)
+
+    def execute_script(self, script: str, *args):
+        resultado = self._driver.execute_script(script, *args)
+        if self._pausado:
+            return resultado
+        chave = chave_script(script)
+        if chave in self._passos:
+            self._comandos.append([chave])
+            html = self._driver.page_source if SNAPSHOTS_HTML else None
+            self.gravador.passo(self._driver.current_url, html, resultado, self._comandos)
+            self._comandos = []
+        else:
+            self._comandos.append([chave, _serializavel(resultado)])
+        return resultado
+
+    def espera_gravada(self, nome: str, executar) -> bool:
+        """Executa a espera sem gravar os comandos dela; grava só o resultado."""
+        self._pausado = True
+        try:
+            ok = executar()
+        finally:
+            self._pausado = False
+        self._comandos.append([f"espera:{nome}", ok])
+        return ok
+
+    def encerrar_gravacao(self):
+        """Grava os comandos depois do último passo."""
+        if self._comandos:
+            self.gravador.passo(comandos=self._comandos)
+            self._comandos = []
+
+    def quit(self):
+        self.encerrar_gravacao()
+        return self._driver.quit()
+
+
+def gravar_se_ativo(driver, fonte: str, passos: tuple = ()):
+    """O driver dentro de um DriverGravador de uma nova execução, se SNAPSHOTS=gravar."""
+    gravador = gravador_se_ativo(fonte)
+    if gravador is None or isinstance(driver, DriverGravador):
+        return driver
+    return DriverGravador(driver, gravador, passos)
+
+
+class ElementoGravado:
+    """Elemento devolvido por find_element na reprodução (só serve de argumento para scripts)."""
+
+    def __init__(self, seletor: str):
+        self.seletor = seletor
+        self.text = ""
+
+    def get_attribute(self, nome):
+        return None
+
+
+class DriverReproducao:
+    """Driver sem navegador que devolve os resultados gravados de uma execução."""
+
+    def __init__(self, fonte: str, execucao: str = None, diretorio: str = SNAPSHOTS_DIR):
+        self.execucao = execucao or ultima_execucao(fonte, diretorio)
+        self._filas: dict[str, deque] = defaultdict(deque)
+        self._passos = list(ler_passos(fonte, self.execucao, diretorio))
+        self._atual = 0
+        for indice, registro in enumerate(self._passos):
+            for comando in registro["comandos"]:
+                # O resultado do JS de extração fica só em "dados"
+                resultado = comando[1] if len(comando) > 1 else registro["dados"]
+                self._filas[comando[0]].append((indice, resultado))
+        self.current_url = next((r["url"] for r in self._passos if r["url"]), None)
+
+    def restantes(self, script: str) -> int:
+        """Quantas chamadas gravadas do script ainda não foram reproduzidas."""
+        return len(self._filas[chave_script(script)])
+
+    def _proximo(self, chave: str):
+        fila = self._filas[chave]
+        if not fila:
+            raise GravacaoEsgotada(chave)
+        self._atual, resultado = fila.popleft()
+        if self._passos[self._atual]["url"]:
+            self.current_url = self._passos[self._atual]["url"]
+        return resultado
+
+    @property
+    def page_source(self) -> str:
+        if not self._passos:
+            return ""
+        return self._passos[self._atual]["html"] or ""
+
+    def get(self, url: str):
+        self.current_url = url
+
+    def execute_script(self, script: str, *args):
+        return self._proximo(chave_script(script))
+
+    def espera_gravada(self, nome: str, executar) -> bool:
+        # Espera além das gravadas: o coletor seguiria até o fim da página
+        try:
+            return self._proximo(f"espera:{nome}")
+        except GravacaoEsgotada:
+            return False
+
+    def find_element(self, by, seletor):
+        return ElementoGravado(seletor)
+
+    def find_elements(self, by, seletor):
+        return []
+
+    def get_log(self, tipo):
+        raise GravacaoEsgotada("sem eventos CDP na reprodução")
+
+    def execute_cdp_cmd(self, comando, params):
+        return {}
+
+    def quit(self):
+        pass
+
+
+def execucoes(fonte: str, diretorio: str = SNAPSHOTS_DIR) -> list[str]:
+    """Execuções gravadas da fonte, da mais antiga para a mais nova."""
+    return sorted(os.path.basename(p) for p in glob.glob(os.path.join(diretorio, fonte, "*")) if os.path.isdir(p))
+
+
+def ultima_execucao(fonte: str, diretorio: str = SNAPSHOTS_DIR) -> str:
+    gravadas = execucoes(fonte, diretorio)
+    if not gravadas:
+        raise FileNotFoundError(f"Nenhum snapshot de {fonte} em {diretorio}")
+    return gravadas[-1]
+
+
+def ler_passos(fonte: str, execucao: str, diretorio: str = SNAPSHOTS_DIR) -> Iterator[dict]:
+    """Passos gravados da execução, em ordem."""
+    for arquivo in sorted(glob.glob(os.path.join(diretorio, fonte, execucao, "*.json.gz"))):
+        with gzip.open(arquivo, "rt", encoding="utf-8") as f:
+            yield json.load(f)
+
+
+def reproduzir(fonte: str, execucao: str = None, diretorio: str = SNAPSHOTS_DIR) -> list[dict]:
+    """Roda a extração da fonte sobre uma execução gravada (a última, por padrão) e retorna as vagas."""
+    if fonte == "indeed":
+        from .indeed_http import parsear_cards
+
+        execucao = execucao or ultima_execucao(fonte, diretorio)
+        vagas = {}
+        for registro in ler_passos(fonte, execucao, diretorio):
+            if registro["html"]:
+                for vaga in parsear_cards(registro["html"], registro["url"]):
+                    vagas.setdefault(vaga["link_vaga"], vaga)
+        return list(vagas.values())
+
+    driver = DriverReproducao(fonte, execucao, diretorio)
+    if fonte == "linkedin_jobs":
+        from .linkedin_jobs import JS_EXTRAIR_CARDS, filtrar_vagas_produto, scroll_e_extrair_vagas
+
+        vagas = {}
+        # Uma chamada por página da coleta gravada (cada uma termina na espera do fim da
+        # lista que falhou ou no limite de scrolls)
+        while driver.restantes(JS_EXTRAIR_CARDS):
+            for vaga in scroll_e_extrair_vagas(driver, max_scrolls=driver.restantes(JS_EXTRAIR_CARDS)):
+                vagas.setdefault(vaga["link_vaga"], vaga)
+        return filtrar_vagas_produto(list(vagas.values()))
+
+    if fonte == "linkedin_posts":
+        from .linkedin_posts import JS_POSTS_NOVOS, scroll_e_extrair_posts
+
+        return scroll_e_extrair_posts(
+            driver, max_scrolls=driver.restantes(JS_POSTS_NOVOS), incremental=True, filtrar_vistos=False
+        )
+
+    raise ValueError(f"Fonte desconhecida: {fonte}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 2 and sys.argv[1] == "reproduzir":
+        inicio = time.perf_counter()
+        vagas = reproduzir(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None)
+        print(f"\n{len(vagas)} vagas em {time.perf_counter() - inicio:.2f}s")
+        for v in vagas[:10]:
+            print(f"  - {v['titulo']} @ {v.get('empresa')}")
+    else:
+        for fonte in ("indeed", "linkedin_jobs", "linkedin_posts"):
+            for execucao in execucoes(fonte):
+                passos = len(glob.glob(os.path.join(SNAPSHOTS_DIR, fonte, execucao, "*.json.gz")))
+                print(f"{fonte:>15} {execucao} {passos} passos")
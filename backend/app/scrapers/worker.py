@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Worker de coleta: executa os jobs enfileirados pela API (POST /api/scraper/...).
+
+A fila é a tabela jobs_coleta do próprio banco (sem broker externo). Cada job é
+pego por um único worker e o progresso por fonte é gravado ao fim de cada fonte,
+para ser acompanhado em GET /api/scraper/jobs/{id}.
+
+Uso:
+    python app/scrapers/worker.py
+    python app/scrapers/worker.py --headless --intervalo 10
+    python app/scrapers/worker.py --uma-vez   # processa a fila e sai
+    python app/scrapers/worker.py --parallel 3  # fontes de um job em processos paralelos
+    python app/scrapers/worker.py --pool        # mantém os Chromes abertos entre jobs
+"""
+import sys
+import os
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from app.database import SessionLocal, engine
+from app import crud, models, schemas
+from app.filtro_vistos import garantir_filtro, marcar_gravados
+from app.migrations import aplicar_migracoes
+from app.scrapers.coleta_paralela import COLETA_PARALELO, coletar_fontes
+from app.scrapers.driver_pool import criar_pools
+
+
+def log(msg: str):
+    """Log com timestamp."""
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+
+
+def salvar_vagas(db, vagas_coletadas: list[dict], vistos=()) -> dict:
+    """
+    Salva as vagas coletadas e retorna os contadores de progresso da fonte. Depois da
+    gravação marca no filtro de vistos as chaves da coleta (`vistos`), menos as das
+    vagas inválidas.
+    """
+    validas = []
+    invalidas = []
+    for vaga_dict in vagas_coletadas:
+        try:
+            validas.append(schemas.VagaCreate(**vaga_dict))
+        except Exception as e:
+            invalidas.append(vaga_dict)
+            print(f"  Erro ao salvar: {e}")
+
+    novas = crud.filtrar_duplicatas(db, validas)
+    inseridas = crud.inserir_vagas_ignorando_duplicatas(db, novas)["inseridas"]
+    marcar_gravados(vistos, invalidas)
+    return {"coletadas": len(vagas_coletadas), "novas": inseridas, "ignoradas": len(vagas_coletadas) - inseridas}
+
+
+@contextmanager
+def heartbeat(job_id: int, worker: str, intervalo: float = crud.JOB_HEARTBEAT_SEGUNDOS):
+    """
+    Atualiza o heartbeat do job numa thread, com sessão própria, enquanto o bloco roda:
+    uma fonte lenta (mais que JOB_TIMEOUT_MINUTOS) não faz o job parecer abandonado.
+    """
+    parar = threading.Event()
+
+    def bater():
+        while not parar.wait(intervalo):
+            db = SessionLocal()
+            try:
+                if not crud.registrar_heartbeat_job(db, job_id, worker):
+                    log(f"Job {job_id}: não está mais com este worker")
+                    return
+            except Exception as e:
+                log(f"Job {job_id}: erro no heartbeat: {e}")
+            finally:
+                db.close()
+
+    thread = threading.Thread(target=bater, name=f"heartbeat-job-{job_id}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        parar.set()
+        thread.join()
+
+
+def executar_job(db, job: models.JobColeta, headless: bool, paralelo: int = COLETA_PARALELO, pools=None):
+    """
+    Executa as fontes do job (em paralelo se paralelo > 1) e grava cada uma quando termina.
+
+    O erro de uma fonte não interrompe as outras. O heartbeat do job é atualizado a cada
+    JOB_HEARTBEAT_SEGUNDOS durante toda a execução.
+    """
+    # Lidos uma vez: reler o job depois de um commit abre uma transação que seguraria a
+    # conexão de escrita (única no SQLite) durante a coleta, e o heartbeat não gravaria
+    job_id, fontes, worker = job.id, list(job.fontes), job.worker
+    with heartbeat(job_id, worker):
+        for fonte in fontes:
+            crud.atualizar_progresso_job(db, job, fonte, status="executando")
+        log(f"Job {job_id}: coletando {', '.join(fontes)}")
+
+        for resultado in coletar_fontes(fontes, paralelo=paralelo, headless=headless, pools=pools):
+            fonte = resultado.fonte
+            segundos = round(resultado.segundos, 1)
+            try:
+                if resultado.erro:
+                    raise RuntimeError(resultado.erro)
+                contadores = salvar_vagas(db, resultado.vagas, resultado.vistos)
+                crud.atualizar_progresso_job(db, job, fonte, status="concluido", segundos=segundos, **contadores)
+                log(f"Job {job_id}: {fonte} — {contadores['coletadas']} coletadas, {contadores['novas']} novas ({segundos}s)")
+            except Exception as e:
+                db.rollback()
+                crud.atualizar_progresso_job(db, job, fonte, status="erro", segundos=segundos, erro=str(e))
+                log(f"Job {job_id}: {fonte} — erro: {e}")
+
+    crud.finalizar_job_coleta(db, job)
+
+
+def rodar_worker(
+    intervalo: float = 5.0,
+    headless: bool = False,
+    uma_vez: bool = False,
+    paralelo: int = COLETA_PARALELO,
+    usar_pool: bool = False,
+):
+    """
+    Loop do worker: pega o próximo job pendente, executa e repete.
+
+    Args:
+        intervalo: Segundos de espera quando a fila está vazia.
+        headless: Roda o navegador sem janela (pode não ter login).
+        uma_vez: Sai quando a fila esvaziar.
+        paralelo: Quantas fontes de um job coletar ao mesmo tempo (1 = em sequência).
+        usar_pool: Mantém sessões do Chrome abertas entre jobs (só no modo sequencial).
+    """
+    aplicar_migracoes(engine)
+
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    log(f"Worker {worker} iniciado")
+
+    pools = criar_pools(headless) if usar_pool and paralelo <= 1 else None
+
+    db = SessionLocal()
+    try:
+        # Filtro de vistos ausente ou cheio: reconstrói pelo banco antes dos coletores
+        garantir_filtro(db)
+        while True:
+            devolvidos = crud.devolver_jobs_abandonados(db)
+            if devolvidos:
+                log(f"{devolvidos} job(s) abandonado(s) devolvido(s) à fila")
+
+            job = crud.reivindicar_job_coleta(db, worker)
+            if job is None:
+                if uma_vez:
+                    break
+                time.sleep(intervalo)
+                continue
+
+            try:
+                executar_job(db, job, headless, paralelo, pools)
+            except BaseException as e:
+                db.rollback()
+                crud.finalizar_job_coleta(db, job, erro=str(e) or type(e).__name__)
+                raise
+            log(f"Job {job.id}: {job.status}")
+            if pools:
+                for nome in ("indeed", "linkedin_jobs"):
+                    m = pools[nome].metricas()
+                    log(f"Pool {nome.split('_')[0]}: {m['obtencoes']} obtenções, reuso {m['taxa_reuso']:.0%}, "
+                        f"espera média {m['espera_media_s']:.2f}s")
+    finally:
+        db.close()
+        for pool in set((pools or {}).values()):
+            pool.encerrar()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Worker da fila de coletas")
+    parser.add_argument("--intervalo", type=float, default=5.0, help="Espera (s) com a fila vazia")
+    parser.add_argument("--headless", action="store_true", help="Rodar sem mostrar navegador")
+    parser.add_argument("--uma-vez", action="store_true", help="Processar a fila e sair")
+    parser.add_argument("--parallel", type=int, default=COLETA_PARALELO, metavar="N",
+                        help="Coletar até N fontes de um job ao mesmo tempo (processos separados)")
+    parser.add_argument("--pool", action="store_true",
+                        help="Manter os Chromes abertos e logados entre jobs (modo sequencial)")
+    args = parser.parse_args()
+
+    try:
+        rodar_worker(args.intervalo, args.headless, args.uma_vez, args.parallel, args.pool)
+    except KeyboardInterrupt:
+        log("Worker encerrado")
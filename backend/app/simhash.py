@@ -0,0 +1,67 @@
+"""
+SimHash de 64 bits para detectar quase-duplicatas de texto (ex.: a mesma vaga
+repostada por vários recrutadores).
+
+As features são palavras e pares de palavras do texto normalizado: em posts curtos
+isso mantém reposts editados a poucos bits da original (tipicamente 3 a 7), enquanto
+textos sem relação ficam a 18 bits ou mais.
+
+A assinatura é dividida em 4 bandas de 16 bits guardadas em colunas indexadas.
+Duas assinaturas a até 3 bits de distância compartilham pelo menos uma banda
+(princípio da casa dos pombos), então a busca de candidatas é feita por igualdade
+nas bandas, sem varrer a tabela. Distâncias maiores são encontradas quando alguma
+banda coincide (a maioria dos casos até ~6 bits).
+"""
+import hashlib
+from typing import Optional
+
+from .fingerprint import normalizar_texto
+
+BITS = 64
+NUM_BANDAS = 4
+BITS_BANDA = BITS // NUM_BANDAS
+
+
+def _hash64(texto: str) -> int:
+    return int.from_bytes(hashlib.blake2b(texto.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _features(texto: str) -> list[str]:
+    palavras = normalizar_texto(texto).split()
+    return palavras + [f"{a} {b}" for a, b in zip(palavras, palavras[1:])]
+
+
+def calcular_simhash(texto: Optional[str]) -> Optional[int]:
+    """SimHash (inteiro sem sinal de 64 bits) das palavras e pares de palavras do texto."""
+    features = _features(texto or "")
+    if not features:
+        return None
+
+    # Bit ligado na assinatura quando a maioria das features tem o bit ligado.
+    # Contagem por coluna das strings binárias (do bit mais significativo ao menos).
+    metade = len(features) / 2
+    simhash = 0
+    for coluna in zip(*(format(_hash64(feature), "064b") for feature in features)):
+        simhash = simhash << 1 | (coluna.count("1") > metade)
+    return simhash
+
+
+def bandas(simhash: int) -> list[int]:
+    """Divide a assinatura em NUM_BANDAS inteiros de BITS_BANDA bits."""
+    mascara = (1 << BITS_BANDA) - 1
+    return [simhash >> (i * BITS_BANDA) & mascara for i in range(NUM_BANDAS)]
+
+
+def distancia(a: int, b: int) -> int:
+    """Distância de Hamming entre duas assinaturas."""
+    return bin((a ^ b) & ((1 << BITS) - 1)).count("1")
+
+
+def para_bigint(simhash: int) -> int:
+    """Converte para inteiro com sinal, que cabe numa coluna BIGINT."""
+    return simhash - (1 << BITS) if simhash >= 1 << (BITS - 1) else simhash
+
+
+def de_bigint(valor: int) -> int:
+    """Inverso de para_bigint."""
+    return valor + (1 << BITS) if valor < 0 else valor
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark da busca textual (GET /api/vagas?q=...) sobre uma base sintética.
+
+Uso:
+    python benchmarks/bench_busca.py --linhas 1000000
+    python benchmarks/bench_busca.py --url postgresql://.../bench --linhas 1000000
+
+ATENÇÃO: as tabelas do banco informado em --url são recriadas.
+Sem --url usa um SQLite temporário.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, models
+from app.busca import criar_indice_busca
+from app.database import Base
+
+CARGOS = ["Product Designer", "UX Designer", "UI Designer", "Product Manager", "Designer de Produto",
+          "UX Researcher", "Service Designer", "Head de Produto", "Product Owner", "Designer de Interação"]
+NIVEIS = ["Júnior", "Pleno", "Sênior", "Especialista", "Líder", "Staff"]
+PALAVRAS = ["remoto", "híbrido", "presencial", "figma", "pesquisa", "acessibilidade", "fintech", "saúde",
+            "educação", "varejo", "logística", "dados", "métricas", "design system", "prototipação",
+            "inglês", "benefícios", "plano de saúde", "vale refeição", "PJ", "CLT", "São Paulo", "Rio de Janeiro"]
+CONSULTAS = ["itau", "designer senior", "pesquisa acessibilidade", "ux researcher", "head produto",
+             "fintech figma", "empresa 4321", "designer de interacao", "product owner especialista"]
+
+
+def popular(engine, linhas: int, lote: int = 10000):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    criar_indice_busca(engine)
+
+    empresas = ["Itaú", "Nubank", "iFood", "Mercado Livre", "Stone"] + [f"Empresa {i}" for i in range(5000)]
+    rnd = random.Random(42)
+    hoje = date.today()
+    inicio = time.perf_counter()
+    with engine.begin() as conn:
+        for base in range(0, linhas, lote):
+            conn.execute(insert(models.Vaga), [
+                {
+                    "titulo": f"{rnd.choice(CARGOS)} {rnd.choice(NIVEIS)}",
+                    "empresa": rnd.choice(empresas),
+                    "fonte": "linkedin_jobs",
+                    "link_vaga": f"https://www.linkedin.com/jobs/view/{base + i}",
+                    "observacoes": " ".join(rnd.sample(PALAVRAS, 4)),
+                    "data_coleta": hoje - timedelta(days=rnd.randrange(60)),
+                }
+                for i in range(min(lote, linhas - base))
+            ])
+    print(f"{linhas} vagas inseridas em {time.perf_counter() - inicio:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da busca textual")
+    parser.add_argument("--linhas", type=int, default=1_000_000)
+    parser.add_argument("--repeticoes", type=int, default=20)
+    parser.add_argument("--url", help="URL do banco (padrão: SQLite temporário)")
+    args = parser.parse_args()
+
+    url = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    engine = create_engine(url)
+    print(f"Banco: {engine.url.render_as_string(hide_password=True)}")
+    popular(engine, args.linhas)
+
+    Sessao = sessionmaker(bind=engine)
+    print(f"{'consulta':<28} {'p50 (ms)':>9} {'p95 (ms)':>9} {'c/ total p50':>13}")
+    with Sessao() as db:
+        for consulta in CONSULTAS:
+            tempos, tempos_total = [], []
+            for _ in range(args.repeticoes):
+                inicio = time.perf_counter()
+                crud.get_vagas(db, limit=50, q=consulta, include_total=False)
+                tempos.append((time.perf_counter() - inicio) * 1000)
+            for _ in range(max(1, args.repeticoes // 4)):
+                inicio = time.perf_counter()
+                crud.get_vagas(db, limit=50, q=consulta, include_total=True)
+                tempos_total.append((time.perf_counter() - inicio) * 1000)
+            p95 = statistics.quantiles(tempos, n=20)[-1]
+            print(f"{consulta:<28} {statistics.median(tempos):>9.1f} {p95:>9.1f} {statistics.median(tempos_total):>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
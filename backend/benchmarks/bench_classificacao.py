@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark da classificação por termos (app/scrapers/classificacao.py): o autômato
+único de Aho-Corasick (e a varredura usada sem o pyahocorasick), item a item e em
+lote, contra a implementação antiga (um `in` por termo em cada função), num corpus
+sintético de títulos e posts.
+
+Confere também que as duas dão o mesmo resultado em todo o corpus.
+
+Uso:
+    python benchmarks/bench_classificacao.py --itens 100000
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import time
+
+from app.scrapers import classificacao
+from app.scrapers.classificacao import (
+    TERMOS_EXCLUIR, TERMOS_PRODUTO, TERMOS_PRODUTO_POSTS, Automato, classificar_modalidade, classificar_posts,
+    classificar_tipo_post, classificar_tipo_vaga, classificar_titulos, eh_post_produto, eh_vaga_produto,
+)
+
+CARGOS = [
+    "Product Designer", "UX Designer", "UI Designer", "UX/UI Designer", "Product Manager", "Product Owner",
+    "Head de Produto", "Service Designer", "Product Design Lead", "UX Researcher", "Designer de Produto",
+    "Desenvolvedor Backend", "Frontend Engineer", "Analista de Marketing", "Designer Gráfico", "QA Tester",
+    "Data Analyst", "Linux Sysadmin", "Growth Product Manager", "Engenheiro de Dados",
+]
+NIVEIS = ["", "Sênior ", "Pleno ", "Júnior ", "Sr. ", "Lead ", "Staff "]
+SUFIXOS = ["", " - Remoto", " (Híbrido)", " | Presencial", " - São Paulo", " - Fintech", " PJ"]
+
+
+def titulo_sintetico(r: random.Random, n: int) -> str:
+    return f"{r.choice(NIVEIS)}{r.choice(CARGOS)}{r.choice(SUFIXOS)} #{n}"
+
+
+def post_sintetico(r: random.Random, n: int) -> str:
+    return (
+        f"Autor {n} • 2º\nEstamos contratando {r.choice(CARGOS)} para o time de produto digital! "
+        f"Vaga {r.choice(['100% remota', 'híbrida em SP', 'presencial', 'remote first', ''])}, CLT. "
+        f"{'Requisitos: portfólio, pesquisa com usuários, Figma e design system. ' * r.randint(1, 6)}"
+        f"Interessados enviem CV para vagas{n}@exemplo.com.br ou https://lnkd.in/v{n}"
+    )
+
+
+# Implementação anterior (varredura com `in` por termo), para comparar
+def eh_vaga_produto_antigo(titulo):
+    titulo_lower = titulo.lower()
+    for termo in TERMOS_EXCLUIR:
+        if termo in titulo_lower:
+            return False
+    for termo in TERMOS_PRODUTO:
+        if termo in titulo_lower:
+            return True
+    return False
+
+
+def classificar_tipo_vaga_antigo(titulo):
+    t = titulo.lower()
+    if "product manager" in t or "product owner" in t:
+        return "Product Manager"
+    elif "head" in t and "produto" in t:
+        return "Head de Produto"
+    elif "service designer" in t:
+        return "Service Designer"
+    elif "ui/ux" in t or "ux/ui" in t:
+        return "UX/UI Designer"
+    elif "ui designer" in t:
+        return "UI Designer"
+    elif "ux designer" in t or "ux" in t:
+        return "UX Designer"
+    return "Product Designer"
+
+
+def eh_post_produto_antigo(texto):
+    texto_lower = texto.lower()
+    for termo in TERMOS_EXCLUIR:
+        if termo in texto_lower:
+            if not any(t in texto_lower for t in TERMOS_PRODUTO_POSTS):
+                return False
+    for termo in TERMOS_PRODUTO_POSTS:
+        if termo in texto_lower:
+            return True
+    return False
+
+
+def classificar_tipo_post_antigo(texto):
+    t = texto.lower()
+    if "product manager" in t or "product owner" in t:
+        return "Product Manager"
+    elif "ux/ui" in t or "ui/ux" in t:
+        return "UX/UI Designer"
+    elif "ux designer" in t:
+        return "UX Designer"
+    elif "ui designer" in t:
+        return "UI Designer"
+    return "Product Designer"
+
+
+def classificar_modalidade_antigo(texto):
+    t = texto.lower()
+    if "remoto" in t or "remote" in t:
+        return "remoto"
+    elif "híbrido" in t or "hibrido" in t:
+        return "hibrido"
+    elif "presencial" in t:
+        return "presencial"
+    return "nao_especificado"
+
+
+def titulos_antigo(titulos):
+    return [classificar_tipo_vaga_antigo(t) if eh_vaga_produto_antigo(t) else None for t in titulos]
+
+
+def posts_antigo(textos):
+    return [(classificar_tipo_post_antigo(t), classificar_modalidade_antigo(t)) if eh_post_produto_antigo(t) else None
+            for t in textos]
+
+
+def titulos_item(titulos):
+    return [classificar_tipo_vaga(t) if eh_vaga_produto(t) else None for t in titulos]
+
+
+def posts_item(textos):
+    return [(classificar_tipo_post(t), classificar_modalidade(t)) if eh_post_produto(t) else None for t in textos]
+
+
+def em_lotes(funcao, tamanho):
+    return lambda textos: [r for i in range(0, len(textos), tamanho) for r in funcao(textos[i:i + tamanho])]
+
+
+def medir(funcao, textos) -> tuple[list, float]:
+    classificacao.termos_encontrados.cache_clear()
+    inicio = time.perf_counter()
+    resultado = funcao(textos)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da classificação por termos")
+    parser.add_argument("--itens", type=int, default=100_000, help="Títulos e posts (cada)")
+    parser.add_argument("--lote", type=int, default=500)
+    args = parser.parse_args()
+
+    r = random.Random(42)
+    titulos = [titulo_sintetico(r, n) for n in range(args.itens)]
+    posts = [post_sintetico(r, n) for n in range(args.itens)]
+    print(f"{args.itens:,} títulos (média {sum(map(len, titulos)) / len(titulos):.0f} caracteres), "
+          f"{args.itens:,} posts (média {sum(map(len, posts)) / len(posts):.0f})")
+
+    motores = [("sem pyahocorasick", Automato(classificacao.AUTOMATO.termos, usar_ahocorasick=False))]
+    if classificacao.ahocorasick is not None:
+        motores.insert(0, ("ahocorasick", Automato(classificacao.AUTOMATO.termos)))
+    else:
+        print("(pyahocorasick não instalado)")
+
+    print(f"{'corpus':>8} {'modo':>30} {'s':>7} {'itens/s':>11} {'µs/item':>8} {'produto':>8} {'diferenças':>10}")
+    for nome, textos, antigo, item, lote in (
+        ("títulos", titulos, titulos_antigo, titulos_item, classificar_titulos),
+        ("posts", posts, posts_antigo, posts_item, classificar_posts),
+    ):
+        referencia, segundos = medir(antigo, textos)
+        linhas = [("antigo (in por termo)", referencia, segundos)]
+        for motor, automato in motores:
+            classificacao.AUTOMATO = automato
+            for modo, funcao in (("item a item", item), (f"lote de {args.lote}", em_lotes(lote, args.lote))):
+                resultado, segundos = medir(funcao, textos)
+                linhas.append((f"{motor}, {modo}", resultado, segundos))
+        for modo, resultado, segundos in linhas:
+            diferencas = sum(1 for a, b in zip(referencia, resultado) if a != b)
+            print(f"{nome:>8} {modo:>30} {segundos:>7.3f} {len(textos) / segundos:>11,.0f} "
+                  f"{segundos / len(textos) * 1e6:>8.2f} {sum(1 for x in resultado if x):>8} {diferencas:>10}")
+
+
+if __name__ == "__main__":
+    main()
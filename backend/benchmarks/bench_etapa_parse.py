@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark da etapa de parse dos posts (etapa_parse.EtapaParse): parse no próprio
+processo, entre os scrolls, x ProcessPoolExecutor com N processos.
+
+Simula a etapa do navegador (--scroll-ms por scroll, --por-scroll posts capturados
+em cada um) sobre posts sintéticos e parseia com linkedin_posts.vaga_de_post_bruto.
+Mostra o tempo total e as métricas de cada etapa (se a coleta ficou limitada pelo
+navegador ou pela CPU). Não precisa do Chrome.
+
+Uso:
+    python benchmarks/bench_etapa_parse.py --scrolls 60 --scroll-ms 300 --processos 0 2 4
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
+
+from app.scrapers.etapa_parse import EtapaParse
+from app.scrapers.linkedin_posts import vaga_de_post_bruto
+
+CARGOS = ["Product Designer", "UX Designer Sênior", "Desenvolvedor Backend", "Product Manager", "UX Researcher"]
+
+
+def post_sintetico(n: int) -> dict:
+    cargo = CARGOS[n % len(CARGOS)]
+    texto = (
+        f"Estamos contratando {cargo} para a empresa Exemplo {n}! Vaga 100% remota, CLT, "
+        f"time de produto digital. Requisitos: portfólio, experiência com pesquisa e Figma. "
+        f"{'Detalhes da vaga e benefícios. ' * 15}"
+        f"Interessados enviem CV para vagas{n}@exemplo.com.br ou se candidatem em https://lnkd.in/v{n}"
+    )
+    links = [
+        {"href": f"https://www.linkedin.com/in/autor-{n}", "texto": f"Autor {n}"},
+        {"href": f"https://lnkd.in/v{n}", "texto": f"https://lnkd.in/v{n}"},
+    ]
+    return {"texto": texto, "links": links}
+
+
+def medir(processos: int, scrolls: int, por_scroll: int, scroll_ms: float) -> tuple[float, dict]:
+    inicio = time.perf_counter()
+    etapa = EtapaParse("bench", vaga_de_post_bruto, processos=processos)
+    for i in range(scrolls):
+        time.sleep(scroll_ms / 1000)  # etapa do navegador: scroll + espera + JS_POSTS_NOVOS
+        etapa.enviar([post_sintetico(i * por_scroll + j) for j in range(por_scroll)])
+    vagas = etapa.resultados()
+    metricas = etapa.metricas()
+    metricas["vagas"] = len(vagas)
+    return time.perf_counter() - inicio, metricas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da etapa de parse dos posts")
+    parser.add_argument("--scrolls", type=int, default=60)
+    parser.add_argument("--por-scroll", type=int, default=10)
+    parser.add_argument("--scroll-ms", type=float, default=300, help="Tempo do navegador por scroll")
+    parser.add_argument("--processos", type=int, nargs="+", default=[0, 2, 4])
+    args = parser.parse_args()
+
+    print(f"{args.scrolls} scrolls x {args.por_scroll} posts, navegador {args.scroll_ms:.0f} ms/scroll "
+          f"({os.cpu_count()} CPUs)")
+    print(f"{'processos':>9} {'total s':>8} {'vagas':>6} {'captura/s':>10} {'parse/s':>9} "
+          f"{'CPU s':>7} {'espera fim':>11} {'limitado por':>13}")
+    for processos in args.processos:
+        total, m = medir(processos, args.scrolls, args.por_scroll, args.scroll_ms)
+        c, p = m["captura"], m["parse"]
+        print(f"{processos:>9} {total:>8.2f} {m['vagas']:>6} {c['itens_s'] or 0:>10.1f} {p['itens_s'] or 0:>9.0f} "
+              f"{p['segundos_cpu']:>7.2f} {p['espera_final_s']:>11.3f} {m['limitado_por']:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Benchmark da extração dos campos dos posts (app/scrapers/extracao_posts.extrair_post,
+usada por linkedin_posts.montar_vaga_post) contra a extração anterior (uma função por
+campo, cada uma com o seu lower() e as suas regexes), em posts/s sobre um corpus
+gravado.
+
+Corpus: por padrão fixtures/linkedin_posts_corpus.json (posts sintéticos no formato
+da captura, {texto, links}); com --snapshots, os posts de uma execução gravada do
+linkedin_posts em SNAPSHOTS_DIR (coleta com SNAPSHOTS=gravar); com --arquivo, outro
+JSON no mesmo formato.
+
+Confere também que as duas dão a mesma vaga para cada post. A única diferença aceita
+é a ordem dos e-mails e links (antes vinham de um set(); agora na ordem do texto):
+com mais de um candidato, email_contato e link_vaga só precisam ser um deles.
+
+Uso:
+    python benchmarks/bench_extracao_posts.py --repeticoes 50
+    python benchmarks/bench_extracao_posts.py --snapshots [execução]
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import re
+import time
+from datetime import date
+
+from app.scrapers import classificacao
+from app.scrapers.classificacao import classificar_modalidade, classificar_tipo_post, eh_post_produto
+from app.scrapers.extracao_posts import extrair_post
+from app.scrapers.linkedin_posts import separar_links, texto_do_post, vaga_de_post_bruto
+from app.scrapers.snapshots import SNAPSHOTS_DIR, ler_passos, ultima_execucao
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "linkedin_posts_corpus.json")
+
+
+# Extração anterior (uma função por campo), para comparar
+def extrair_emails_antigo(texto):
+    pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+    emails = re.findall(pattern, texto)
+    return list(set([e for e in emails if 'example' not in e.lower()]))
+
+
+def extrair_links_externos_antigo(texto):
+    pattern = r'https?://[^\s<>"{}|\\^`\[\])(\']+'
+    links = re.findall(pattern, texto)
+    resultado = []
+    for link in links:
+        link = link.rstrip('.,;:!?')
+        if 'linkedin.com' not in link.lower():
+            resultado.append(link)
+    return list(set(resultado))
+
+
+def limpar_titulo_antigo(titulo):
+    if not titulo:
+        return None
+    titulo = re.sub(r'^[:\s\-•→🔹📣🚀💼✨|]+', '', titulo)
+    titulo = re.sub(r'[:\s\-•→🔹📣🚀💼✨|]+$', '', titulo)
+    if titulo.startswith('http') or 'lnkd.in' in titulo:
+        return None
+    titulo_limpo = re.sub(r'[^\w\s]', '', titulo)
+    if len(titulo_limpo.strip()) < 5:
+        return None
+    frases_ignorar = ['link do instagram', 'vale a pena', 'passando na sua', 'ajudaria muito']
+    if any(f in titulo.lower() for f in frases_ignorar):
+        return None
+    return titulo.strip()[:100]
+
+
+def extrair_titulo_vaga_antigo(texto):
+    padroes_cargo = [
+        r'(?:vaga|oportunidade|contratando|hiring)[:\s\-]+(?:de\s+)?([A-Za-z][A-Za-z\s/\-]+(?:jr|pleno|sênior|senior|remoto)?)',
+        r'\b((?:product |ux |ui |ux/ui |ui/ux |service )?designer(?:\s+(?:jr|pleno|sênior|senior|remoto))?)\b',
+        r'\b(product (?:manager|owner)(?:\s+(?:jr|pleno|sênior|senior))?)\b',
+        r'\b(head (?:de |of )?(?:produto|product|design|ux))\b',
+        r'\b(ux research(?:er)?)\b',
+    ]
+    texto_lower = texto.lower()
+    for padrao in padroes_cargo:
+        match = re.search(padrao, texto_lower)
+        if match:
+            titulo = limpar_titulo_antigo(match.group(1).strip())
+            if titulo and len(titulo) > 5:
+                return titulo.title()
+    for linha in texto.split('\n')[:10]:
+        linha = linha.strip()
+        linha_lower = linha.lower()
+        if linha.startswith('http') or len(linha) < 8 or len(linha) > 100:
+            continue
+        if any(x in linha_lower for x in ['instagram', 'curtir', 'comentar', 'seguir']):
+            continue
+        termos_especificos = ['ux', 'ui', 'product', 'manager', 'head de', 'head of', 'sênior', 'senior', 'pleno',
+                              'júnior', 'junior', 'jr']
+        if any(t in linha_lower for t in termos_especificos) and 'designer' in linha_lower:
+            titulo = limpar_titulo_antigo(linha)
+            if titulo and len(titulo) > 8:
+                return titulo
+    tipo = classificar_tipo_post(texto)
+    modalidade = classificar_modalidade(texto)
+    if modalidade != 'nao_especificado':
+        return f"{tipo} ({modalidade.title()})"
+    return tipo
+
+
+def extrair_empresa_antigo(texto):
+    for padrao in [r'(?:@|na|at)[:\s]+([A-Z][a-zA-Z0-9\s&\-\.]{2,30})']:
+        match = re.search(padrao, texto)
+        if match:
+            return match.group(1).strip()[:50]
+    return None
+
+
+def texto_pede_contato_antigo(texto):
+    texto_lower = texto.lower()
+    frases_contato = [
+        "entre em contato", "entrar em contato", "mande mensagem", "envie mensagem",
+        "fale com", "falar com", "dm", "inbox", "chama no", "me chama",
+        "entre em contacto", "manda msg", "manda mensagem"
+    ]
+    return any(frase in texto_lower for frase in frases_contato)
+
+
+def extrair_post_antigo(texto):
+    if not eh_post_produto(texto):
+        return None
+    nome_autor = None
+    for linha in texto.split('\n')[:3]:
+        if '•' in linha:
+            nome_autor = linha.split('•')[0].strip()
+            break
+    return {
+        "titulo": extrair_titulo_vaga_antigo(texto),
+        "empresa": extrair_empresa_antigo(texto),
+        "emails": extrair_emails_antigo(texto),
+        "links": extrair_links_externos_antigo(texto),
+        "modalidade": classificar_modalidade(texto),
+        "tipo_vaga": classificar_tipo_post(texto),
+        "pede_contato": texto_pede_contato_antigo(texto),
+        "nome_autor": nome_autor,
+    }
+
+
+def vaga_de_post_antiga(post):
+    """linkedin_posts.vaga_de_post_bruto com a extração anterior."""
+    texto = post["texto"]
+    perfis, links_lnkd = separar_links(post["links"])
+    dados = extrair_post_antigo(texto)
+    if dados is None:
+        return None
+    emails, nome_autor = dados["emails"], dados["nome_autor"]
+    link_vaga = dados["links"][0] if dados["links"] else (links_lnkd.pop(0) if links_lnkd else None)
+    perfil_autor = None
+    if dados["pede_contato"] and nome_autor:
+        nome_lower = nome_autor.lower()
+        for nome_link, url_perfil in perfis.items():
+            if nome_lower in nome_link.lower() or nome_link.lower() in nome_lower:
+                perfil_autor = url_perfil
+                break
+    if link_vaga:
+        forma_contato = 'link'
+    elif emails:
+        forma_contato = 'email'
+    elif perfil_autor:
+        forma_contato = 'mensagem'
+    else:
+        return None
+    return {
+        "titulo": dados["titulo"], "empresa": dados["empresa"], "tipo_vaga": dados["tipo_vaga"],
+        "fonte": "linkedin_posts", "link_vaga": link_vaga, "localizacao": None, "modalidade": dados["modalidade"],
+        "requisito_ingles": "nao_especificado", "forma_contato": forma_contato,
+        "email_contato": emails[0] if emails else None, "perfil_autor": perfil_autor, "nome_autor": None,
+        "data_coleta": date.today().isoformat(), "texto_post": texto,
+    }
+
+
+def carregar_corpus(args) -> tuple[str, list[dict]]:
+    if args.snapshots is not None:
+        execucao = args.snapshots or ultima_execucao("linkedin_posts", args.dir)
+        posts = {}
+        for registro in ler_passos("linkedin_posts", execucao, args.dir):
+            for post in registro["dados"] or []:
+                texto = texto_do_post(post["texto"])
+                if len(texto) >= 50:
+                    posts.setdefault(texto, {"texto": texto, "links": post["links"]})
+        return f"snapshots linkedin_posts/{execucao}", list(posts.values())
+    arquivo = args.arquivo or FIXTURE
+    with open(arquivo, encoding="utf-8") as f:
+        return os.path.relpath(arquivo), json.load(f)
+
+
+def diferencas(posts: list[dict]) -> int:
+    """Posts em que a vaga (ou os campos extraídos) mudou em relação à extração anterior."""
+    total = 0
+    for post in posts:
+        antigo, novo = extrair_post_antigo(post["texto"]), extrair_post(post["texto"])
+        if (antigo is None) != (novo is None):
+            total += 1
+            continue
+        if antigo is not None:
+            for campo in ("emails", "links"):
+                antigo[campo], novo[campo] = set(antigo[campo]), set(novo[campo])
+            if antigo != novo:
+                total += 1
+                continue
+        vaga_antiga, vaga_nova = vaga_de_post_antiga(post), vaga_de_post_bruto(post)
+        if (vaga_antiga is None) != (vaga_nova is None):
+            total += 1
+            continue
+        if vaga_antiga is None:
+            continue
+        for campo, candidatos in (("email_contato", antigo["emails"]), ("link_vaga", antigo["links"])):
+            if vaga_nova[campo] in candidatos and vaga_antiga[campo] in candidatos:
+                vaga_antiga[campo] = vaga_nova[campo]
+        total += vaga_antiga != vaga_nova
+    return total
+
+
+def medir(funcao, entradas: list, repeticoes: int) -> tuple[float, int]:
+    resultado = 0
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        # Cada post é visto uma vez por coleta: o cache de termos não pode valer entre repetições
+        classificacao.termos_encontrados.cache_clear()
+        resultado = sum(1 for e in entradas if funcao(e) is not None)
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da extração dos posts")
+    parser.add_argument("--arquivo", help="JSON com [{texto, links}] (padrão: fixture)")
+    parser.add_argument("--snapshots", nargs="?", const="", help="Execução gravada do linkedin_posts (padrão: a última)")
+    parser.add_argument("--dir", default=SNAPSHOTS_DIR)
+    parser.add_argument("--repeticoes", type=int, default=50)
+    args = parser.parse_args()
+
+    origem, posts = carregar_corpus(args)
+    textos = [p["texto"] for p in posts]
+    n = len(posts) * args.repeticoes
+    print(f"{origem}: {len(posts)} posts (média {sum(map(len, textos)) / max(len(textos), 1):.0f} caracteres), "
+          f"x{args.repeticoes} = {n:,}")
+
+    print(f"{'etapa':>10} {'versão':>8} {'s':>7} {'posts/s':>10} {'µs/post':>8} {'resultado':>9}")
+    for etapa, antiga, nova, entradas in (
+        ("campos", extrair_post_antigo, extrair_post, textos),
+        ("vaga", vaga_de_post_antiga, vaga_de_post_bruto, posts),
+    ):
+        for versao, funcao in (("anterior", antiga), ("atual", nova)):
+            segundos, resultado = medir(funcao, entradas, args.repeticoes)
+            print(f"{etapa:>10} {versao:>8} {segundos:>7.3f} {n / segundos:>10,.0f} "
+                  f"{segundos / n * 1e6:>8.2f} {resultado:>9}")
+
+    print(f"diferenças: {diferencas(posts)} de {len(posts)} posts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark do filtro de vistos (app/filtro_vistos.FiltroBloom): taxa de falsos
+positivos medida, tamanho do arquivo mapeado e velocidade de inserção e consulta,
+comparados com um set() do Python com as mesmas chaves.
+
+Preenche um filtro novo (numa pasta temporária) com N links sintéticos e consulta N
+links que nunca entraram. Não usa o banco nem o arquivo real (FILTRO_VISTOS_ARQUIVO).
+
+Uso:
+    python benchmarks/bench_filtro_vistos.py --itens 1000000 --fpr 0.001
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+
+from app.filtro_vistos import FiltroBloom, dimensionar
+
+
+def chave(i: int, prefixo: str = "") -> str:
+    return f"link:https://linkedin.com/jobs/view/{prefixo}{4000000000 + i}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do filtro de vistos")
+    parser.add_argument("--itens", type=int, default=1_000_000)
+    parser.add_argument("--fpr", type=float, nargs="+", default=[0.01, 0.001])
+    parser.add_argument("--sem-set", action="store_true", help="Não mede o set() de comparação")
+    args = parser.parse_args()
+
+    n = args.itens
+    print(f"{n:,} itens")
+    print(f"{'FPR alvo':>9} {'hashes':>6} {'MB':>6} {'bytes/item':>10} {'FPR medido':>10} {'estimado':>9} "
+          f"{'inserções/s':>12} {'consultas/s':>12}")
+    with tempfile.TemporaryDirectory(prefix="filtro_vistos_") as pasta:
+        for fpr in args.fpr:
+            filtro = FiltroBloom(os.path.join(pasta, f"vistos_{fpr}.bloom"), capacidade=n, fpr=fpr)
+
+            inicio = time.perf_counter()
+            filtro.adicionar(chave(i) for i in range(n))
+            insercao = time.perf_counter() - inicio
+
+            assert all(chave(i) in filtro for i in range(0, n, 997)), "falso negativo"
+
+            inicio = time.perf_counter()
+            falsos = sum(1 for i in range(n) if chave(i, "9") in filtro)
+            consulta = time.perf_counter() - inicio
+
+            bits, hashes = dimensionar(n, fpr)
+            print(f"{fpr:>9.3%} {hashes:>6} {filtro.tamanho / 2**20:>6.2f} {filtro.tamanho / n:>10.2f} "
+                  f"{falsos / n:>10.4%} {filtro.fpr_estimado():>9.4%} {n / insercao:>12,.0f} {n / consulta:>12,.0f}")
+            filtro.fechar()
+
+    if not args.sem_set:
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        vistos = {chave(i) for i in range(n)}
+        insercao = time.perf_counter() - inicio
+        memoria = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        inicio = time.perf_counter()
+        sum(1 for i in range(n) if chave(i, "9") in vistos)
+        consulta = time.perf_counter() - inicio
+        print(f"{'set()':>9} {'-':>6} {memoria / 2**20:>6.2f} {memoria / n:>10.2f} {0:>10.4%} {'-':>9} "
+              f"{n / insercao:>12,.0f} {n / consulta:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark do coletor assíncrono do Indeed (indeed_async): páginas/s conforme a
+concorrência, contra o servidor local de bench_indeed_http (fixture salva, com
+latência simulada; não acessa o Indeed).
+
+Uso:
+    python benchmarks/bench_indeed_async.py
+    python benchmarks/bench_indeed_async.py --latencia 0.3 --concorrencias 1,4,16 --taxa 5
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import asyncio
+import time
+
+from app.scrapers.indeed_async import ColetorIndeedAsync, criar_cliente_async
+from bench_indeed_http import FIXTURE, iniciar_servidor
+
+CONSULTAS = ["UX", "UX designer", "product designer", "UI designer", "product manager"]
+
+
+async def rodar(url_base: str, paginas: int, concorrencia: int, taxa: float, rajada: int) -> tuple[int, int, float]:
+    async with criar_cliente_async(concorrencia) as cliente:
+        coletor = ColetorIndeedAsync(cliente, concorrencia, taxa, rajada)
+        inicio = time.perf_counter()
+        vagas = await coletor.coletar(CONSULTAS, paginas, url_base)
+        segundos = time.perf_counter() - inicio
+    return coletor.estatisticas["requisicoes"], len(vagas), segundos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do coletor assíncrono do Indeed")
+    parser.add_argument("--paginas", type=int, default=5, help="Páginas por busca")
+    parser.add_argument("--latencia", type=float, default=0.2, help="Latência simulada por página (s)")
+    parser.add_argument("--concorrencias", default="1,2,4,8,16")
+    parser.add_argument("--taxa", type=float, default=1000.0, help="Req/s por host (padrão: sem limite prático)")
+    parser.add_argument("--rajada", type=int, default=4)
+    args = parser.parse_args()
+
+    with open(FIXTURE, encoding="utf-8") as f:
+        html = f.read()
+    servidor = iniciar_servidor(html, args.paginas, args.latencia)
+    url_base = f"http://127.0.0.1:{servidor.server_address[1]}/empregos?q=UX&l=Brasil"
+
+    print(f"{len(CONSULTAS)} buscas x {args.paginas} páginas, latência {args.latencia}s, "
+          f"limite {args.taxa:g} req/s (rajada {args.rajada})")
+    print(f"{'concorrência':>12} {'páginas':>8} {'vagas':>6} {'segundos':>9} {'páginas/s':>10}")
+    try:
+        for concorrencia in (int(c) for c in args.concorrencias.split(",")):
+            paginas, vagas, segundos = asyncio.run(rodar(url_base, args.paginas, concorrencia, args.taxa, args.rajada))
+            print(f"{concorrencia:>12} {paginas:>8} {vagas:>6} {segundos:>9.2f} {paginas / segundos:>10.1f}")
+    finally:
+        servidor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark da coleta do Indeed por HTTP (parse de indeed_http, coleta de
+indeed_async) contra um servidor local que serve a página salva em
+fixtures/indeed_busca.html (sem acessar o Indeed).
+
+Mede o parse por página, a coleta completa de uma busca com paginação (start=0,
+10, ..., uma requisição por vez) e o pico de memória do processo. Com --selenium mede também o Chrome headless lendo as
+mesmas páginas (precisa do Chrome + chromedriver instalados).
+
+Uso:
+    python benchmarks/bench_indeed_http.py --paginas 5
+    python benchmarks/bench_indeed_http.py --paginas 5 --selenium
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import resource
+import statistics
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from app.scrapers.indeed_async import ColetorIndeedAsync, criar_cliente_async
+from app.scrapers.indeed_http import parsear_cards
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "indeed_busca.html")
+NEXT = 'data-testid="pagination-page-next"'
+
+
+def pico_memoria_mb() -> float:
+    # ru_maxrss: KB no Linux, bytes no macOS
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / 2**20 if sys.platform == "darwin" else pico / 1024
+
+
+def iniciar_servidor(html: str, paginas: int, latencia: float = 0.0) -> ThreadingHTTPServer:
+    """
+    Serve a fixture em /empregos; cada busca (q=) e página (start=) recebe ids de vaga
+    próprios. latencia simula o tempo de resposta do site.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            query = parse_qs(urlparse(self.path).query)
+            pagina = int(query.get("start", ["0"])[0]) // 10
+            busca = zlib.crc32(query.get("q", [""])[0].encode()) % 10**6
+            if latencia:
+                time.sleep(latencia)
+            corpo = html.replace("a1b2c3d4e5f6", f"{busca:06d}p{pagina:03d}")
+            if pagina >= paginas - 1:
+                corpo = corpo.replace(NEXT, 'data-testid="pagination-page-last"')
+            dados = corpo.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(dados)))
+            self.end_headers()
+            self.wfile.write(dados)
+
+        def log_message(self, *args):
+            pass
+
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor
+
+
+async def coletar_http(url_base: str, paginas: int) -> list[dict]:
+    """Uma busca, uma requisição por vez e sem limite de taxa (o servidor é local)."""
+    async with criar_cliente_async(1) as cliente:
+        coletor = ColetorIndeedAsync(cliente, concorrencia=1, req_por_segundo=1e6, rajada=1)
+        return await coletor.coletar(["UX"], paginas, url_base)
+
+
+def medir_selenium(url_base: str, paginas: int) -> tuple[float, int]:
+    """Chrome headless abrindo as mesmas páginas e lendo os cards (como indeed.py)."""
+    from selenium.webdriver.common.by import By
+    from app.scrapers.indeed import criar_driver
+
+    inicio = time.perf_counter()
+    driver = criar_driver()
+    cards = 0
+    try:
+        for pagina in range(paginas):
+            driver.get(f"{url_base}&start={pagina * 10}")
+            for card in driver.find_elements(By.CSS_SELECTOR, "div.job_seen_beacon"):
+                card.find_element(By.CSS_SELECTOR, "h2.jobTitle a").text
+                cards += 1
+    finally:
+        driver.quit()
+    return time.perf_counter() - inicio, cards
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do coletor HTTP do Indeed")
+    parser.add_argument("--paginas", type=int, default=5)
+    parser.add_argument("--repeticoes", type=int, default=200, help="Parses da fixture para medir o parse")
+    parser.add_argument("--selenium", action="store_true", help="Comparar com o Chrome headless")
+    args = parser.parse_args()
+
+    with open(FIXTURE, encoding="utf-8") as f:
+        html = f.read()
+
+    memoria_inicial = pico_memoria_mb()
+    tempos = []
+    for _ in range(args.repeticoes):
+        inicio = time.perf_counter()
+        vagas = parsear_cards(html)
+        tempos.append(time.perf_counter() - inicio)
+    print(f"Parse da fixture: {len(vagas)} vagas, mediana {statistics.median(tempos) * 1000:.2f} ms/página")
+
+    servidor = iniciar_servidor(html, args.paginas)
+    url_base = f"http://127.0.0.1:{servidor.server_address[1]}/empregos?q=UX&l=Brasil"
+    try:
+        inicio = time.perf_counter()
+        vagas = asyncio.run(coletar_http(url_base, args.paginas))
+        segundos_http = time.perf_counter() - inicio
+        print(f"HTTP: {len(vagas)} vagas em {args.paginas} páginas, {segundos_http:.3f}s, "
+              f"pico de memória do processo {pico_memoria_mb():.0f} MB (início {memoria_inicial:.0f} MB)")
+
+        if args.selenium:
+            segundos_selenium, cards = medir_selenium(url_base, args.paginas)
+            print(f"Selenium: {cards} cards em {args.paginas} páginas, {segundos_selenium:.3f}s "
+                  f"(+ memória do Chrome, fora deste processo)")
+            print(f"HTTP {segundos_selenium / segundos_http:.0f}x mais rápido")
+    finally:
+        servidor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark da inserção em lote: caminho antigo (add_all + refresh por vaga)
+contra o novo crud.create_vagas_batch (INSERT ... RETURNING).
+
+Uso:
+    python benchmarks/bench_insercao_lote.py
+    python benchmarks/bench_insercao_lote.py --tamanhos 100 1000 10000 --url postgresql://.../bench
+
+ATENÇÃO: as tabelas do banco informado em --url são recriadas a cada rodada.
+Sem --url usa um SQLite temporário.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import tempfile
+import time
+from datetime import date
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, models, schemas
+from app.database import Base
+
+
+def gerar_vagas(n: int, rodada: str) -> list[schemas.VagaCreate]:
+    return [
+        schemas.VagaCreate(
+            titulo=f"Product Designer {i}",
+            empresa=f"Empresa {i % 97}",
+            tipo_vaga="Product Designer",
+            fonte="linkedin_jobs",
+            link_vaga=f"https://www.linkedin.com/jobs/view/{rodada}{i}",
+            modalidade="remoto",
+            data_coleta=date.today(),
+        )
+        for i in range(n)
+    ]
+
+
+def caminho_antigo(db, vagas):
+    """Implementação anterior de create_vagas_batch."""
+    db_vagas = [models.Vaga(**crud._dados_vaga(vaga)) for vaga in vagas]
+    db.add_all(db_vagas)
+    db.commit()
+    for vaga in db_vagas:
+        db.refresh(vaga)
+    return [schemas.VagaResponse.model_validate(vaga) for vaga in db_vagas]
+
+
+def caminho_novo(db, vagas):
+    return crud.create_vagas_batch(db, vagas)
+
+
+def medir(engine, funcao, n: int, rodada: str) -> float:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    Sessao = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    vagas = gerar_vagas(n, rodada)
+
+    db = Sessao()
+    try:
+        inicio = time.perf_counter()
+        respostas = funcao(db, vagas)
+        duracao = time.perf_counter() - inicio
+    finally:
+        db.close()
+
+    assert len(respostas) == n, f"esperado {n}, inserido {len(respostas)}"
+    return duracao
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de inserção em lote")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--url", help="URL do banco (padrão: SQLite temporário)")
+    args = parser.parse_args()
+
+    url = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    engine = create_engine(url)
+    print(f"Banco: {engine.url.render_as_string(hide_password=True)}")
+    print(f"{'linhas':>8} {'antigo (s)':>12} {'novo (s)':>10} {'ganho':>8}")
+
+    for n in args.tamanhos:
+        antigo = medir(engine, caminho_antigo, n, "a")
+        novo = medir(engine, caminho_novo, n, "n")
+        print(f"{n:>8} {antigo:>12.3f} {novo:>10.3f} {antigo / novo:>7.1f}x")
+
+    Base.metadata.drop_all(bind=engine)
+
+
+if __name__ == "__main__":
+    main()
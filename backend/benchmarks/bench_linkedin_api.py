@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos parsers das respostas da API do LinkedIn (linkedin_api.parsear_vagas /
+parsear_posts): quantas vagas e posts saem de cada resposta, quantos campos vêm
+preenchidos e o tempo de parse.
+
+Roda offline sobre as respostas salvas: por padrão as fixtures sintéticas de
+benchmarks/fixtures (formato normalizado do Voyager); com --capturas, a pasta gravada
+por uma coleta com LINKEDIN_SALVAR_CAPTURAS (arquivos vagas_*.json e posts_*.json).
+
+Uso:
+    python benchmarks/bench_linkedin_api.py --repeticoes 2000
+    python benchmarks/bench_linkedin_api.py --capturas /tmp/capturas
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import glob
+import json
+import time
+
+from app.scrapers.linkedin_api import parsear_posts, parsear_vagas, vaga_do_post
+from app.scrapers.linkedin_jobs import filtrar_vagas_produto
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def carregar(padrao: str) -> list[dict]:
+    payloads = []
+    for arquivo in sorted(glob.glob(padrao)):
+        with open(arquivo, encoding="utf-8") as f:
+            payloads.append(json.load(f))
+    return payloads
+
+
+def preenchidos(itens: list[dict], campos: tuple[str, ...]) -> str:
+    return ", ".join(f"{c} {sum(1 for i in itens if i.get(c))}/{len(itens)}" for c in campos)
+
+
+def medir(payloads: list[dict], parsear, repeticoes: int) -> tuple[list[dict], float]:
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        itens = [item for payload in payloads for item in parsear(payload)]
+    return itens, (time.perf_counter() - inicio) / repeticoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dos parsers da API do LinkedIn")
+    parser.add_argument("--capturas", help="Pasta com vagas_*.json e posts_*.json (LINKEDIN_SALVAR_CAPTURAS)")
+    parser.add_argument("--repeticoes", type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.capturas:
+        vagas_json = carregar(os.path.join(args.capturas, "vagas_*.json"))
+        posts_json = carregar(os.path.join(args.capturas, "posts_*.json"))
+    else:
+        vagas_json = carregar(os.path.join(FIXTURES, "linkedin_vagas_voyager.json"))
+        posts_json = carregar(os.path.join(FIXTURES, "linkedin_posts_voyager.json"))
+
+    vagas, segundos = medir(vagas_json, parsear_vagas, args.repeticoes)
+    print(f"vagas: {len(vagas_json)} respostas -> {len(vagas)} vagas, "
+          f"{len(filtrar_vagas_produto(vagas))} de produto; {segundos * 1000:.3f} ms "
+          f"({len(vagas) / segundos:,.0f} vagas/s)")
+    print(f"  campos: {preenchidos(vagas, ('titulo', 'empresa', 'localizacao', 'link_vaga'))}")
+
+    posts, segundos = medir(posts_json, parsear_posts, args.repeticoes)
+    vagas_posts = [v for v in map(vaga_do_post, posts) if v]
+    print(f"posts: {len(posts_json)} respostas -> {len(posts)} posts, {len(vagas_posts)} vagas; "
+          f"{segundos * 1000:.3f} ms ({len(posts) / segundos:,.0f} posts/s)")
+    print(f"  campos: {preenchidos(posts, ('texto', 'autor', 'perfil_autor', 'links'))}")
+
+
+if __name__ == "__main__":
+    main()
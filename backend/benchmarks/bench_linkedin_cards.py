@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Benchmark da extração dos cards do LinkedIn Jobs (linkedin_jobs.scroll_e_extrair_vagas):
+extração anterior (vários comandos WebDriver por card) x JS_EXTRAIR_CARDS (um
+execute_script por passo do scroll) x o mesmo pulando as vagas já conhecidas
+(coleta incremental, --conhecidas).
+
+Roda no Chrome headless sobre uma página sintética com a mesma estrutura da lista do
+LinkedIn: 25 cards por página, só os próximos da área visível ficam renderizados
+(como a oclusão do LinkedIn) e um botão "Avançar" troca a página. Não acessa o LinkedIn.
+Precisa do Chrome + chromedriver.
+
+Uso:
+    python benchmarks/bench_linkedin_cards.py --paginas 5 --conhecidas 0.8
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import tempfile
+import time
+
+from selenium.webdriver.common.by import By
+
+from app.scrapers.indeed import criar_driver
+from app.scrapers.linkedin_jobs import scroll_e_extrair_vagas
+
+PAGINA_SINTETICA = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><style>
+  .scaffold-layout__list { height: 600px; overflow-y: auto; width: 500px; }
+  li.scaffold-layout__list-item { height: 120px; list-style: none; border-bottom: 1px solid #ddd; }
+</style></head>
+<body>
+<div class="scaffold-layout__list"><ul id="cards"></ul></div>
+<button aria-label="Avançar" id="proxima">Avançar</button>
+<script>
+const POR_PAGINA = 25, PAGINAS = %(paginas)d;
+let pagina = 0;
+const conteudo = (id) => `
+  <div class="job-card-container"><a href="/jobs/view/${id}"><strong>UX Designer ${id}</strong></a>
+  <div class="artdeco-entity-lockup__subtitle"><span>Empresa ${id %% 97}</span></div>
+  <ul class="job-card-container__metadata-wrapper"><li>Brasil (Remoto)</li></ul></div>`;
+// Oclusão: cards longe da área visível ficam vazios, como no LinkedIn
+const observador = new IntersectionObserver((entradas) => {
+  for (const e of entradas) {
+    const id = e.target.dataset.occludableJobId;
+    e.target.innerHTML = e.isIntersecting ? conteudo(id) : "";
+  }
+}, {root: document.querySelector(".scaffold-layout__list"), rootMargin: "240px 0px"});
+function renderizar() {
+  const ul = document.getElementById("cards");
+  observador.disconnect();
+  ul.innerHTML = "";
+  for (let i = 0; i < POR_PAGINA; i++) {
+    const li = document.createElement("li");
+    li.className = "scaffold-layout__list-item";
+    li.dataset.occludableJobId = String(4000000000 + pagina * POR_PAGINA + i);
+    ul.appendChild(li);
+    observador.observe(li);
+  }
+  document.getElementById("proxima").disabled = pagina >= PAGINAS - 1;
+}
+document.getElementById("proxima").onclick = () => { pagina++; renderizar(); };
+renderizar();
+</script></body></html>
+"""
+
+
+def extrair_anterior(driver, max_scrolls=200):
+    """Extração anterior a JS_EXTRAIR_CARDS (copiada de linkedin_jobs) para comparação."""
+    vagas = []
+    links_vistos = set()
+
+    try:
+        lista = driver.find_element(By.CSS_SELECTOR, "div.scaffold-layout__list")
+
+        for i in range(max_scrolls):
+            cards = driver.find_elements(By.CSS_SELECTOR, "li.scaffold-layout__list-item[data-occludable-job-id]")
+
+            for card in cards:
+                try:
+                    job_id = card.get_attribute("data-occludable-job-id")
+                    if not job_id:
+                        continue
+
+                    link_vaga = f"https://www.linkedin.com/jobs/view/{job_id}"
+                    if link_vaga in links_vistos:
+                        continue
+
+                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card)
+                    time.sleep(0.15)
+
+                    titulo = None
+                    try:
+                        titulo = card.find_element(By.CSS_SELECTOR, "a strong").text.strip()
+                    except:
+                        try:
+                            titulo = card.find_element(By.CSS_SELECTOR, "strong").text.strip()
+                        except:
+                            pass
+
+                    if not titulo:
+                        continue
+
+                    links_vistos.add(link_vaga)
+
+                    empresa = None
+                    localizacao = None
+                    try:
+                        empresa = card.find_element(By.CSS_SELECTOR, ".artdeco-entity-lockup__subtitle").text.strip()
+                    except:
+                        pass
+                    try:
+                        localizacao = card.find_element(By.CSS_SELECTOR, ".job-card-container__metadata-wrapper li").text.strip()
+                    except:
+                        try:
+                            localizacao = card.find_element(By.CSS_SELECTOR, ".artdeco-entity-lockup__caption").text.strip()
+                        except:
+                            pass
+
+                    vagas.append({"titulo": titulo, "empresa": empresa, "link_vaga": link_vaga, "localizacao": localizacao})
+                except:
+                    continue
+
+            driver.execute_script("arguments[0].scrollTop += 300", lista)
+            time.sleep(0.2)
+
+            scroll_pos = driver.execute_script("return arguments[0].scrollTop", lista)
+            scroll_height = driver.execute_script("return arguments[0].scrollHeight", lista)
+            client_height = driver.execute_script("return arguments[0].clientHeight", lista)
+
+            if scroll_pos + client_height >= scroll_height - 50:
+                time.sleep(0.5)
+                new_height = driver.execute_script("return arguments[0].scrollHeight", lista)
+                if new_height == scroll_height:
+                    break
+
+        return vagas
+    except Exception as e:
+        print(f"Erro no scroll: {e}")
+        return vagas
+
+
+def contar_comandos(driver) -> dict:
+    """Conta os comandos WebDriver (cada um é um round-trip HTTP ao chromedriver)."""
+    contador = {"comandos": 0}
+    execute = driver.execute
+
+    def execute_contado(*args, **kwargs):
+        contador["comandos"] += 1
+        return execute(*args, **kwargs)
+
+    driver.execute = execute_contado
+    return contador
+
+
+def medir(driver, url: str, paginas: int, extrair) -> tuple[float, int, int]:
+    driver.get(url)
+    contador = contar_comandos(driver)
+    inicio = time.perf_counter()
+    vagas = 0
+    for pagina in range(paginas):
+        vagas += len(extrair(driver))
+        if pagina < paginas - 1:
+            driver.execute_script("document.getElementById('proxima').click();")
+            driver.execute_script("document.querySelector('.scaffold-layout__list').scrollTop = 0")
+    segundos = time.perf_counter() - inicio
+    del driver.execute  # volta ao método original
+    return segundos, vagas, contador["comandos"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da extração dos cards do LinkedIn Jobs")
+    parser.add_argument("--paginas", type=int, default=5)
+    parser.add_argument("--conhecidas", type=float, default=0.8, help="Fração de cada página já conhecida")
+    args = parser.parse_args()
+
+    # As primeiras vagas de cada página (ids como na PAGINA_SINTETICA)
+    conhecidos = {
+        str(4000000000 + pagina * 25 + i) for pagina in range(args.paginas) for i in range(int(args.conhecidas * 25))
+    }
+    extracoes = (
+        ("anterior", extrair_anterior),
+        ("js", scroll_e_extrair_vagas),
+        ("js+incr", lambda d: scroll_e_extrair_vagas(d, conhecidos=conhecidos)),
+    )
+
+    with tempfile.NamedTemporaryFile("w", suffix=".html", delete=False, encoding="utf-8") as f:
+        f.write(PAGINA_SINTETICA % {"paginas": args.paginas})
+        url = f"file://{f.name}"
+
+    driver = criar_driver()
+    try:
+        print(f"{args.paginas} páginas x 25 cards")
+        print(f"{'extração':>10} {'vagas':>6} {'segundos':>9} {'comandos':>9} {'cmd/página':>11} {'páginas/min':>12}")
+        for nome, extrair in extracoes:
+            segundos, vagas, comandos = medir(driver, url, args.paginas, extrair)
+            print(f"{nome:>10} {vagas:>6} {segundos:>9.1f} {comandos:>9} {comandos / args.paginas:>11.0f} "
+                  f"{args.paginas / segundos * 60:>12.1f}")
+    finally:
+        driver.quit()
+        os.unlink(f.name)
+
+
+if __name__ == "__main__":
+    main()
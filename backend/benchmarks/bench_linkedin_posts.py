@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark da leitura dos posts do LinkedIn a cada scroll: modo legado (texto e links
+da página inteira) x incremental (JS_POSTS_NOVOS, só os posts novos, esvaziando os lidos).
+
+Roda no Chrome headless sobre um feed sintético que ganha --por-scroll posts a cada
+scroll (não acessa o LinkedIn). Mostra o custo da leitura em alguns scrolls e o heap
+JS da página no fim. Precisa do Chrome + chromedriver.
+
+Uso:
+    python benchmarks/bench_linkedin_posts.py --scrolls 120
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import tempfile
+import time
+
+from selenium.webdriver.common.by import By
+
+from app.scrapers.indeed import criar_driver
+from app.scrapers.linkedin_posts import JS_POSTS_NOVOS, SELETOR_POSTS
+
+FEED_SINTETICO = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head>
+<body><main id="feed"></main>
+<script>
+let n = 0;
+window.carregar = (quantidade) => {
+  const feed = document.getElementById("feed");
+  for (let i = 0; i < quantidade; i++, n++) {
+    const div = document.createElement("div");
+    div.className = "feed-shared-update-v2";
+    div.innerHTML = `<h2 class="visually-hidden">Publicação no feed</h2>
+      <a href="https://www.linkedin.com/in/autor-${n}">Autor ${n}</a> • 2º
+      <p>Estamos contratando UX Designer pleno (${n}) para produto digital, 100% remoto.
+      Envie o portfólio pelo link abaixo ou mande mensagem. ${"Detalhes da vaga. ".repeat(20)}</p>
+      <a href="https://lnkd.in/vaga${n}">https://lnkd.in/vaga${n}</a>
+      <img src="data:image/gif;base64,R0lGODlhAQABAAAAACw=" width="600" height="300">
+      <button>Gostar</button><button>Comentar</button>`;
+    feed.appendChild(div);
+  }
+};
+</script></body></html>
+"""
+
+
+def ler_legado(driver) -> int:
+    """Como _scroll_e_extrair_posts_legado: texto da página + todos os links."""
+    texto = driver.find_element(By.TAG_NAME, "body").text
+    for link in driver.find_elements(By.TAG_NAME, "a"):
+        link.get_attribute("href")
+        link.text
+    return len(texto.split("Publicação no feed")) - 1
+
+
+def heap_js(driver):
+    """JSHeapUsedSize (bytes) da página atual via CDP; None se o navegador não suportar."""
+    try:
+        driver.execute_cdp_cmd("Performance.enable", {})
+        metricas = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        return next(m["value"] for m in metricas if m["name"] == "JSHeapUsedSize")
+    except Exception:
+        return None
+
+
+def ler_incremental(driver) -> int:
+    return len(driver.execute_script(JS_POSTS_NOVOS, SELETOR_POSTS))
+
+
+def medir(driver, url: str, scrolls: int, por_scroll: int, ler, marcos: list[int]) -> tuple[dict, float]:
+    driver.get(url)
+    tempos = {}
+    for i in range(1, scrolls + 1):
+        driver.execute_script("window.carregar(arguments[0])", por_scroll)
+        inicio = time.perf_counter()
+        ler(driver)
+        if i in marcos:
+            tempos[i] = (time.perf_counter() - inicio) * 1000
+    heap = heap_js(driver)
+    return tempos, (heap or 0) / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da leitura incremental dos posts do LinkedIn")
+    parser.add_argument("--scrolls", type=int, default=120)
+    parser.add_argument("--por-scroll", type=int, default=5, help="Posts novos por scroll")
+    args = parser.parse_args()
+
+    marcos = sorted({1, 10, 25, 50, 100, args.scrolls} & set(range(1, args.scrolls + 1)))
+    with tempfile.NamedTemporaryFile("w", suffix=".html", delete=False, encoding="utf-8") as f:
+        f.write(FEED_SINTETICO)
+        url = f"file://{f.name}"
+
+    driver = criar_driver()
+    try:
+        print(f"{args.scrolls} scrolls x {args.por_scroll} posts; ms para ler os posts no scroll N")
+        print(f"{'modo':>12} " + " ".join(f"{f'#{m}':>8}" for m in marcos) + f" {'heap JS':>9}")
+        for nome, ler in (("legado", ler_legado), ("incremental", ler_incremental)):
+            tempos, heap_mb = medir(driver, url, args.scrolls, args.por_scroll, ler, marcos)
+            print(f"{nome:>12} " + " ".join(f"{tempos[m]:>8.1f}" for m in marcos) + f" {heap_mb:>7.1f}MB")
+    finally:
+        driver.quit()
+        os.unlink(f.name)
+
+
+if __name__ == "__main__":
+    main()
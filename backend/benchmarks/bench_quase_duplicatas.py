@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark da detecção de quase-duplicatas de posts (SimHash + bandas indexadas).
+
+Popula a base com posts sintéticos e mede, para cada tamanho, quanto custa checar
+um lote de ingestão (metade reposts editados de posts já gravados, metade posts novos),
+além de recall/precisão da detecção.
+
+Uso:
+    python benchmarks/bench_quase_duplicatas.py
+    python benchmarks/bench_quase_duplicatas.py --tamanhos 10000 100000 --lote 500 --distancia 8
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import date
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, models, schemas
+from app.database import Base
+
+VOCABULARIO = [f"p{i}" for i in range(5000)] + [
+    "vaga", "ux", "designer", "product", "remoto", "híbrido", "pleno", "sênior", "figma", "pesquisa",
+    "currículo", "envie", "time", "squad", "contratando", "oportunidade", "inbox", "link", "candidate-se",
+]
+
+
+def gerar_post(rnd: random.Random) -> str:
+    return " ".join(rnd.choice(VOCABULARIO) for _ in range(rnd.randint(40, 120)))
+
+
+def editar_post(rnd: random.Random, texto: str) -> str:
+    """Simula um repost: prefixo, hashtags, troca ou remoção de palavras."""
+    palavras = texto.split()
+    edicao = rnd.choice(["prefixo", "hashtags", "troca", "remove"])
+    if edicao == "prefixo":
+        palavras = ["repostando", "essa", "vaga"] + palavras
+    elif edicao == "hashtags":
+        palavras += ["#ux", "#vagas", "#design"]
+    elif edicao == "troca":
+        for _ in range(2):
+            palavras[rnd.randrange(len(palavras))] = rnd.choice(VOCABULARIO)
+    else:
+        del palavras[rnd.randrange(len(palavras))]
+    return " ".join(palavras)
+
+
+def vaga_post(texto: str) -> schemas.VagaCreate:
+    return schemas.VagaCreate(
+        titulo="Product Designer",
+        fonte="linkedin_posts",
+        data_coleta=date.today(),
+        texto_post=texto,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de quase-duplicatas")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--lote", type=int, default=500)
+    parser.add_argument("--distancia", type=int, default=crud.QUASE_DUPLICATAS_DISTANCIA)
+    args = parser.parse_args()
+
+    engine = create_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+    Base.metadata.create_all(bind=engine)
+    Sessao = sessionmaker(bind=engine)
+    rnd = random.Random(7)
+    gravados = []
+
+    print(f"{'gravados':>9} {'lote':>5} {'tempo (ms)':>11} {'ms/post':>8} {'recall':>7} {'precisão':>9}")
+    for tamanho in sorted(args.tamanhos):
+        inicio = time.perf_counter()
+        with engine.begin() as conn:
+            while len(gravados) < tamanho:
+                textos = [gerar_post(rnd) for _ in range(min(5000, tamanho - len(gravados)))]
+                conn.execute(insert(models.Vaga), [crud._dados_vaga(vaga_post(t)) for t in textos])
+                gravados.extend(textos)
+        print(f"  (base populada até {tamanho} em {time.perf_counter() - inicio:.1f}s)")
+
+        metade = args.lote // 2
+        reposts = [editar_post(rnd, rnd.choice(gravados)) for _ in range(metade)]
+        novos = [gerar_post(rnd) for _ in range(args.lote - metade)]
+        linhas = [crud._dados_vaga(vaga_post(t)) for t in reposts + novos]
+        esperado = [True] * metade + [False] * len(novos)
+
+        with Sessao() as db:
+            inicio = time.perf_counter()
+            crud._resolver_quase_duplicatas(db, linhas, limiar=args.distancia, modo="vincular")
+            duracao = (time.perf_counter() - inicio) * 1000
+
+        # em modo 'vincular' a linha recebe vaga_canonica_id quando casou com uma vaga gravada
+        detectado = [linha["vaga_canonica_id"] is not None for linha in linhas]
+        verdadeiros = sum(d and e for d, e in zip(detectado, esperado))
+        recall = verdadeiros / metade
+        precisao = verdadeiros / max(1, sum(detectado))
+        print(f"{tamanho:>9} {args.lote:>5} {duracao:>11.1f} {duracao / args.lote:>8.2f} {recall:>7.1%} {precisao:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
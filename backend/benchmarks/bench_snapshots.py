@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark da extração sobre snapshots gravados (app/scrapers/snapshots.py), sem
+navegador: reproduz as execuções gravadas de cada fonte e mede passos/s e vagas.
+
+Por padrão usa as gravações de SNAPSHOTS_DIR (coleta com SNAPSHOTS=gravar). Com
+--sintetico N grava antes, numa pasta temporária, execuções sintéticas de N passos
+(DriverGravador sobre um driver falso com cards e posts gerados; o Indeed repete a
+fixture indeed_busca.html), o que também exercita a gravação.
+
+Uso:
+    python benchmarks/bench_snapshots.py
+    python benchmarks/bench_snapshots.py --sintetico 200
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import glob
+import tempfile
+import time
+
+from app.scrapers.indeed import URL_BUSCA
+from app.scrapers.indeed_async import url_consulta
+from app.scrapers.linkedin_jobs import JS_EXTRAIR_CARDS, scroll_e_extrair_vagas
+from app.scrapers.linkedin_posts import JS_POSTS_NOVOS, scroll_e_extrair_posts
+from app.scrapers.snapshots import DriverGravador, GravadorSnapshots, execucoes, reproduzir, SNAPSHOTS_DIR
+
+FONTES = ("indeed", "linkedin_jobs", "linkedin_posts")
+FIXTURE_INDEED = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "indeed_busca.html")
+
+TITULOS = ["Product Designer", "UX Designer Sênior", "Desenvolvedor Backend", "Product Manager", "Analista de Dados"]
+
+
+class DriverSintetico:
+    """Driver falso: lista de vagas com `passos` passos de 7 cards e feed com 5 posts por scroll."""
+
+    def __init__(self, passos: int):
+        self.passos = passos
+        self.chamadas = 0
+        self.current_url = "https://www.linkedin.com/sintetico"
+
+    @property
+    def page_source(self) -> str:
+        return "<html><body>" + "<li class='scaffold-layout__list-item'>card</li>" * 25 + "</body></html>"
+
+    def find_element(self, by, seletor):
+        return None
+
+    def execute_script(self, script, *args):
+        if script == JS_EXTRAIR_CARDS:
+            n = self.chamadas
+            self.chamadas += 1
+            cards = [
+                {"job_id": str(4000000000 + n * 7 + i), "titulo": f"{TITULOS[(n + i) % len(TITULOS)]} {n}-{i}",
+                 "empresa": f"Empresa {i}", "localizacao": "Brasil (Remoto)"}
+                for i in range(7)
+            ]
+            return {"cards": cards, "pendentes": False, "pendente_id": None,
+                    "topo": n * 300, "altura": self.passos * 300 + 600, "visivel": 600}
+        if script == JS_POSTS_NOVOS:
+            n = self.chamadas
+            self.chamadas += 1
+            if n >= self.passos:
+                return []
+            return [
+                {"texto": f"Autor {n}-{i} • 2º\nPublicação no feed\nEstamos contratando {TITULOS[(n + i) % len(TITULOS)]} "
+                          f"para produto digital, 100% remoto. Candidaturas: https://lnkd.in/v{n}x{i}\nGostar",
+                 "links": [{"href": f"https://www.linkedin.com/in/autor-{n}-{i}", "texto": f"Autor {n}-{i}"},
+                           {"href": f"https://lnkd.in/v{n}x{i}", "texto": f"https://lnkd.in/v{n}x{i}"}]}
+                for i in range(5)
+            ]
+        # Esperas: altura constante (fim da lista) e posts novos sempre presentes
+        return 5
+
+
+def gravar_sinteticos(diretorio: str, passos: int):
+    with open(FIXTURE_INDEED, encoding="utf-8") as f:
+        html = f.read()
+    gravador = GravadorSnapshots("indeed", "sintetico", diretorio)
+    for pagina in range(passos):
+        gravador.pagina(url_consulta("UX", pagina, URL_BUSCA), html)
+
+    driver = DriverGravador(DriverSintetico(passos), GravadorSnapshots("linkedin_jobs", "sintetico", diretorio),
+                            passos=(JS_EXTRAIR_CARDS,))
+    scroll_e_extrair_vagas(driver, max_scrolls=passos)
+    driver.encerrar_gravacao()
+
+    driver = DriverGravador(DriverSintetico(passos), GravadorSnapshots("linkedin_posts", "sintetico", diretorio),
+                            passos=(JS_POSTS_NOVOS,))
+    scroll_e_extrair_posts(driver, max_scrolls=passos + 3, incremental=True, filtrar_vistos=False)
+    driver.encerrar_gravacao()
+
+
+def tamanho_mb(pasta: str) -> float:
+    return sum(os.path.getsize(a) for a in glob.glob(os.path.join(pasta, "*.json.gz"))) / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da extração sobre snapshots gravados")
+    parser.add_argument("--dir", default=SNAPSHOTS_DIR)
+    parser.add_argument("--sintetico", type=int, help="Grava execuções sintéticas de N passos numa pasta temporária")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+
+    diretorio = args.dir
+    if args.sintetico:
+        diretorio = tempfile.mkdtemp(prefix="snapshots_")
+        saida = sys.stdout
+        sys.stdout = open(os.devnull, "w")  # os extratores imprimem cada vaga
+        try:
+            gravar_sinteticos(diretorio, args.sintetico)
+        finally:
+            sys.stdout.close()
+            sys.stdout = saida
+
+    print(f"{'fonte':>15} {'execução':>22} {'passos':>7} {'MB':>6} {'vagas':>6} {'ms':>8} {'passos/s':>9}")
+    for fonte in FONTES:
+        for execucao in execucoes(fonte, diretorio):
+            pasta = os.path.join(diretorio, fonte, execucao)
+            passos = len(glob.glob(os.path.join(pasta, "*.json.gz")))
+            melhor = None
+            saida = sys.stdout
+            sys.stdout = open(os.devnull, "w")
+            try:
+                for _ in range(args.repeticoes):
+                    inicio = time.perf_counter()
+                    vagas = reproduzir(fonte, execucao, diretorio)
+                    segundos = time.perf_counter() - inicio
+                    melhor = segundos if melhor is None else min(melhor, segundos)
+            finally:
+                sys.stdout.close()
+                sys.stdout = saida
+            print(f"{fonte:>15} {execucao:>22} {passos:>7} {tamanho_mb(pasta):>6.2f} {len(vagas):>6} "
+                  f"{melhor * 1000:>8.1f} {passos / melhor:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
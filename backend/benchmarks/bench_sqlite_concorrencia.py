@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark de leituras do dashboard durante uma ingestão em massa no SQLite.
+
+Compara dois perfis no mesmo cenário (um processo inserindo lotes como o coletar_tudo.py,
+várias threads lendo listagem + stats como a API do dashboard):
+- padrão: journal DELETE, sem pragmas, um único engine para tudo (como era);
+- perfil: WAL + PRAGMAS_SQLITE, conexão de escrita única e pool de leitura (database.py).
+
+Uso:
+    python benchmarks/bench_sqlite_concorrencia.py
+    python benchmarks/bench_sqlite_concorrencia.py --ingestao 100000 --leitores 8
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import multiprocessing
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, models, schemas
+from app.database import Base, criar_engines
+from app.migrations import aplicar_migracoes
+
+
+def vagas_sinteticas(inicio: int, quantidade: int) -> list[dict]:
+    hoje = date.today()
+    return [
+        {
+            "titulo": ["Product Designer", "UX Designer", "UX Researcher"][i % 3],
+            "empresa": f"Empresa {i % 1500}",
+            "fonte": ["indeed", "linkedin_jobs", "linkedin_posts"][i % 3],
+            "link_vaga": f"https://www.linkedin.com/jobs/view/{i}",
+            "data_coleta": hoje - timedelta(days=i % 60),
+        }
+        for i in range(inicio, inicio + quantidade)
+    ]
+
+
+def criar_perfil(nome: str, url: str):
+    """(escrita, leitura) do perfil: 'padrão' é um engine sem pragmas, 'perfil' o de database.py."""
+    if nome == "perfil":
+        return criar_engines(url)
+    unico = create_engine(url, connect_args={"check_same_thread": False})
+    return unico, unico
+
+
+def ingerir(nome: str, url: str, args, duracao):
+    """Processo de ingestão (como a coleta rodando em paralelo à API)."""
+    escrita, _ = criar_perfil(nome, url)
+    inicio = time.perf_counter()
+    with sessionmaker(bind=escrita)() as db:
+        for base in range(args.base, args.base + args.ingestao, args.lote):
+            lote = [schemas.VagaCreate(**v) for v in vagas_sinteticas(base, args.lote)]
+            crud.inserir_vagas_ignorando_duplicatas(db, lote)
+    duracao.value = time.perf_counter() - inicio
+
+
+def cenario(nome: str, args) -> dict:
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    escrita, leitura = criar_perfil(nome, url)
+    Base.metadata.create_all(bind=escrita)
+    aplicar_migracoes(escrita)
+    with escrita.begin() as conn:
+        conn.execute(insert(models.Vaga), vagas_sinteticas(0, args.base))
+    with sessionmaker(bind=escrita)() as db:
+        crud.reconstruir_stats(db)
+
+    SessaoLeitura = sessionmaker(bind=leitura)
+    latencias, erros = [], []
+    duracao = multiprocessing.Value("d", 0.0)
+    processo = multiprocessing.Process(target=ingerir, args=(nome, url, args, duracao))
+
+    def ler():
+        with SessaoLeitura() as db:
+            while processo.is_alive():
+                inicio = time.perf_counter()
+                try:
+                    crud.get_vagas(db, limit=50)
+                    crud.get_stats(db)
+                    latencias.append((time.perf_counter() - inicio) * 1000)
+                except OperationalError as e:
+                    erros.append(str(e.orig))
+                finally:
+                    db.rollback()  # encerra a transação de leitura (libera o snapshot)
+
+    processo.start()
+    leitores = [threading.Thread(target=ler) for _ in range(args.leitores)]
+    for thread in leitores:
+        thread.start()
+    for thread in leitores:
+        thread.join()
+    processo.join()
+
+    return {
+        "ingestao_s": duracao.value,
+        "leituras": len(latencias),
+        "p50": statistics.median(latencias) if latencias else float("nan"),
+        "p99": statistics.quantiles(latencias, n=100)[-1] if len(latencias) > 1 else float("nan"),
+        "maximo": max(latencias, default=float("nan")),
+        "erros": len(erros),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Leituras concorrentes durante ingestão no SQLite")
+    parser.add_argument("--base", type=int, default=20000, help="vagas já existentes")
+    parser.add_argument("--ingestao", type=int, default=50000, help="vagas inseridas durante o teste")
+    parser.add_argument("--lote", type=int, default=500)
+    parser.add_argument("--leitores", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{'perfil':<7} {'ingestão (s)':>12} {'leituras':>9} {'p50 (ms)':>9} {'p99 (ms)':>9} {'máx (ms)':>9} {'erros':>6}")
+    for nome in ("padrão", "perfil"):
+        r = cenario(nome, args)
+        print(f"{nome:<7} {r['ingestao_s']:>12.1f} {r['leituras']:>9} {r['p50']:>9.1f} {r['p99']:>9.1f} "
+              f"{r['maximo']:>9.1f} {r['erros']:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Teste de carga local: rotas do dashboard síncronas (threadpool) x assíncronas.
+
+Sobe a API em processo (httpx + ASGITransport, sem rede) e dispara tráfego concorrente
+de dashboard — listagem com total, listagem filtrada e stats — contra:
+- as rotas reais (async, AsyncSession);
+- cópias síncronas das mesmas rotas (def + Session, como eram antes), em /sync.
+
+Uso:
+    python benchmarks/carga_api.py
+    python benchmarks/carga_api.py --concorrencia 50 200 --duracao 10 --linhas 50000
+    python benchmarks/carga_api.py --url postgresql://.../bench
+
+ATENÇÃO: as tabelas do banco informado em --url são recriadas.
+Sem --url usa um SQLite temporário.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Optional
+
+parser = argparse.ArgumentParser(description="Teste de carga das rotas do dashboard")
+parser.add_argument("--concorrencia", type=int, nargs="+", default=[10, 50, 200])
+parser.add_argument("--duracao", type=float, default=5.0, help="segundos por cenário")
+parser.add_argument("--linhas", type=int, default=20000)
+parser.add_argument("--url", help="URL do banco (padrão: SQLite temporário)")
+args = parser.parse_args()
+
+# O engine é criado na importação de app.database, então a URL precisa vir antes
+os.environ["DATABASE_URL"] = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'carga.db')}"
+
+import httpx
+from fastapi import APIRouter, Depends
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app import crud, models, schemas
+from app.database import Base, SessionLocal, engine, get_db_leitura
+from app.migrations import aplicar_migracoes
+
+# Rotas síncronas equivalentes às async, para comparação
+sync_router = APIRouter(prefix="/sync/api")
+
+
+@sync_router.get("/vagas/", response_model=schemas.VagaListResponse)
+def listar_vagas_sync(
+    limit: int = 100,
+    fonte: Optional[str] = None,
+    include_total: bool = True,
+    db: Session = Depends(get_db_leitura),
+):
+    vagas, total, next_cursor = crud.get_vagas(db, limit=limit, fonte=fonte, include_total=include_total)
+    return {"total": total, "vagas": vagas, "next_cursor": next_cursor}
+
+
+@sync_router.get("/stats/", response_model=schemas.StatsResponse)
+def obter_estatisticas_sync(db: Session = Depends(get_db_leitura)):
+    return crud.get_stats(db)
+
+
+def popular(linhas: int, lote: int = 10000):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    aplicar_migracoes(engine)
+
+    rnd = random.Random(42)
+    hoje = date.today()
+    with engine.begin() as conn:
+        for base in range(0, linhas, lote):
+            conn.execute(insert(models.Vaga), [
+                {
+                    "titulo": rnd.choice(["Product Designer", "UX Designer", "UX Researcher", "Product Manager"]),
+                    "empresa": f"Empresa {rnd.randrange(2000)}",
+                    "fonte": rnd.choice(["indeed", "linkedin_jobs", "linkedin_posts"]),
+                    "link_vaga": f"https://www.linkedin.com/jobs/view/{base + i}",
+                    "data_coleta": hoje - timedelta(days=rnd.randrange(60)),
+                }
+                for i in range(min(lote, linhas - base))
+            ])
+    with SessionLocal() as db:
+        crud.reconstruir_stats(db)
+
+
+def caminhos(prefixo: str) -> list[str]:
+    """Mistura de requisições de uma carga do dashboard."""
+    return [
+        f"{prefixo}/api/vagas/?limit=100",
+        f"{prefixo}/api/vagas/?limit=100",
+        f"{prefixo}/api/vagas/?limit=50&fonte=indeed&include_total=false",
+        f"{prefixo}/api/stats/",
+    ]
+
+
+async def cenario(app, prefixo: str, concorrencia: int, duracao: float) -> tuple[float, list[float], int]:
+    mistura = caminhos(prefixo)
+    latencias, erros = [], 0
+    fim = time.perf_counter() + duracao
+
+    async def cliente(client: httpx.AsyncClient, indice: int):
+        nonlocal erros
+        i = indice
+        while time.perf_counter() < fim:
+            inicio = time.perf_counter()
+            resposta = await client.get(mistura[i % len(mistura)])
+            latencias.append((time.perf_counter() - inicio) * 1000)
+            erros += resposta.status_code != 200
+            i += 1
+
+    # Erros da aplicação (ex.: timeout do pool de conexões) viram 500 e são contados
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://carga") as client:
+        inicio = time.perf_counter()
+        await asyncio.gather(*(cliente(client, i) for i in range(concorrencia)))
+        decorrido = time.perf_counter() - inicio
+    return len(latencias) / decorrido, latencias, erros
+
+
+async def executar():
+    from app.database import async_engine
+    from app.main import app
+
+    app.include_router(sync_router)
+
+    print(f"{'rotas':<6} {'conc.':>5} {'req/s':>8} {'p50 (ms)':>9} {'p99 (ms)':>9} {'erros':>6}")
+    for concorrencia in args.concorrencia:
+        for nome, prefixo in (("sync", "/sync"), ("async", "")):
+            await cenario(app, prefixo, concorrencia, min(1.0, args.duracao))  # aquecimento
+            vazao, latencias, erros = await cenario(app, prefixo, concorrencia, args.duracao)
+            p99 = statistics.quantiles(latencias, n=100)[-1]
+            print(f"{nome:<6} {concorrencia:>5} {vazao:>8.0f} {statistics.median(latencias):>9.1f} {p99:>9.1f} {erros:>6}")
+    await async_engine.dispose()
+
+
+def main():
+    print(f"Banco: {engine.url.render_as_string(hide_password=True)}")
+    popular(args.linhas)
+    asyncio.run(executar())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+"""
+Configuração do gunicorn (lida automaticamente do diretório backend).
+
+As migrações rodam uma vez no processo mestre, antes de criar os workers; os workers
+não migram de novo (MIGRAR_NA_INICIALIZACAO=0), então não disputam o DDL entre si.
+"""
+import os
+
+
+def on_starting(server):
+    from app.database import engine
+    from app.migrations import aplicar_migracoes
+
+    aplicar_migracoes(engine)
+    # Os workers não podem herdar as conexões abertas no mestre
+    engine.dispose()
+    # Herdado pelos workers (criados depois, por fork)
+    os.environ["MIGRAR_NA_INICIALIZACAO"] = "0"
@@ -0,0 +1,21 @@
+"""A coleta incremental do LinkedIn só para de paginar numa lista por data."""
+from app.scrapers.linkedin_jobs import fim_da_coleta_incremental, url_vagas
+
+
+def test_busca_incremental_por_data():
+    assert "sortBy=DD" in url_vagas(incremental=True)
+    assert "sortBy=R" in url_vagas(incremental=False)
+
+
+def test_para_na_pagina_conhecida_da_lista_por_data():
+    url = url_vagas(incremental=True)
+    assert fim_da_coleta_incremental(url, 1.0, limite=1.0)
+    assert fim_da_coleta_incremental(url, 0.8, limite=0.8)
+    assert not fim_da_coleta_incremental(url, 0.5, limite=0.8)
+
+
+def test_nao_para_na_lista_por_relevancia():
+    # Por relevância uma vaga nova pode vir depois de uma página só de conhecidas
+    url = url_vagas(incremental=False)
+    assert not fim_da_coleta_incremental(url, 1.0, limite=1.0)
+    assert not fim_da_coleta_incremental(f"{url}&start=25", 1.0, limite=0.5)
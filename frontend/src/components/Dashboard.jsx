@@ -1,8 +1,16 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { vagasService, statsService, scraperService } from '../services/api';
 import VagaCard from './VagaCard';
 import Filtros from './Filtros';
 
+// Acompanhamento do job de coleta: intervalo entre consultas, quanto esperar o job sair
+// da fila (sem worker rodando ele nunca sai) e quanto esperar no total
+const INTERVALO_JOB_MS = 3000;
+const ESPERA_FILA_MS = 60 * 1000;
+const ESPERA_TOTAL_MS = 30 * 60 * 1000;
+
+const emAndamento = (job) => job.status === 'pendente' || job.status === 'executando';
+
 export default function Dashboard() {
   const [vagas, setVagas] = useState([]);
   const [stats, setStats] = useState(null);
@@ -10,6 +18,15 @@ export default function Dashboard() {
   const [loading, setLoading] = useState(true);
   const [coletando, setColetando] = useState(false);
   const [mensagem, setMensagem] = useState(null);
+  // false depois de desmontar: o acompanhamento do job para
+  const montado = useRef(true);
+
+  useEffect(() => {
+    montado.current = true;
+    return () => {
+      montado.current = false;
+    };
+  }, []);
 
   const carregarVagas = async () => {
     try {
@@ -32,17 +49,44 @@ export default function Dashboard() {
       setColetando(true);
       setMensagem({ tipo: 'info', texto: 'Coletando vagas... Isso pode levar alguns minutos.' });
       const res = await scraperService.coletarTudo();
-      const novas = res.data.total_novas || 0;
+
+      // A coleta roda no worker; acompanha o job até terminar (ou até desistir de esperar)
+      const inicio = Date.now();
+      let job;
+      do {
+        await new Promise((resolve) => setTimeout(resolve, INTERVALO_JOB_MS));
+        if (!montado.current) return;
+        job = (await scraperService.obterJob(res.data.job_id)).data;
+        if (!montado.current) return;
+        const decorrido = Date.now() - inicio;
+        if ((job.status === 'pendente' && decorrido > ESPERA_FILA_MS) || decorrido > ESPERA_TOTAL_MS) break;
+      } while (emAndamento(job));
+
+      if (emAndamento(job)) {
+        setMensagem({
+          tipo: job.status === 'pendente' ? 'erro' : 'info',
+          texto: job.status === 'pendente'
+            ? 'A coleta ainda está na fila — o worker está rodando?'
+            : 'A coleta ainda está em andamento; as vagas novas aparecem quando ela terminar.'
+        });
+        return;
+      }
+
+      const novas = Object.values(job.progresso).reduce((soma, fonte) => soma + fonte.novas, 0);
       setMensagem({
-        tipo: 'sucesso',
-        texto: novas > 0 ? `${novas} novas vagas encontradas!` : 'Nenhuma vaga nova encontrada.'
+        tipo: job.status === 'erro' ? 'erro' : 'sucesso',
+        texto: job.status === 'erro'
+          ? 'Erro ao coletar vagas.'
+          : novas > 0 ? `${novas} novas vagas encontradas!` : 'Nenhuma vaga nova encontrada.'
       });
       carregarVagas();
     } catch (error) {
-      setMensagem({ tipo: 'erro', texto: 'Erro ao coletar vagas.' });
+      if (montado.current) setMensagem({ tipo: 'erro', texto: 'Erro ao coletar vagas.' });
     } finally {
-      setColetando(false);
-      setTimeout(() => setMensagem(null), 5000);
+      if (montado.current) {
+        setColetando(false);
+        setTimeout(() => montado.current && setMensagem(null), 5000);
+      }
     }
   };
 
@@ -22,6 +22,7 @@ export const scraperService = {
   coletarIndeed: () => api.post('/scraper/indeed'),
   coletarLinkedin: () => api.post('/scraper/linkedin'),
   coletarPosts: () => api.post('/scraper/posts'),
+  obterJob: (id) => api.get(`/scraper/jobs/${id}`),
 };
 
 export default api;